@@ -0,0 +1,369 @@
+"""
+Benchmark of the service layer against a throwaway local PostgreSQL database.
+
+Creates a temporary database on the configured server (DB_HOST, DB_USER, ...),
+applies the migrations and, for each data size, seeds it with synthetic data
+(see database.synthetic) and times the generic BaseService operations, the
+custom queries of the services and the bulk import pipeline. The query cache
+is cleared before every run, so reads always hit the database. The database is
+dropped at the end.
+
+Results are written as JSON, to be compared between commits with
+benchmarks.compare.
+
+Usage:
+    python -m benchmarks.bench_services [--sizes 10,100] [--repeat 5] [--output results.json]
+"""
+import argparse
+import io
+import json
+import logging
+import os
+import platform
+import random
+import statistics
+import subprocess
+import time
+from datetime import date, datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional
+import pandas as pd
+import psycopg2
+from psycopg2 import sql
+from config.database import DB_CONFIG
+from database.connection import get_db_connection, close_connection_pool, dispose_db_engines
+from database.migrations.runner import run_migrations
+from database.synthetic import generate
+from sections.revenues.service import RevenueService
+from sections.revenues.form import revenue_form
+from sections.car_expenses.service import CarExpenseService
+from sections.hr_expenses.service import HRExpenseService
+from sections.ga_expenses.service import GAExpenseService
+from utils.bulk_import import process_frame, stream_import
+from utils.entity_import import compile_validation_plan
+from utils.import_resolution import ForeignKeyResolver
+from utils.query_cache import get_query_cache
+
+# Start of the rows written by the benchmark, after any generated period
+BENCH_START = date(2040, 1, 2)
+
+# File columns of the benchmarked revenue import
+IMPORT_MAPPING = {
+    'start_date': "Data Início",
+    'end_date': "Data Fim",
+    'platform': "Plataforma",
+    'driver_id': "Motorista",
+    'car_id': "Matrícula",
+    'gross_revenue': "Receita Bruta",
+    'commission_percentage': "Comissão",
+    'tip': "Gorjeta",
+    'num_travels': "Viagens",
+    'num_kilometers': "Quilómetros",
+}
+
+
+def _measure(
+    func: Callable,
+    repeat: int,
+    setup: Optional[Callable[[], tuple]] = None,
+    teardown: Optional[Callable[[Any], None]] = None
+) -> Dict[str, float]:
+    """
+    Time a function, clearing the query cache before every run.
+
+    Args:
+        func: Function to time, called with the arguments returned by setup
+        repeat: Number of runs
+        setup: Optional function run before each run (not timed), returning the arguments of func
+        teardown: Optional function run after each run (not timed), receiving the result of func
+
+    Returns:
+        Dictionary with the number of runs and the min, median, mean and max time in milliseconds
+    """
+    timings = []
+    for _ in range(repeat):
+        args = setup() if setup else ()
+        cache = get_query_cache()
+        if cache is not None:
+            cache.clear()
+
+        start = time.perf_counter()
+        result = func(*args)
+        timings.append((time.perf_counter() - start) * 1000)
+
+        if teardown:
+            teardown(result)
+
+    return {
+        'runs': repeat,
+        'min_ms': round(min(timings), 3),
+        'median_ms': round(statistics.median(timings), 3),
+        'mean_ms': round(statistics.mean(timings), 3),
+        'max_ms': round(max(timings), 3),
+    }
+
+
+def _query(query: str, params: Any = None) -> List[tuple]:
+    """Run a query on the benchmark database and return its rows."""
+    with get_db_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(query, params)
+            rows = cur.fetchall() if cur.description else []
+        conn.commit()
+    return rows
+
+
+def _delete_benchmark_rows() -> None:
+    """Delete the rows written by the benchmark runs (see BENCH_START)."""
+    for service_class in (RevenueService, GAExpenseService):
+        _query(f"DELETE FROM {service_class.table_name} WHERE start_date >= %s", (BENCH_START,))
+        service_class._invalidate_cache()
+
+
+def _ga_records(count: int, rng: random.Random) -> List[Dict[str, Any]]:
+    """Build G&A expense records dated after the generated period."""
+    return [
+        {
+            'expense_type': "Outros",
+            'start_date': (BENCH_START + timedelta(days=i)).isoformat(),
+            'amount': round(rng.uniform(10, 1000), 2),
+            'vat': 23.0,
+            'description': f"Benchmark {i}",
+        }
+        for i in range(count)
+    ]
+
+
+def _import_file(rows: int, rng: random.Random) -> pd.DataFrame:
+    """Build a revenue file as uploaded by users: drivers by name, cars by plate."""
+    drivers = [row[0] for row in _query("SELECT display_name FROM drivers")]
+    plates = [row[0] for row in _query("SELECT license_plate FROM cars")]
+    starts = [BENCH_START + timedelta(weeks=i % 520) for i in range(rows)]
+    return pd.DataFrame({
+        "Data Início": [start.isoformat() for start in starts],
+        "Data Fim": [(start + timedelta(days=6)).isoformat() for start in starts],
+        "Plataforma": [rng.choice(["Uber", "Bolt", "Transfer"]) for _ in range(rows)],
+        "Motorista": [rng.choice(drivers) for _ in range(rows)],
+        "Matrícula": [rng.choice(plates) for _ in range(rows)],
+        "Receita Bruta": [round(rng.uniform(100, 1500), 2) for _ in range(rows)],
+        "Comissão": [rng.choice([10, 20, 25]) for _ in range(rows)],
+        "Gorjeta": [round(rng.uniform(0, 30), 2) for _ in range(rows)],
+        "Viagens": [rng.randint(5, 120) for _ in range(rows)],
+        "Quilómetros": [round(rng.uniform(20, 1500), 1) for _ in range(rows)],
+    })
+
+
+def run_size(drivers: int, years: int, repeat: int, batch_rows: int, import_rows: int, seed: int = 42) -> Dict[str, Any]:
+    """
+    Seed the benchmark database with one data size and time every case.
+
+    Args:
+        drivers: Number of drivers (cars are three times as many)
+        years: Years of revenue and expenses
+        repeat: Number of runs of each case
+        batch_rows: Records per insert_many and delete_many call
+        import_rows: Rows of the benchmarked import file
+        seed: Random seed of the data and of the chosen records
+
+    Returns:
+        Dictionary with the rows per table, the seeding time and the timings of each case
+    """
+    start = time.perf_counter()
+    rows = generate(drivers=drivers, cars=drivers * 3, years=years, seed=seed, end=date(2026, 1, 4), truncate=True)
+    seed_seconds = time.perf_counter() - start
+
+    rng = random.Random(seed)
+    revenue_ids = [row[0] for row in _query("SELECT id FROM revenue")]
+    ga_ids = [row[0] for row in _query("SELECT id FROM ga_expenses")]
+    driver_ids = [row[0] for row in _query("SELECT id FROM drivers")]
+    last_year = date(2025, 1, 1), date(2025, 12, 31)
+
+    results = {}
+    results['BaseService.insert'] = _measure(
+        lambda record: GAExpenseService.insert(record), repeat,
+        setup=lambda: (_ga_records(1, rng)[0],),
+    )
+    results['BaseService.insert_many'] = _measure(
+        lambda records: GAExpenseService.insert_many(records), repeat,
+        setup=lambda: (_ga_records(batch_rows, rng),),
+        teardown=GAExpenseService.delete_many,
+    )
+    results['BaseService.get'] = _measure(
+        lambda record_id: GAExpenseService.get(record_id), repeat,
+        setup=lambda: (rng.choice(ga_ids),),
+    )
+    results['BaseService.get_many'] = _measure(lambda: GAExpenseService.get_many(), repeat)
+    results['BaseService.update'] = _measure(
+        lambda record_id: GAExpenseService.update(record_id, {'amount': round(rng.uniform(10, 1000), 2)}), repeat,
+        setup=lambda: (rng.choice(ga_ids),),
+    )
+    results['BaseService.delete_many'] = _measure(
+        GAExpenseService.delete_many, repeat,
+        setup=lambda: (GAExpenseService.insert_many(_ga_records(batch_rows, rng)),),
+    )
+
+    results['RevenueService.get'] = _measure(
+        lambda record_id: RevenueService.get(record_id), repeat,
+        setup=lambda: (rng.choice(revenue_ids),),
+    )
+    results['RevenueService.get_many'] = _measure(lambda: RevenueService.get_many(), repeat)
+    results['RevenueService.get_many[driver_id]'] = _measure(
+        lambda driver_id: RevenueService.get_many(conditions={'driver_id': driver_id}), repeat,
+        setup=lambda: (rng.choice(driver_ids),),
+    )
+    results['CarExpenseService.get_summary_by_car'] = _measure(
+        lambda: CarExpenseService.get_summary_by_car(*(day.isoformat() for day in last_year)), repeat,
+    )
+    results['CarExpenseService.get_monthly_summary'] = _measure(
+        lambda: CarExpenseService.get_monthly_summary(last_year[0].year), repeat,
+    )
+    results['GAExpenseService.get_summary'] = _measure(
+        lambda: GAExpenseService.get_summary(*(day.isoformat() for day in last_year)), repeat,
+    )
+    results['HRExpenseService.get_many'] = _measure(lambda: HRExpenseService.get_many(), repeat)
+
+    # Bulk import of a revenue file: validation and resolution, load, and the whole streamed pipeline
+    fields_config = revenue_form().get_field_configs()
+    plan = compile_validation_plan(fields_config)
+    frame = _import_file(import_rows, rng)
+    csv_content = frame.to_csv(index=False).encode("utf-8")
+    valid_records, errors = process_frame(frame, IMPORT_MAPPING, fields_config, plan, ForeignKeyResolver())
+    if not errors.empty:
+        raise ValueError(f"O ficheiro do benchmark tem {errors['row'].nunique()} linhas inválidas")
+
+    def import_stream():
+        summary = stream_import(io.BytesIO(csv_content), IMPORT_MAPPING, fields_config, RevenueService.bulk_load)
+        if summary['failure'] or summary['imported_rows'] != import_rows:
+            raise ValueError(f"Importação do benchmark falhou: {summary['failure']}")
+
+    results['import.process_frame'] = _measure(
+        lambda: process_frame(frame, IMPORT_MAPPING, fields_config, plan, ForeignKeyResolver()), repeat,
+    )
+    results['import.bulk_load'] = _measure(
+        lambda: RevenueService.bulk_load(valid_records), repeat,
+        teardown=lambda _: _delete_benchmark_rows(),
+    )
+    results['import.stream_import'] = _measure(
+        import_stream, repeat,
+        teardown=lambda _: _delete_benchmark_rows(),
+    )
+
+    _delete_benchmark_rows()
+    return {
+        'drivers': drivers,
+        'years': years,
+        'rows': rows,
+        'seed_seconds': round(seed_seconds, 3),
+        'results': results,
+    }
+
+
+def _git_commit() -> Optional[str]:
+    """Get the current commit of the repository, if any."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(
+    sizes: List[int],
+    years: int = 5,
+    repeat: int = 5,
+    batch_rows: int = 1000,
+    import_rows: int = 10000,
+    keep: bool = False
+) -> Dict[str, Any]:
+    """
+    Run the benchmark on a throwaway database created on the configured server.
+
+    Args:
+        sizes: Numbers of drivers of the data sizes to benchmark
+        years: Years of revenue and expenses of every size
+        repeat: Number of runs of each case
+        batch_rows: Records per insert_many and delete_many call
+        import_rows: Rows of the benchmarked import file
+        keep: Keep the database at the end (its name is in the results)
+
+    Returns:
+        Dictionary with the environment of the run and the results of each size
+    """
+    database = f"{DB_CONFIG['dbname']}_bench_{os.getpid()}"
+    admin = psycopg2.connect(**{**DB_CONFIG, 'dbname': 'postgres'})
+    admin.autocommit = True
+    with admin.cursor() as cur:
+        cur.execute(sql.SQL("CREATE DATABASE {}").format(sql.Identifier(database)))
+
+    # Every connection of the services is opened on the benchmark database from here on
+    original_database = DB_CONFIG['dbname']
+    DB_CONFIG['dbname'] = database
+    try:
+        run_migrations()
+        server_version = _query("SHOW server_version")[0][0]
+        results = {
+            'benchmark': 'services',
+            'commit': _git_commit(),
+            'created_at': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'postgres': server_version,
+            'database': database,
+            'repeat': repeat,
+            'batch_rows': batch_rows,
+            'import_rows': import_rows,
+            'sizes': {},
+        }
+        for drivers in sizes:
+            print(f"A medir com {drivers} motoristas...")
+            results['sizes'][str(drivers)] = run_size(drivers, years, repeat, batch_rows, import_rows)
+        return results
+    finally:
+        close_connection_pool()
+        dispose_db_engines()
+        DB_CONFIG['dbname'] = original_database
+        if not keep:
+            with admin.cursor() as cur:
+                cur.execute(sql.SQL("DROP DATABASE IF EXISTS {} WITH (FORCE)").format(sql.Identifier(database)))
+        admin.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark da camada de serviços numa base de dados temporária")
+    parser.add_argument("--sizes", default="10,100", help="Números de motoristas a medir, separados por vírgulas")
+    parser.add_argument("--years", type=int, default=5, help="Anos de receitas e despesas gerados")
+    parser.add_argument("--repeat", type=int, default=5, help="Número de execuções de cada caso")
+    parser.add_argument("--batch-rows", type=int, default=1000, help="Registos por insert_many e delete_many")
+    parser.add_argument("--import-rows", type=int, default=10000, help="Linhas do ficheiro importado")
+    parser.add_argument("--output", default=None, help="Ficheiro JSON dos resultados (por omissão benchmarks/results/<commit>.json)")
+    parser.add_argument("--keep", action="store_true", help="Manter a base de dados temporária no fim")
+    args = parser.parse_args()
+
+    # The forms are built outside a Streamlit session, which would log a warning per element
+    logging.getLogger("streamlit").setLevel(logging.ERROR)
+
+    results = run(
+        [int(size) for size in args.sizes.split(",")],
+        years=args.years,
+        repeat=args.repeat,
+        batch_rows=args.batch_rows,
+        import_rows=args.import_rows,
+        keep=args.keep,
+    )
+
+    name = results['commit'] or datetime.now().strftime("%Y%m%d%H%M%S")
+    output = args.output or os.path.join("benchmarks", "results", f"{name}.json")
+    if os.path.dirname(output):
+        os.makedirs(os.path.dirname(output), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as file:
+        json.dump(results, file, indent=2)
+
+    for size, size_results in results['sizes'].items():
+        total = sum(size_results['rows'].values())
+        print(f"\n{size} motoristas ({total} registos, gerados em {size_results['seed_seconds']:.1f} s)")
+        for name, timing in size_results['results'].items():
+            print(f"  {name:<42} {timing['median_ms']:>10.2f} ms (min {timing['min_ms']:.2f})")
+    print(f"\nResultados em {output}")
+
+
+if __name__ == "__main__":
+    main()
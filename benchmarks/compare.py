@@ -0,0 +1,102 @@
+"""
+Compare two result files of benchmarks.bench_services, e.g. of two commits.
+
+Prints the change of every case measured in both files and exits with status 1
+if any case got slower than the threshold, so it can gate a CI job.
+
+Usage:
+    python -m benchmarks.compare benchmarks/results/<old>.json benchmarks/results/<new>.json [--threshold 0.2]
+"""
+import argparse
+import json
+import sys
+from typing import Any, Dict, List
+
+
+def load_results(path: str) -> Dict[str, Any]:
+    """
+    Read a result file.
+
+    Args:
+        path: Path of the JSON file written by benchmarks.bench_services
+
+    Returns:
+        Dictionary with the results
+    """
+    with open(path, encoding="utf-8") as file:
+        return json.load(file)
+
+
+def compare(
+    baseline: Dict[str, Any],
+    current: Dict[str, Any],
+    metric: str = 'median_ms',
+    threshold: float = 0.2
+) -> List[Dict[str, Any]]:
+    """
+    Compare the cases measured in both results, size by size.
+
+    Args:
+        baseline: Results of the reference run
+        current: Results of the run being checked
+        metric: Timing compared ('min_ms', 'median_ms', 'mean_ms' or 'max_ms')
+        threshold: Relative slowdown above which a case is a regression (0.2 = 20% slower)
+
+    Returns:
+        List of dictionaries with 'size', 'case', 'baseline', 'current', 'change'
+        (relative, negative when faster) and 'regression'
+    """
+    rows = []
+    for size, current_size in current['sizes'].items():
+        baseline_size = baseline['sizes'].get(size)
+        if baseline_size is None:
+            continue
+        for case, timing in current_size['results'].items():
+            reference = baseline_size['results'].get(case)
+            if reference is None or not reference[metric]:
+                continue
+            change = timing[metric] / reference[metric] - 1
+            rows.append({
+                'size': size,
+                'case': case,
+                'baseline': reference[metric],
+                'current': timing[metric],
+                'change': change,
+                'regression': change > threshold,
+            })
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Comparar dois resultados do benchmark dos serviços")
+    parser.add_argument("baseline", help="Resultados de referência (JSON)")
+    parser.add_argument("current", help="Resultados a comparar (JSON)")
+    parser.add_argument("--metric", default="median_ms", choices=["min_ms", "median_ms", "mean_ms", "max_ms"])
+    parser.add_argument("--threshold", type=float, default=0.2, help="Abrandamento relativo tolerado (0.2 = 20%%)")
+    args = parser.parse_args()
+
+    baseline = load_results(args.baseline)
+    current = load_results(args.current)
+    rows = compare(baseline, current, args.metric, args.threshold)
+
+    print(f"{baseline.get('commit') or args.baseline} -> {current.get('commit') or args.current} ({args.metric})")
+    size = None
+    for row in rows:
+        if row['size'] != size:
+            size = row['size']
+            print(f"\n{size} motoristas")
+        flag = "  << mais lento" if row['regression'] else ""
+        print(
+            f"  {row['case']:<42} {row['baseline']:>10.2f} -> {row['current']:>10.2f} ms "
+            f"{row['change']:>+8.1%}{flag}"
+        )
+
+    regressions = [row for row in rows if row['regression']]
+    if regressions:
+        print(f"\n{len(regressions)} casos abrandaram mais de {args.threshold:.0%}.")
+        sys.exit(1)
+    print("\nSem regressões.")
+
+
+if __name__ == "__main__":
+    main()
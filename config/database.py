@@ -10,3 +10,26 @@ DB_CONFIG = {
     'host': os.getenv("DB_HOST") or st.secrets.get("DB_HOST", "localhost"),
     'port': os.getenv("DB_PORT") or st.secrets.get("DB_PORT", "5432")
 }
+
+# Process-wide connection pool shared by all Streamlit sessions
+DB_POOL_CONFIG = {
+    'min_size': int(os.getenv("DB_POOL_MIN_SIZE") or st.secrets.get("DB_POOL_MIN_SIZE", 1)),
+    'max_size': int(os.getenv("DB_POOL_MAX_SIZE") or st.secrets.get("DB_POOL_MAX_SIZE", 10)),
+    'timeout': float(os.getenv("DB_POOL_TIMEOUT") or st.secrets.get("DB_POOL_TIMEOUT", 30)),
+}
+
+# SQLAlchemy engine used by the pandas read paths
+DB_ENGINE_CONFIG = {
+    'pool_size': int(os.getenv("DB_ENGINE_POOL_SIZE") or st.secrets.get("DB_ENGINE_POOL_SIZE", 5)),
+    'max_overflow': int(os.getenv("DB_ENGINE_MAX_OVERFLOW") or st.secrets.get("DB_ENGINE_MAX_OVERFLOW", 5)),
+    'pool_recycle': int(os.getenv("DB_ENGINE_POOL_RECYCLE") or st.secrets.get("DB_ENGINE_POOL_RECYCLE", 1800)),
+    'pool_timeout': float(os.getenv("DB_ENGINE_POOL_TIMEOUT") or st.secrets.get("DB_ENGINE_POOL_TIMEOUT", 30)),
+    'pool_pre_ping': str(os.getenv("DB_ENGINE_PRE_PING") or st.secrets.get("DB_ENGINE_PRE_PING", "true")).lower() in ['true', '1', 'yes'],
+}
+
+# Read-through cache of service queries (per process, invalidated by service writes)
+QUERY_CACHE_CONFIG = {
+    'enabled': str(os.getenv("QUERY_CACHE_ENABLED") or st.secrets.get("QUERY_CACHE_ENABLED", "true")).lower() in ['true', '1', 'yes'],
+    'ttl': float(os.getenv("QUERY_CACHE_TTL") or st.secrets.get("QUERY_CACHE_TTL", 300)),
+    'max_memory_mb': float(os.getenv("QUERY_CACHE_MAX_MEMORY_MB") or st.secrets.get("QUERY_CACHE_MAX_MEMORY_MB", 64)),
+}
@@ -0,0 +1,20 @@
+import streamlit as st
+import os
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# Bulk imports: CSV files at least this big are streamed in chunks instead of loaded whole,
+# as background jobs run on a pool of worker threads shared by all sessions.
+# Batch imports of many files/sheets parse them on IMPORT_BATCH_WORKERS processes.
+IMPORT_CONFIG = {
+    'chunk_size': int(os.getenv("IMPORT_CHUNK_SIZE") or st.secrets.get("IMPORT_CHUNK_SIZE", 10000)),
+    'streaming_threshold_mb': float(os.getenv("IMPORT_STREAMING_THRESHOLD_MB") or st.secrets.get("IMPORT_STREAMING_THRESHOLD_MB", 20)),
+    'max_reported_errors': int(os.getenv("IMPORT_MAX_REPORTED_ERRORS") or st.secrets.get("IMPORT_MAX_REPORTED_ERRORS", 1000)),
+    'error_sample_rows': int(os.getenv("IMPORT_ERROR_SAMPLE_ROWS") or st.secrets.get("IMPORT_ERROR_SAMPLE_ROWS", 100)),
+    'job_workers': int(os.getenv("IMPORT_JOB_WORKERS") or st.secrets.get("IMPORT_JOB_WORKERS", 2)),
+    'job_history': int(os.getenv("IMPORT_JOB_HISTORY") or st.secrets.get("IMPORT_JOB_HISTORY", 50)),
+    'job_poll_seconds': float(os.getenv("IMPORT_JOB_POLL_SECONDS") or st.secrets.get("IMPORT_JOB_POLL_SECONDS", 2)),
+    'jobs_shown': int(os.getenv("IMPORT_JOBS_SHOWN") or st.secrets.get("IMPORT_JOBS_SHOWN", 5)),
+    'batch_workers': int(os.getenv("IMPORT_BATCH_WORKERS") or st.secrets.get("IMPORT_BATCH_WORKERS", 4)),
+}
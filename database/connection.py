@@ -1,15 +1,68 @@
+import threading
 import psycopg2
+from psycopg2.pool import PoolError
 from sqlalchemy import create_engine
+from sqlalchemy.engine import URL
 from contextlib import contextmanager
-from config.database import DB_CONFIG
+from typing import Dict, Any
+from config.database import DB_CONFIG, DB_POOL_CONFIG, DB_ENGINE_CONFIG
+from database.pool import ConnectionPool
 import logging
 from utils.error_handlers import handle_database_error
 
+_pool = None
+_pool_lock = threading.Lock()
+
+_engines = {}
+_engine_lock = threading.Lock()
+
+
+def get_connection_pool() -> ConnectionPool:
+    """
+    Get the process-wide connection pool, creating it on first use.
+    
+    Returns:
+        ConnectionPool: Pool shared by all sessions of this process
+    """
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ConnectionPool(
+                    min_size=DB_POOL_CONFIG['min_size'],
+                    max_size=DB_POOL_CONFIG['max_size'],
+                    timeout=DB_POOL_CONFIG['timeout'],
+                    **DB_CONFIG
+                )
+    return _pool
+
+
+def get_pool_stats() -> Dict[str, Any]:
+    """
+    Get usage statistics of the connection pool, useful to size it.
+    
+    Returns:
+        Dictionary with in-use/idle connection counts and checkout wait times
+    """
+    return get_connection_pool().stats()
+
+
+def close_connection_pool() -> None:
+    """Close all pooled connections. The pool is recreated on the next checkout."""
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.close()
+            _pool = None
+
+
 @contextmanager
 @handle_database_error()
 def get_db_connection():
     """
     Context manager for database connections using psycopg2.
+    Connections are checked out from the shared pool and always returned to it on exit,
+    with any uncommitted transaction rolled back.
     Includes error handling for database operations.
     
     Yields:
@@ -18,18 +71,28 @@ def get_db_connection():
     Raises:
         Exception: If connection error occurs
     """
+    pool = None
     conn = None
     try:
-        conn = psycopg2.connect(**DB_CONFIG)
+        pool = get_connection_pool()
+        conn = pool.getconn()
         yield conn
     except psycopg2.OperationalError as e:
         print(f"Database connection error: {str(e)}")
         raise Exception("Não foi possível estabelecer ligação à base de dados. Por favor, verifique as configurações e tente novamente.")
+    except PoolError as e:
+        print(f"Database pool error: {str(e)}")
+        raise Exception("A base de dados está ocupada de momento. Por favor, tente novamente dentro de instantes.")
+    finally:
+        if conn is not None:
+            pool.putconn(conn)
 
 @handle_database_error()
 def get_db_engine():
     """
-    Get SQLAlchemy engine for pandas operations.
+    Get the SQLAlchemy engine for pandas operations.
+    A single engine (and connection pool) is kept per DSN and reused by every call;
+    if the database configuration changes, engines built for the old DSN are disposed.
     Includes error handling for engine creation.
     
     Returns:
@@ -39,11 +102,36 @@ def get_db_engine():
         Exception: If engine creation error occurs
     """
     try:
-        connection_string = (
-            f"postgresql://{DB_CONFIG['user']}:{DB_CONFIG['password']}"
-            f"@{DB_CONFIG['host']}:{DB_CONFIG['port']}/{DB_CONFIG['dbname']}"
+        url = URL.create(
+            "postgresql+psycopg2",
+            username=DB_CONFIG['user'],
+            password=DB_CONFIG['password'],
+            host=DB_CONFIG['host'],
+            port=int(DB_CONFIG['port']) if DB_CONFIG['port'] else None,
+            database=DB_CONFIG['dbname'],
         )
-        return create_engine(connection_string)
+        dsn = url.render_as_string(hide_password=False)
+
+        with _engine_lock:
+            engine = _engines.get(dsn)
+            if engine is None:
+                # The configuration changed: release connections held for the previous DSN
+                for stale_engine in _engines.values():
+                    stale_engine.dispose()
+                _engines.clear()
+
+                engine = create_engine(url, **DB_ENGINE_CONFIG)
+                _engines[dsn] = engine
+
+        return engine
     except Exception as e:
         print(f"Error creating database engine: {str(e)}")
         raise Exception("Não foi possível criar o motor de base de dados. Por favor, verifique as configurações e tente novamente.")
+
+
+def dispose_db_engines() -> None:
+    """Dispose all cached SQLAlchemy engines and their connections."""
+    with _engine_lock:
+        for engine in _engines.values():
+            engine.dispose()
+        _engines.clear()
@@ -0,0 +1,3 @@
+from database.migrations.runner import run_migrations, get_migration_status
+
+__all__ = ['run_migrations', 'get_migration_status']
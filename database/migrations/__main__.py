@@ -0,0 +1,34 @@
+"""
+Command line entry point for the schema migrations.
+
+Usage:
+    python -m database.migrations            # apply all pending migrations
+    python -m database.migrations --to 1     # apply migrations up to version 1
+    python -m database.migrations status     # list applied and pending migrations
+"""
+import argparse
+from database.migrations.runner import run_migrations, get_migration_status
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Gerir as migrações do esquema da base de dados")
+    parser.add_argument("command", nargs="?", default="upgrade", choices=["upgrade", "status"])
+    parser.add_argument("--to", type=int, default=None, help="Última versão a aplicar")
+    args = parser.parse_args()
+
+    if args.command == "status":
+        for migration in get_migration_status():
+            state = migration['applied_at'].strftime("%Y-%m-%d %H:%M") if migration['applied_at'] else "pendente"
+            modified = " (alterada depois de aplicada)" if migration['modified'] else ""
+            print(f"{migration['version']:04d} {migration['name']}: {state}{modified}")
+        return
+
+    applied = run_migrations(args.to)
+    if applied:
+        print(f"{len(applied)} migrações aplicadas.")
+    else:
+        print("A base de dados já está atualizada.")
+
+
+if __name__ == "__main__":
+    main()
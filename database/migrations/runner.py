@@ -0,0 +1,153 @@
+import hashlib
+import re
+from pathlib import Path
+from typing import Dict, List, Optional, Any
+import psycopg2
+from config.database import DB_CONFIG
+
+# Directory with the migration files, named <version>_<description>.sql (e.g. 0001_initial_schema.sql)
+MIGRATIONS_DIR = Path(__file__).parent / "versions"
+
+# Key of the advisory lock that keeps concurrent runners from applying the same migration
+MIGRATION_LOCK_KEY = 7215001
+
+_FILENAME_PATTERN = re.compile(r"^(\d+)_(\w+)\.sql$")
+
+
+def discover_migrations() -> List[Dict[str, Any]]:
+    """
+    Find the migration files, ordered by version.
+
+    Returns:
+        List of dictionaries with version, name, path and checksum of each migration
+
+    Raises:
+        ValueError: If two files share the same version
+    """
+    migrations = {}
+    for path in MIGRATIONS_DIR.glob("*.sql"):
+        match = _FILENAME_PATTERN.match(path.name)
+        if not match:
+            continue
+        version = int(match.group(1))
+        if version in migrations:
+            raise ValueError(f"Existem duas migrações com a versão {version}")
+        sql = path.read_text(encoding="utf-8")
+        migrations[version] = {
+            'version': version,
+            'name': match.group(2),
+            'path': path,
+            'checksum': hashlib.sha256(sql.encode("utf-8")).hexdigest(),
+        }
+    return [migrations[version] for version in sorted(migrations)]
+
+
+def _ensure_version_table(cur) -> None:
+    """Create the table that records the applied migrations."""
+    cur.execute("""
+        CREATE TABLE IF NOT EXISTS schema_migrations (
+            version INTEGER PRIMARY KEY,
+            name VARCHAR(255) NOT NULL,
+            checksum CHAR(64) NOT NULL,
+            applied_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+
+
+def _applied_migrations(cur) -> Dict[int, Dict[str, Any]]:
+    """Get the applied migrations keyed by version."""
+    cur.execute("SELECT version, name, checksum, applied_at FROM schema_migrations")
+    return {
+        row[0]: {'version': row[0], 'name': row[1], 'checksum': row[2], 'applied_at': row[3]}
+        for row in cur.fetchall()
+    }
+
+
+def run_migrations(target_version: Optional[int] = None) -> List[str]:
+    """
+    Apply the pending migrations in version order, each in its own transaction.
+    Uses a dedicated connection holding an advisory lock, so several app
+    instances starting at the same time apply every migration only once.
+
+    Args:
+        target_version: Last version to apply (defaults to all)
+
+    Returns:
+        Names of the migrations applied
+
+    Raises:
+        Exception: If a migration fails (it is rolled back and later ones are not applied)
+    """
+    applied_now = []
+    conn = psycopg2.connect(**DB_CONFIG)
+    try:
+        with conn.cursor() as cur:
+            cur.execute("SELECT pg_advisory_lock(%s)", (MIGRATION_LOCK_KEY,))
+            _ensure_version_table(cur)
+        conn.commit()
+
+        with conn.cursor() as cur:
+            applied = _applied_migrations(cur)
+        conn.commit()
+
+        for migration in discover_migrations():
+            version = migration['version']
+            if target_version is not None and version > target_version:
+                break
+
+            if version in applied:
+                if applied[version]['checksum'].strip() != migration['checksum']:
+                    print(f"Warning: migration {migration['path'].name} was changed after being applied")
+                continue
+
+            label = migration['path'].name
+            print(f"Applying migration {label}")
+            try:
+                with conn.cursor() as cur:
+                    cur.execute(migration['path'].read_text(encoding="utf-8"))
+                    cur.execute(
+                        "INSERT INTO schema_migrations (version, name, checksum) VALUES (%s, %s, %s)",
+                        (version, migration['name'], migration['checksum'])
+                    )
+                conn.commit()
+            except Exception as e:
+                conn.rollback()
+                raise Exception(f"Erro ao aplicar a migração {label}: {str(e)}")
+            applied_now.append(label)
+
+        with conn.cursor() as cur:
+            cur.execute("SELECT pg_advisory_unlock(%s)", (MIGRATION_LOCK_KEY,))
+        conn.commit()
+    finally:
+        conn.close()
+
+    return applied_now
+
+
+def get_migration_status() -> List[Dict[str, Any]]:
+    """
+    Get the status of every known migration.
+
+    Returns:
+        List of dictionaries with version, name, applied_at (None if pending)
+        and whether the file changed after being applied
+    """
+    conn = psycopg2.connect(**DB_CONFIG)
+    try:
+        with conn.cursor() as cur:
+            _ensure_version_table(cur)
+            applied = _applied_migrations(cur)
+        conn.commit()
+    finally:
+        conn.close()
+
+    status = []
+    for migration in discover_migrations():
+        record = applied.get(migration['version'])
+        status.append({
+            'version': migration['version'],
+            'name': migration['name'],
+            'applied_at': record['applied_at'] if record else None,
+            'modified': bool(record) and record['checksum'].strip() != migration['checksum'],
+        })
+    return status
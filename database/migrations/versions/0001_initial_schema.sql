@@ -0,0 +1,91 @@
+-- Canonical schema of the application tables.
+-- Uses IF NOT EXISTS so that databases created before migrations existed can adopt it.
+
+CREATE TABLE IF NOT EXISTS drivers (
+    id SERIAL PRIMARY KEY,
+    display_name VARCHAR(100) NOT NULL UNIQUE,
+    first_name VARCHAR(100) NOT NULL,
+    last_name VARCHAR(100) NOT NULL,
+    nif VARCHAR(9) NOT NULL UNIQUE,
+    niss VARCHAR(20),
+    address_line1 VARCHAR(255),
+    address_line2 VARCHAR(255),
+    postal_code VARCHAR(8),
+    location VARCHAR(100),
+    is_active BOOLEAN NOT NULL DEFAULT TRUE,
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS cars (
+    id SERIAL PRIMARY KEY,
+    license_plate VARCHAR(8) NOT NULL UNIQUE,
+    brand VARCHAR(50) NOT NULL,
+    model VARCHAR(50) NOT NULL,
+    category VARCHAR(20) NOT NULL,
+    acquisition_date DATE NOT NULL,
+    acquisition_cost NUMERIC(12, 2) NOT NULL,
+    is_active BOOLEAN NOT NULL DEFAULT TRUE,
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS revenue (
+    id SERIAL PRIMARY KEY,
+    driver_id INTEGER NOT NULL REFERENCES drivers (id),
+    car_id INTEGER NOT NULL REFERENCES cars (id),
+    platform VARCHAR(20) NOT NULL,
+    start_date DATE NOT NULL,
+    end_date DATE NOT NULL,
+    gross_revenue NUMERIC(12, 2) NOT NULL,
+    commission_percentage NUMERIC(5, 2) NOT NULL DEFAULT 0,
+    tip NUMERIC(12, 2) NOT NULL DEFAULT 0,
+    num_travels INTEGER NOT NULL DEFAULT 0,
+    num_kilometers NUMERIC(12, 2) NOT NULL DEFAULT 0,
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Older databases were created without revenue.updated_at
+ALTER TABLE revenue ADD COLUMN IF NOT EXISTS updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP;
+
+CREATE TABLE IF NOT EXISTS hr_expenses (
+    id SERIAL PRIMARY KEY,
+    driver_id INTEGER NOT NULL REFERENCES drivers (id),
+    start_date DATE NOT NULL,
+    end_date DATE NOT NULL,
+    payment_date DATE NOT NULL,
+    base_salary NUMERIC(12, 2) NOT NULL,
+    working_days INTEGER NOT NULL,
+    meal_allowance_per_day NUMERIC(8, 2) NOT NULL,
+    other_benefits NUMERIC(12, 2) NOT NULL DEFAULT 0,
+    notes TEXT,
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS car_expenses (
+    id SERIAL PRIMARY KEY,
+    car_id INTEGER NOT NULL REFERENCES cars (id),
+    expense_type VARCHAR(50) NOT NULL,
+    start_date DATE NOT NULL,
+    end_date DATE,
+    amount NUMERIC(12, 2) NOT NULL,
+    vat NUMERIC(5, 2),
+    description TEXT,
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS ga_expenses (
+    id SERIAL PRIMARY KEY,
+    expense_type VARCHAR(50) NOT NULL,
+    start_date DATE NOT NULL,
+    end_date DATE,
+    payment_date DATE,
+    amount NUMERIC(12, 2) NOT NULL,
+    vat NUMERIC(5, 2),
+    description TEXT,
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
@@ -0,0 +1,28 @@
+-- Indexes matching the filters, joins and orderings used by the services.
+-- Sort indexes end with id so that keyset pagination (get_page) can seek on them.
+
+-- Revenue: per-driver listings and calendar, per-car joins, date range filters,
+-- default ordering (created_at DESC)
+CREATE INDEX IF NOT EXISTS revenue_driver_id_start_date_idx ON revenue (driver_id, start_date);
+CREATE INDEX IF NOT EXISTS revenue_car_id_start_date_idx ON revenue (car_id, start_date);
+CREATE INDEX IF NOT EXISTS revenue_start_date_end_date_idx ON revenue (start_date, end_date);
+CREATE INDEX IF NOT EXISTS revenue_created_at_id_idx ON revenue (created_at DESC, id DESC);
+
+-- Car expenses: per-car listings and summaries, date filters and monthly summary,
+-- default ordering (start_date DESC), creation date filter of the list page
+CREATE INDEX IF NOT EXISTS car_expenses_car_id_start_date_idx ON car_expenses (car_id, start_date);
+CREATE INDEX IF NOT EXISTS car_expenses_start_date_id_idx ON car_expenses (start_date DESC, id DESC);
+CREATE INDEX IF NOT EXISTS car_expenses_created_at_idx ON car_expenses (created_at);
+
+-- HR expenses: default ordering and payment date filter, per-driver listings
+CREATE INDEX IF NOT EXISTS hr_expenses_payment_date_id_idx ON hr_expenses (payment_date DESC, id DESC);
+CREATE INDEX IF NOT EXISTS hr_expenses_driver_id_payment_date_idx ON hr_expenses (driver_id, payment_date);
+
+-- G&A expenses: default ordering and date filters, summary by type
+CREATE INDEX IF NOT EXISTS ga_expenses_start_date_id_idx ON ga_expenses (start_date DESC, id DESC);
+CREATE INDEX IF NOT EXISTS ga_expenses_payment_date_idx ON ga_expenses (payment_date);
+CREATE INDEX IF NOT EXISTS ga_expenses_expense_type_start_date_idx ON ga_expenses (expense_type, start_date);
+
+-- Active drivers/cars dropdowns, ordered by name/plate
+CREATE INDEX IF NOT EXISTS drivers_active_display_name_idx ON drivers (display_name) WHERE is_active;
+CREATE INDEX IF NOT EXISTS cars_active_license_plate_idx ON cars (license_plate) WHERE is_active;
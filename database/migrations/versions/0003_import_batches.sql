@@ -0,0 +1,34 @@
+-- Import batches: one row per bulk import of a file, with the checkpoint of the
+-- last chunk committed, so that a failed import can be resumed or rolled back.
+CREATE TABLE IF NOT EXISTS import_batches (
+    id SERIAL PRIMARY KEY,
+    table_name VARCHAR(50) NOT NULL,
+    file_name VARCHAR(255) NOT NULL,
+    file_hash VARCHAR(64) NOT NULL,
+    column_mapping JSONB NOT NULL,
+    chunk_size INTEGER NOT NULL CHECK (chunk_size > 0),
+    status VARCHAR(20) NOT NULL DEFAULT 'running'
+        CHECK (status IN ('running', 'completed', 'failed', 'rolled_back')),
+    committed_chunks INTEGER NOT NULL DEFAULT 0,
+    imported_rows INTEGER NOT NULL DEFAULT 0,
+    last_error TEXT,
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Resumable batches of the same file and the latest batches of each table
+CREATE INDEX IF NOT EXISTS import_batches_table_name_file_hash_idx ON import_batches (table_name, file_hash);
+CREATE INDEX IF NOT EXISTS import_batches_table_name_created_at_idx ON import_batches (table_name, created_at DESC);
+
+-- Rows inserted by an import keep the batch they came from, so a batch can be
+-- rolled back with a single DELETE. Drivers and cars are upserted by natural
+-- key (re-importing them is idempotent), so they are not tagged.
+ALTER TABLE revenue ADD COLUMN IF NOT EXISTS import_batch_id INTEGER REFERENCES import_batches(id) ON DELETE SET NULL;
+ALTER TABLE car_expenses ADD COLUMN IF NOT EXISTS import_batch_id INTEGER REFERENCES import_batches(id) ON DELETE SET NULL;
+ALTER TABLE hr_expenses ADD COLUMN IF NOT EXISTS import_batch_id INTEGER REFERENCES import_batches(id) ON DELETE SET NULL;
+ALTER TABLE ga_expenses ADD COLUMN IF NOT EXISTS import_batch_id INTEGER REFERENCES import_batches(id) ON DELETE SET NULL;
+
+CREATE INDEX IF NOT EXISTS revenue_import_batch_id_idx ON revenue (import_batch_id) WHERE import_batch_id IS NOT NULL;
+CREATE INDEX IF NOT EXISTS car_expenses_import_batch_id_idx ON car_expenses (import_batch_id) WHERE import_batch_id IS NOT NULL;
+CREATE INDEX IF NOT EXISTS hr_expenses_import_batch_id_idx ON hr_expenses (import_batch_id) WHERE import_batch_id IS NOT NULL;
+CREATE INDEX IF NOT EXISTS ga_expenses_import_batch_id_idx ON ga_expenses (import_batch_id) WHERE import_batch_id IS NOT NULL;
@@ -0,0 +1,12 @@
+-- Mapping profiles: named column mappings of the imports of each table, saved
+-- once and reused for every file of the same layout (e.g. the weekly sheets of
+-- a platform report).
+CREATE TABLE IF NOT EXISTS import_mapping_profiles (
+    id SERIAL PRIMARY KEY,
+    table_name VARCHAR(50) NOT NULL,
+    name VARCHAR(100) NOT NULL,
+    column_mapping JSONB NOT NULL,
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE (table_name, name)
+);
@@ -0,0 +1,80 @@
+-- Row fingerprints: MD5 of the normalized business fields of each imported row,
+-- so that rows already imported (e.g. the previous week re-sent in a statement)
+-- are skipped by the next import. The normalization must match
+-- utils/fingerprints.py: numbers rounded to 2 decimals, dates as YYYY-MM-DD,
+-- text with runs of whitespace collapsed and trimmed, NULL as an empty string,
+-- fields joined with the unit separator (chr(31)).
+ALTER TABLE revenue ADD COLUMN IF NOT EXISTS fingerprint CHAR(32);
+ALTER TABLE car_expenses ADD COLUMN IF NOT EXISTS fingerprint CHAR(32);
+ALTER TABLE hr_expenses ADD COLUMN IF NOT EXISTS fingerprint CHAR(32);
+ALTER TABLE ga_expenses ADD COLUMN IF NOT EXISTS fingerprint CHAR(32);
+
+-- Fingerprints of the existing rows
+UPDATE revenue SET fingerprint = md5(concat_ws(chr(31),
+    coalesce(round(driver_id::numeric, 2)::text, ''),
+    coalesce(round(car_id::numeric, 2)::text, ''),
+    coalesce(btrim(regexp_replace(platform, '[ \t\r\n\f\v]+', ' ', 'g')), ''),
+    coalesce(to_char(start_date, 'YYYY-MM-DD'), ''),
+    coalesce(to_char(end_date, 'YYYY-MM-DD'), ''),
+    coalesce(round(gross_revenue::numeric, 2)::text, ''),
+    coalesce(round(commission_percentage::numeric, 2)::text, ''),
+    coalesce(round(tip::numeric, 2)::text, ''),
+    coalesce(round(num_travels::numeric, 2)::text, ''),
+    coalesce(round(num_kilometers::numeric, 2)::text, '')
+)) WHERE fingerprint IS NULL;
+
+UPDATE car_expenses SET fingerprint = md5(concat_ws(chr(31),
+    coalesce(round(car_id::numeric, 2)::text, ''),
+    coalesce(btrim(regexp_replace(expense_type, '[ \t\r\n\f\v]+', ' ', 'g')), ''),
+    coalesce(to_char(start_date, 'YYYY-MM-DD'), ''),
+    coalesce(to_char(end_date, 'YYYY-MM-DD'), ''),
+    coalesce(round(amount::numeric, 2)::text, ''),
+    coalesce(round(vat::numeric, 2)::text, ''),
+    coalesce(btrim(regexp_replace(description, '[ \t\r\n\f\v]+', ' ', 'g')), '')
+)) WHERE fingerprint IS NULL;
+
+UPDATE hr_expenses SET fingerprint = md5(concat_ws(chr(31),
+    coalesce(round(driver_id::numeric, 2)::text, ''),
+    coalesce(to_char(start_date, 'YYYY-MM-DD'), ''),
+    coalesce(to_char(end_date, 'YYYY-MM-DD'), ''),
+    coalesce(to_char(payment_date, 'YYYY-MM-DD'), ''),
+    coalesce(round(base_salary::numeric, 2)::text, ''),
+    coalesce(round(working_days::numeric, 2)::text, ''),
+    coalesce(round(meal_allowance_per_day::numeric, 2)::text, ''),
+    coalesce(round(other_benefits::numeric, 2)::text, ''),
+    coalesce(btrim(regexp_replace(notes, '[ \t\r\n\f\v]+', ' ', 'g')), '')
+)) WHERE fingerprint IS NULL;
+
+UPDATE ga_expenses SET fingerprint = md5(concat_ws(chr(31),
+    coalesce(btrim(regexp_replace(expense_type, '[ \t\r\n\f\v]+', ' ', 'g')), ''),
+    coalesce(to_char(start_date, 'YYYY-MM-DD'), ''),
+    coalesce(to_char(end_date, 'YYYY-MM-DD'), ''),
+    coalesce(to_char(payment_date, 'YYYY-MM-DD'), ''),
+    coalesce(round(amount::numeric, 2)::text, ''),
+    coalesce(round(vat::numeric, 2)::text, ''),
+    coalesce(btrim(regexp_replace(description, '[ \t\r\n\f\v]+', ' ', 'g')), '')
+)) WHERE fingerprint IS NULL;
+
+-- Rows already duplicated before this migration are kept, only the oldest one keeps its fingerprint
+UPDATE revenue t SET fingerprint = NULL FROM (
+    SELECT id, row_number() OVER (PARTITION BY fingerprint ORDER BY id) AS occurrence
+    FROM revenue WHERE fingerprint IS NOT NULL
+) d WHERE t.id = d.id AND d.occurrence > 1;
+UPDATE car_expenses t SET fingerprint = NULL FROM (
+    SELECT id, row_number() OVER (PARTITION BY fingerprint ORDER BY id) AS occurrence
+    FROM car_expenses WHERE fingerprint IS NOT NULL
+) d WHERE t.id = d.id AND d.occurrence > 1;
+UPDATE hr_expenses t SET fingerprint = NULL FROM (
+    SELECT id, row_number() OVER (PARTITION BY fingerprint ORDER BY id) AS occurrence
+    FROM hr_expenses WHERE fingerprint IS NOT NULL
+) d WHERE t.id = d.id AND d.occurrence > 1;
+UPDATE ga_expenses t SET fingerprint = NULL FROM (
+    SELECT id, row_number() OVER (PARTITION BY fingerprint ORDER BY id) AS occurrence
+    FROM ga_expenses WHERE fingerprint IS NOT NULL
+) d WHERE t.id = d.id AND d.occurrence > 1;
+
+-- Conflict target of the imports (INSERT ... ON CONFLICT (fingerprint) WHERE fingerprint IS NOT NULL DO NOTHING)
+CREATE UNIQUE INDEX IF NOT EXISTS revenue_fingerprint_key ON revenue (fingerprint) WHERE fingerprint IS NOT NULL;
+CREATE UNIQUE INDEX IF NOT EXISTS car_expenses_fingerprint_key ON car_expenses (fingerprint) WHERE fingerprint IS NOT NULL;
+CREATE UNIQUE INDEX IF NOT EXISTS hr_expenses_fingerprint_key ON hr_expenses (fingerprint) WHERE fingerprint IS NOT NULL;
+CREATE UNIQUE INDEX IF NOT EXISTS ga_expenses_fingerprint_key ON ga_expenses (fingerprint) WHERE fingerprint IS NOT NULL;
@@ -0,0 +1,179 @@
+import threading
+import time
+from collections import deque
+from typing import Dict, Any
+import psycopg2
+from psycopg2 import extensions
+from psycopg2.pool import PoolError
+
+
+class ConnectionPool:
+    """
+    Thread-safe pool of psycopg2 connections shared by all Streamlit sessions.
+    Checkouts block (up to a timeout) while all connections are in use, returned
+    connections are cleaned up before reuse and usage statistics are tracked.
+    """
+
+    def __init__(self, min_size: int, max_size: int, timeout: float, **connect_kwargs):
+        """
+        Create the pool and open the first min_size connections.
+
+        Args:
+            min_size: Number of connections opened upfront
+            max_size: Maximum number of connections open at the same time
+            timeout: Seconds to wait for a free connection before giving up
+            **connect_kwargs: Arguments passed to psycopg2.connect
+        """
+        if min_size < 0 or max_size < 1 or min_size > max_size:
+            raise ValueError("Pool sizes must satisfy 0 <= min_size <= max_size and max_size >= 1")
+
+        self.min_size = min_size
+        self.max_size = max_size
+        self.timeout = timeout
+        self.closed = False
+        self._connect_kwargs = connect_kwargs
+        self._idle = deque()
+
+        # One slot per connection, so checkouts wait instead of failing when the pool is full
+        self._slots = threading.BoundedSemaphore(max_size)
+        self._lock = threading.Lock()
+
+        # Statistics
+        self._in_use = 0
+        self._waiting = 0
+        self._checkouts = 0
+        self._timeouts = 0
+        self._opened = 0
+        self._discarded = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+
+        for _ in range(min_size):
+            self._idle.append(self._connect())
+
+    def _connect(self):
+        """Open a new connection to the database."""
+        conn = psycopg2.connect(**self._connect_kwargs)
+        with self._lock:
+            self._opened += 1
+        return conn
+
+    def getconn(self):
+        """
+        Check out a connection, waiting up to the configured timeout.
+
+        Returns:
+            Connection: psycopg2 connection object
+
+        Raises:
+            PoolError: If the pool is closed or no connection becomes available within the timeout
+        """
+        if self.closed:
+            raise PoolError("Connection pool is closed")
+
+        start = time.monotonic()
+        with self._lock:
+            self._waiting += 1
+
+        acquired = self._slots.acquire(timeout=self.timeout)
+        waited = time.monotonic() - start
+
+        with self._lock:
+            self._waiting -= 1
+            if not acquired:
+                self._timeouts += 1
+            else:
+                self._checkouts += 1
+                self._total_wait += waited
+                self._max_wait = max(self._max_wait, waited)
+
+        if not acquired:
+            raise PoolError(f"No database connection available after {self.timeout} seconds")
+
+        try:
+            conn = None
+            while conn is None:
+                with self._lock:
+                    conn = self._idle.pop() if self._idle else None
+                if conn is None:
+                    conn = self._connect()
+                elif conn.closed:
+                    # Connection closed while idle (e.g. after a server restart)
+                    with self._lock:
+                        self._discarded += 1
+                    conn = None
+        except Exception:
+            self._slots.release()
+            raise
+
+        with self._lock:
+            self._in_use += 1
+
+        return conn
+
+    def putconn(self, conn) -> None:
+        """
+        Return a connection to the pool.
+        Any open transaction is rolled back and broken connections are discarded.
+
+        Args:
+            conn: Connection previously obtained with getconn
+        """
+        discard = bool(conn.closed) or self.closed
+        if not discard:
+            try:
+                status = conn.info.transaction_status
+                if status == extensions.TRANSACTION_STATUS_UNKNOWN:
+                    # Server connection lost
+                    discard = True
+                elif status != extensions.TRANSACTION_STATUS_IDLE:
+                    conn.rollback()
+            except psycopg2.Error:
+                discard = True
+
+        try:
+            if discard:
+                if not conn.closed:
+                    conn.close()
+            else:
+                with self._lock:
+                    self._idle.append(conn)
+        finally:
+            with self._lock:
+                self._in_use -= 1
+                if discard:
+                    self._discarded += 1
+            self._slots.release()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get a snapshot of the pool usage statistics.
+
+        Returns:
+            Dictionary with connection counts and checkout wait times (in seconds)
+        """
+        with self._lock:
+            return {
+                'min_size': self.min_size,
+                'max_size': self.max_size,
+                'in_use': self._in_use,
+                'idle': len(self._idle),
+                'waiting': self._waiting,
+                'checkouts': self._checkouts,
+                'timeouts': self._timeouts,
+                'opened': self._opened,
+                'discarded': self._discarded,
+                'total_wait_time': round(self._total_wait, 6),
+                'avg_wait_time': round(self._total_wait / self._checkouts, 6) if self._checkouts else 0.0,
+                'max_wait_time': round(self._max_wait, 6),
+            }
+
+    def close(self) -> None:
+        """Close the idle connections. Connections still in use are closed when returned."""
+        with self._lock:
+            self.closed = True
+            idle = list(self._idle)
+            self._idle.clear()
+        for conn in idle:
+            if not conn.closed:
+                conn.close()
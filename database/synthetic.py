@@ -0,0 +1,450 @@
+"""
+Synthetic data generator, to see how the application behaves at scale.
+
+Generates reproducible, referentially consistent data for the six application
+tables: drivers, cars, weekly revenue of each driver per platform, monthly HR
+expenses of each driver, recurring car expenses (credit, fuel, tolls, washes,
+repairs) and recurring G&A expenses. Values are generated column by column
+with numpy and the DataFrames are sent with COPY (BaseService._copy_insert)
+in a single transaction.
+
+Usage:
+    python -m database.synthetic                       # 100 drivers, 300 cars, 5 years
+    python -m database.synthetic --scale 10 --truncate # 10x the data, replacing the current data
+    python -m database.synthetic --drivers 20 --cars 40 --years 1 --seed 7
+"""
+import argparse
+import time
+from datetime import date, timedelta
+from typing import Dict
+import numpy as np
+import pandas as pd
+import psycopg2
+from database.connection import get_db_connection
+from sections.drivers.service import DriverService
+from sections.cars.service import CarService
+from sections.revenues.service import RevenueService
+from sections.car_expenses.service import CarExpenseService
+from sections.hr_expenses.service import HRExpenseService
+from sections.ga_expenses.service import GAExpenseService
+
+FIRST_NAMES = [
+    "João", "Maria", "José", "Ana", "António", "Francisca", "Francisco", "Beatriz", "Manuel", "Inês",
+    "Pedro", "Mariana", "Rui", "Sofia", "Tiago", "Carolina", "Miguel", "Leonor", "Nuno", "Matilde",
+]
+LAST_NAMES = [
+    "Silva", "Santos", "Ferreira", "Pereira", "Oliveira", "Costa", "Rodrigues", "Martins", "Sousa", "Fernandes",
+    "Gonçalves", "Gomes", "Lopes", "Marques", "Alves", "Almeida", "Ribeiro", "Pinto", "Carvalho", "Teixeira",
+]
+LOCATIONS = ["Lisboa", "Porto", "Amadora", "Sintra", "Oeiras", "Almada", "Matosinhos", "Gaia", "Cascais", "Loures"]
+CARS = [
+    ("Toyota", "Corolla", "Standard"), ("Toyota", "Prius", "Economy"), ("Kia", "Niro", "Standard"),
+    ("Hyundai", "Ioniq", "Economy"), ("Tesla", "Model 3", "Premium"), ("Mercedes-Benz", "Classe E", "Luxury"),
+    ("Peugeot", "508", "Standard"), ("Skoda", "Octavia", "Economy"), ("BMW", "Série 5", "Luxury"),
+    ("Volkswagen", "Passat", "Premium"),
+]
+CAR_COSTS = {"Economy": 22000, "Standard": 28000, "Premium": 42000, "Luxury": 60000}
+
+# Platform -> (share of drivers working on it, mean weekly gross revenue, commission percentage)
+PLATFORMS = {
+    "Uber": (0.9, 850.0, 25.0),
+    "Bolt": (0.7, 600.0, 20.0),
+    "Transfer": (0.2, 450.0, 10.0),
+}
+
+# Car expense type -> (period in weeks, mean amount, VAT percentage, share of cars with the expense)
+CAR_EXPENSES = {
+    "Crédito": (None, 420.0, 23.0, 0.8),
+    "Combustível": (1, 140.0, 23.0, 1.0),
+    "Portagens": (None, 45.0, 23.0, 0.9),
+    "Lavagem": (2, 15.0, 23.0, 0.7),
+}
+# Mean number of repairs per car and year
+REPAIRS_PER_YEAR = 2
+
+# G&A expense type -> (months between payments, mean amount, VAT percentage)
+GA_EXPENSES = {
+    "Renda": (1, 1800.0, 23.0),
+    "Eletricidade": (1, 220.0, 23.0),
+    "Água": (1, 60.0, 6.0),
+    "Seguro": (12, 9500.0, None),
+    "Licenças - RNAVT": (12, 1200.0, None),
+    "Outros": (3, 350.0, 23.0),
+}
+
+# Generated tables in load order: parents before the tables referencing them
+TABLES = ('drivers', 'cars', 'revenue', 'car_expenses', 'hr_expenses', 'ga_expenses')
+
+
+def _iso(dates: pd.DatetimeIndex) -> np.ndarray:
+    """Format dates as YYYY-MM-DD strings."""
+    return np.asarray(dates.strftime('%Y-%m-%d'), dtype=object)
+
+
+def _money(rng: np.random.Generator, mean: float, size: int, spread: float = 0.25) -> np.ndarray:
+    """Draw positive amounts around a mean, rounded to cents."""
+    return np.round(np.maximum(rng.normal(mean, mean * spread, size), mean * 0.05), 2)
+
+
+def _nifs(rng: np.random.Generator, size: int) -> np.ndarray:
+    """Draw distinct valid NIFs of individuals (starting with 1 or 2)."""
+    bases = 10_000_000 + rng.choice(20_000_000, size=size, replace=False)
+    digits = (bases[:, None] // 10 ** np.arange(7, -1, -1)) % 10
+    check = 11 - (digits * np.arange(9, 1, -1)).sum(axis=1) % 11
+    check[check >= 10] = 0
+    return np.char.mod('%d', bases * 10 + check).astype(object)
+
+
+def _plates(rng: np.random.Generator, size: int) -> np.ndarray:
+    """Draw distinct license plates in the current format (AA-00-AA)."""
+    codes = rng.choice(26 * 26 * 100 * 26 * 26, size=size, replace=False)
+    letters = np.array(list("ABCDEFGHIJKLMNOPQRSTUVWXYZ"), dtype=object)
+    last, codes = codes % 676, codes // 676
+    number, first = codes % 100, codes // 100
+    return (
+        letters[first // 26] + letters[first % 26] + "-"
+        + np.char.mod('%02d', number).astype(object) + "-"
+        + letters[last // 26] + letters[last % 26]
+    )
+
+
+def generate_drivers(rng: np.random.Generator, count: int, start: date) -> pd.DataFrame:
+    """
+    Generate drivers with unique display names and NIFs.
+
+    Args:
+        rng: Random generator
+        count: Number of drivers
+        start: First day of the generated period
+
+    Returns:
+        DataFrame with one row per driver
+    """
+    first = rng.choice(FIRST_NAMES, count).astype(object)
+    last = rng.choice(LAST_NAMES, count).astype(object)
+    numbers = np.char.mod('%04d', np.arange(1, count + 1)).astype(object)
+    return pd.DataFrame({
+        'display_name': first + " " + last + " " + numbers,
+        'first_name': first,
+        'last_name': last,
+        'nif': _nifs(rng, count),
+        'niss': np.char.mod('%011d', rng.integers(10 ** 10, 2 * 10 ** 10, count)).astype(object),
+        'address_line1': np.char.mod('Rua %d', rng.integers(1, 300, count)).astype(object),
+        'postal_code': np.char.mod('%04d-', rng.integers(1000, 4999, count)).astype(object)
+            + np.char.mod('%03d', rng.integers(0, 999, count)).astype(object),
+        'location': rng.choice(LOCATIONS, count).astype(object),
+        'is_active': rng.random(count) < 0.9,
+        'created_at': _iso(pd.Timestamp(start) - pd.to_timedelta(rng.integers(1, 365, count), unit='D')),
+    })
+
+
+def generate_cars(rng: np.random.Generator, count: int, start: date) -> pd.DataFrame:
+    """
+    Generate cars with unique license plates, acquired in the year before the period.
+
+    Args:
+        rng: Random generator
+        count: Number of cars
+        start: First day of the generated period
+
+    Returns:
+        DataFrame with one row per car
+    """
+    models = rng.integers(0, len(CARS), count)
+    categories = np.array([CARS[i][2] for i in models], dtype=object)
+    acquired = _iso(pd.Timestamp(start) - pd.to_timedelta(rng.integers(1, 365, count), unit='D'))
+    return pd.DataFrame({
+        'license_plate': _plates(rng, count),
+        'brand': np.array([CARS[i][0] for i in models], dtype=object),
+        'model': np.array([CARS[i][1] for i in models], dtype=object),
+        'category': categories,
+        'acquisition_date': acquired,
+        'acquisition_cost': np.round(
+            np.array([CAR_COSTS[c] for c in categories]) * rng.uniform(0.85, 1.15, count), 2
+        ),
+        'is_active': rng.random(count) < 0.9,
+        'created_at': acquired,
+    })
+
+
+def generate_revenue(
+    rng: np.random.Generator,
+    driver_ids: np.ndarray,
+    car_ids: np.ndarray,
+    weeks: pd.DatetimeIndex
+) -> pd.DataFrame:
+    """
+    Generate one revenue row per driver, platform and week (Monday to Sunday).
+    Each driver works on some of the platforms, and drives the same car for a
+    year at a time.
+
+    Args:
+        rng: Random generator
+        driver_ids: IDs of the drivers
+        car_ids: IDs of the cars
+        weeks: Mondays of the generated weeks
+
+    Returns:
+        DataFrame with one row per weekly statement
+    """
+    frames = []
+    years = (weeks.year - weeks.year.min()).to_numpy()
+    # Car driven by each driver in each year of the period
+    cars = rng.choice(car_ids, size=(len(driver_ids), years.max() + 1))
+    # Weekly activity of each driver, so weeks off (holidays, sick days) are missing
+    for platform, (share, mean, commission) in PLATFORMS.items():
+        drivers = np.flatnonzero(rng.random(len(driver_ids)) < share)
+        driver_index = np.repeat(drivers, len(weeks))
+        week_index = np.tile(np.arange(len(weeks)), len(drivers))
+        worked = rng.random(driver_index.size) < 0.92
+        driver_index, week_index = driver_index[worked], week_index[worked]
+        size = driver_index.size
+
+        gross = _money(rng, mean, size, spread=0.35)
+        travels = np.maximum(np.round(gross / rng.uniform(9, 15, size)), 1).astype(int)
+        frames.append(pd.DataFrame({
+            'driver_id': driver_ids[driver_index],
+            'car_id': cars[driver_index, years[week_index]],
+            'platform': platform,
+            'start_date': _iso(weeks[week_index]),
+            'end_date': _iso(weeks[week_index] + pd.Timedelta(days=6)),
+            'gross_revenue': gross,
+            'commission_percentage': commission,
+            'tip': np.round(gross * rng.uniform(0, 0.05, size), 2),
+            'num_travels': travels,
+            'num_kilometers': np.round(travels * rng.uniform(6, 14, size), 2),
+            'created_at': _iso(weeks[week_index] + pd.to_timedelta(rng.integers(7, 11, size), unit='D')),
+        }))
+    return pd.concat(frames, ignore_index=True)
+
+
+def generate_hr_expenses(rng: np.random.Generator, driver_ids: np.ndarray, months: pd.DatetimeIndex) -> pd.DataFrame:
+    """
+    Generate one salary row per driver and month, paid on the 5th of the next month.
+
+    Args:
+        rng: Random generator
+        driver_ids: IDs of the drivers
+        months: First days of the generated months
+
+    Returns:
+        DataFrame with one row per driver and month
+    """
+    driver_index = np.repeat(np.arange(len(driver_ids)), len(months))
+    month_index = np.tile(np.arange(len(months)), len(driver_ids))
+    size = driver_index.size
+    starts = months[month_index]
+    # Salaries follow the minimum wage, raised every January
+    salaries = 820.0 + 45.0 * (starts.year - months.year.min()).to_numpy()
+    return pd.DataFrame({
+        'driver_id': driver_ids[driver_index],
+        'start_date': _iso(starts),
+        'end_date': _iso(starts + pd.offsets.MonthEnd(0)),
+        'payment_date': _iso(starts + pd.offsets.MonthBegin(1) + pd.Timedelta(days=4)),
+        'base_salary': np.round(salaries * rng.uniform(1.0, 1.2, size), 2),
+        'working_days': rng.integers(18, 23, size),
+        'meal_allowance_per_day': rng.choice([6.0, 7.63, 9.6], size),
+        'other_benefits': np.round(rng.choice([0.0, 0.0, 50.0, 100.0], size), 2),
+        'notes': None,
+        'created_at': _iso(starts + pd.offsets.MonthBegin(1) + pd.Timedelta(days=4)),
+    })
+
+
+def generate_car_expenses(
+    rng: np.random.Generator,
+    car_ids: np.ndarray,
+    weeks: pd.DatetimeIndex,
+    months: pd.DatetimeIndex
+) -> pd.DataFrame:
+    """
+    Generate the recurring expenses of the cars (monthly credit and tolls, weekly
+    fuel, washes every two weeks) and occasional repairs.
+
+    Args:
+        rng: Random generator
+        car_ids: IDs of the cars
+        weeks: Mondays of the generated weeks
+        months: First days of the generated months
+
+    Returns:
+        DataFrame with one row per expense
+    """
+    frames = []
+    for expense_type, (period_weeks, mean, vat, share) in CAR_EXPENSES.items():
+        if period_weeks is None:
+            starts, ends = months, months + pd.offsets.MonthEnd(0)
+        else:
+            starts = weeks[::period_weeks]
+            ends = starts + pd.Timedelta(days=7 * period_weeks - 1)
+        cars = np.flatnonzero(rng.random(len(car_ids)) < share)
+        car_index = np.repeat(cars, len(starts))
+        period_index = np.tile(np.arange(len(starts)), len(cars))
+        frames.append(pd.DataFrame({
+            'car_id': car_ids[car_index],
+            'expense_type': expense_type,
+            'start_date': _iso(starts[period_index]),
+            'end_date': _iso(ends[period_index]),
+            'amount': _money(rng, mean, car_index.size),
+            'vat': vat,
+            'description': None,
+        }))
+
+    repairs = rng.poisson(REPAIRS_PER_YEAR * len(weeks) / 52, len(car_ids))
+    car_index = np.repeat(np.arange(len(car_ids)), repairs)
+    days = rng.integers(0, len(weeks) * 7, car_index.size)
+    frames.append(pd.DataFrame({
+        'car_id': car_ids[car_index],
+        'expense_type': "Reparações",
+        'start_date': _iso(weeks[0] + pd.to_timedelta(days, unit='D')),
+        'end_date': None,
+        'amount': _money(rng, 350.0, car_index.size, spread=0.8),
+        'vat': 23.0,
+        'description': rng.choice(["Pneus", "Travões", "Revisão", "Embraiagem", "Chapa e pintura"], car_index.size),
+    }))
+
+    expenses = pd.concat(frames, ignore_index=True)
+    expenses['created_at'] = expenses['start_date']
+    return expenses
+
+
+def generate_ga_expenses(rng: np.random.Generator, months: pd.DatetimeIndex) -> pd.DataFrame:
+    """
+    Generate the recurring G&A expenses of the company.
+
+    Args:
+        rng: Random generator
+        months: First days of the generated months
+
+    Returns:
+        DataFrame with one row per expense
+    """
+    frames = []
+    for expense_type, (period_months, mean, vat) in GA_EXPENSES.items():
+        starts = months[::period_months]
+        ends = starts + pd.offsets.MonthBegin(period_months) - pd.Timedelta(days=1)
+        frames.append(pd.DataFrame({
+            'expense_type': expense_type,
+            'start_date': _iso(starts),
+            'end_date': _iso(ends),
+            'payment_date': _iso(starts + pd.Timedelta(days=7)),
+            'amount': _money(rng, mean, len(starts), spread=0.15),
+            'vat': vat,
+            'description': f"{expense_type} (gerado)",
+        }))
+    expenses = pd.concat(frames, ignore_index=True)
+    expenses['created_at'] = expenses['payment_date']
+    return expenses
+
+
+def generate(
+    drivers: int = 100,
+    cars: int = 300,
+    years: int = 5,
+    seed: int = 42,
+    end: date = None,
+    truncate: bool = False,
+    chunk_size: int = 50000
+) -> Dict[str, int]:
+    """
+    Generate and load a synthetic dataset in a single transaction.
+    The same arguments always generate the same data. Without truncate the data
+    is added to the current data, so the generated drivers and cars must not
+    clash with existing ones (by NIF, display name or license plate); loading
+    twice with the same seed always clashes.
+
+    Args:
+        drivers: Number of drivers
+        cars: Number of cars
+        years: Years of revenue and expenses
+        seed: Random seed
+        end: Last day of the period (defaults to the last Sunday before today)
+        truncate: Empty the six tables (and the import batches) before loading
+        chunk_size: Number of records sent per COPY statement
+
+    Returns:
+        Dictionary with the number of rows loaded per table
+
+    Raises:
+        ValueError: If a generated driver or car already exists (nothing is loaded)
+    """
+    rng = np.random.default_rng(seed)
+    end = end or date.today()
+    # Periods end on a Sunday, so weeks run from Monday to Sunday
+    end = end - timedelta(days=(end.weekday() + 1) % 7)
+    weeks = pd.date_range(end=pd.Timestamp(end) - pd.Timedelta(days=6), periods=52 * years, freq='7D')
+    months = pd.date_range(weeks[0] + pd.offsets.MonthBegin(0), pd.Timestamp(end), freq='MS')
+    # Only whole months, so monthly periods end within the period
+    months = months[months + pd.offsets.MonthEnd(0) <= pd.Timestamp(end)]
+
+    counts = {}
+    with get_db_connection() as conn:
+        with conn.cursor() as cur:
+            if truncate:
+                cur.execute(f"TRUNCATE {', '.join(TABLES)}, import_batches RESTART IDENTITY CASCADE")
+
+            try:
+                driver_ids = np.array(DriverService._copy_insert(cur, generate_drivers(rng, drivers, weeks[0].date()), chunk_size))
+                car_ids = np.array(CarService._copy_insert(cur, generate_cars(rng, cars, weeks[0].date()), chunk_size))
+            except psycopg2.errors.UniqueViolation as e:
+                raise ValueError(
+                    f"Os motoristas ou veículos gerados já existem ({e.diag.constraint_name}). "
+                    f"Use --truncate ou outra semente para gerar dados novos."
+                ) from e
+            counts['drivers'], counts['cars'] = len(driver_ids), len(car_ids)
+
+            tables = (
+                (RevenueService, lambda: generate_revenue(rng, driver_ids, car_ids, weeks)),
+                (CarExpenseService, lambda: generate_car_expenses(rng, car_ids, weeks, months)),
+                (HRExpenseService, lambda: generate_hr_expenses(rng, driver_ids, months)),
+                (GAExpenseService, lambda: generate_ga_expenses(rng, months)),
+            )
+            for service_class, build in tables:
+                counts[service_class.table_name] = len(service_class._copy_insert(cur, build(), chunk_size))
+
+            # Fresh statistics, so the planner sees the new volume right away
+            for table in TABLES:
+                cur.execute(f"ANALYZE {table}")
+        conn.commit()
+
+    for service_class in (DriverService, CarService, RevenueService, CarExpenseService, HRExpenseService, GAExpenseService):
+        service_class._invalidate_cache()
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Gerar dados sintéticos para testes de escala")
+    parser.add_argument("--drivers", type=int, default=100, help="Número de motoristas")
+    parser.add_argument("--cars", type=int, default=300, help="Número de veículos")
+    parser.add_argument("--years", type=int, default=5, help="Anos de receitas e despesas")
+    parser.add_argument("--scale", type=int, default=1, help="Multiplica o número de motoristas e veículos")
+    parser.add_argument("--seed", type=int, default=42, help="Semente aleatória (os mesmos argumentos geram os mesmos dados)")
+    parser.add_argument("--end", type=date.fromisoformat, default=None, help="Último dia do período (AAAA-MM-DD)")
+    parser.add_argument(
+        "--truncate", action="store_true",
+        help="Apagar os dados atuais das tabelas antes de carregar (sem esta opção, "
+             "carregar duas vezes com a mesma semente falha nos motoristas e veículos repetidos)"
+    )
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    try:
+        counts = generate(
+            drivers=args.drivers * args.scale,
+            cars=args.cars * args.scale,
+            years=args.years,
+            seed=args.seed,
+            end=args.end,
+            truncate=args.truncate,
+        )
+    except ValueError as e:
+        parser.exit(1, f"{e}\n")
+    elapsed = time.perf_counter() - start
+
+    for table, count in counts.items():
+        print(f"{table:<14} {count:>10} registos")
+    total = sum(counts.values())
+    print(f"{'total':<14} {total:>10} registos em {elapsed:.1f} s ({total / elapsed:.0f} registos/s)")
+
+
+if __name__ == "__main__":
+    main()
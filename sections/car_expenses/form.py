@@ -2,7 +2,7 @@ import streamlit as st
 from utils.error_handlers import handle_streamlit_error
 from utils.form_builder import FormBuilder
 from datetime import date
-from sections.cars.service import CarService
+from utils.reference_data import get_car_options
 
 # Dictionary to map between Portuguese and English expense types
 car_expense_types = [
@@ -25,16 +25,10 @@ def car_expense_form(existing_data=None):
 
     # Car selection
     try:
-        cars = CarService.get_many(conditions={'is_active': True})
-        if cars.empty:
-            car_options = {}
+        # Shared map of active cars (id -> license plate)
+        car_options = get_car_options()
+        if not car_options:
             st.warning("Não existem veículos disponíveis no sistema")
-        else:
-            # Create a dictionary for car selection
-            car_options = {
-                car['id']: car['license_plate']
-                for _, car in cars.iterrows()
-            }
 
         form.create_field(
             key="car_id",
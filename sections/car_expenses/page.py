@@ -3,6 +3,8 @@ import pandas as pd
 from sections.car_expenses.service import CarExpenseService
 from utils.error_handlers import handle_streamlit_error
 from utils.navigation import switch_page
+from utils.pagination import paginate, pagination_controls
+from utils.export import export_controls
 from sections.car_expenses.delete import delete_car_expense, bulk_delete_car_expenses
 
 
@@ -125,22 +127,8 @@ def show_car_expenses_view():
         )
 
     if submit_button or "car_expenses_data_loaded" in st.session_state:
-        with st.spinner("A carregar dados...", show_time=True):
-            try:
-                df = CarExpenseService.get_many()
-                # Store the loaded data in session state to persist between reruns
-                st.session_state.car_expenses_data_loaded = True
-
-                if df.empty:
-                    st.info("Não existem despesas de veículos registadas no sistema.")
-                    return
-
-            except Exception as e:
-                st.error(f"Erro ao carregar despesas de veículos: {str(e)}")
-                return
-
-        # Apply filters
-        filtered_df = df.copy()
+        # Build the filters so that the database only returns matching rows
+        conditions = {}
 
         # Map UI options to database values
         expense_type_map = {
@@ -156,30 +144,32 @@ def show_car_expenses_view():
             english_filter = expense_type_map.get(
                 expense_type_filter, expense_type_filter
             )
-            filtered_df = filtered_df[filtered_df["expense_type"] == english_filter]
+            conditions["expense_type"] = english_filter
 
         if license_plate_filter:
-            license_plate_filter = license_plate_filter.lower()
-            filtered_df = filtered_df[
-                filtered_df["license_plate"]
-                .str.lower()
-                .str.contains(license_plate_filter, na=False)
-            ]
+            conditions["license_plate"] = {"contains": license_plate_filter}
 
         if len(date_range) == 2:
             if date_filter_type == "Datas de Início/Fim":
-                filtered_df = filtered_df[
-                    (filtered_df["start_date"] >= pd.to_datetime(date_range[0]))
-                    & (
-                        (filtered_df["end_date"].isna())
-                        | (filtered_df["end_date"] <= pd.to_datetime(date_range[1]))
-                    )
-                ]
+                conditions["start_date"] = {"gte": date_range[0]}
+                conditions["end_date"] = {"lte": date_range[1], "or_null": True}
             else:  # Data de Registo
-                filtered_df = filtered_df[
-                    (filtered_df["created_at"] >= pd.to_datetime(date_range[0]))
-                    & (filtered_df["created_at"] <= pd.to_datetime(date_range[1]))
-                ]
+                conditions["created_at"] = {"between": (date_range[0], date_range[1])}
+
+        with st.spinner("A carregar dados...", show_time=True):
+            try:
+                page = paginate("car_expenses", CarExpenseService, filters=conditions)
+                filtered_df = page["data"]
+                # Store the loaded data in session state to persist between reruns
+                st.session_state.car_expenses_data_loaded = True
+
+                if filtered_df.empty and not conditions:
+                    st.info("Não existem despesas de veículos registadas no sistema.")
+                    return
+
+            except Exception as e:
+                st.error(f"Erro ao carregar despesas de veículos: {str(e)}")
+                return
 
         # Store filtered IDs for bulk delete
         filtered_ids = filtered_df["id"].tolist() if not filtered_df.empty else []
@@ -193,12 +183,14 @@ def show_car_expenses_view():
                     on_click=bulk_delete_car_expenses,
                     type="tertiary",
                     args=(filtered_ids,),
-                    help=f"Eliminar todas as {len(filtered_ids)} despesas de veículo filtradas",
+                    help=f"Eliminar todas as {len(filtered_ids)} despesas de veículo filtradas nesta página",
                     use_container_width=True,
                 )
 
         # Display results summary
-        st.subheader(f"Resultados: {len(filtered_df)} despesas de veículos encontradas")
+        st.subheader(f"Resultados: {len(filtered_df)} despesas de veículos encontradas (página {page['page_number']})")
+        if page["approx_total"] is not None:
+            st.caption(f"Aproximadamente {page['approx_total']} registos no total")
 
         # Table header
         header_cols = st.columns([2.5, 1.5, 1.5, 1.5, 1.5, 1.5, 1, 1])
@@ -218,6 +210,16 @@ def show_car_expenses_view():
             
             car_expense_row(expense)
 
+        pagination_controls("car_expenses", page)
+
+        # Export every record matching the filters, not only this page
+        export_controls(
+            "car_expenses",
+            lambda: CarExpenseService.get_many(conditions=conditions),
+            "despesas_veiculos",
+            filters=conditions,
+        )
+
 
 # Execute the function if this file is run directly
 show_car_expenses_view()
@@ -1,6 +1,6 @@
 import pandas as pd
-from typing import Dict
-from database.connection import get_db_connection, get_db_engine
+from typing import Dict, List
+from database.connection import get_db_connection
 from utils.base_service import BaseService
 from utils.error_handlers import handle_service_error
 
@@ -13,102 +13,112 @@ class CarExpenseService(BaseService):
     table_name = 'car_expenses'
     primary_key = 'id'
     default_order_by = 'start_date DESC'
+    columns = (
+        'car_id', 'expense_type', 'start_date', 'end_date', 'amount', 'vat',
+        'description', 'created_at', 'updated_at', 'import_batch_id',
+        'fingerprint',
+    )
+    joined_tables = ('cars',)
+    table_alias = 'e'
+    updated_at_column = 'updated_at'
+    import_batch_column = 'import_batch_id'
+    fingerprint_column = 'fingerprint'
+    fingerprint_fields = (
+        'car_id', 'expense_type', 'start_date', 'end_date', 'amount', 'vat',
+        'description',
+    )
+    column_expressions = {
+        'license_plate': 'c.license_plate',
+        'brand': 'c.brand',
+        'model': 'c.model',
+    }
+    # Listing query shared by get_many and get_page: default SELECT list and FROM clause
+    _list_columns = """
+        e.id, e.car_id, e.expense_type, e.start_date, e.end_date,
+        e.amount, e.vat, e.description, e.created_at, e.updated_at,
+        c.license_plate, c.brand, c.model
+    """
+    _list_from = """
+        FROM car_expenses e
+        JOIN cars c ON e.car_id = c.id
+    """
 
-    @classmethod
-    @handle_service_error("Error updating car expense")
-    def update(cls, expense_id: int, data: Dict) -> bool:
-        """
-        Update an existing car expense record with validation.
-        
-        Args:
-            expense_id: ID of the expense to update
-            data: Dictionary containing car expense data
-            
-        Returns:
-            True if successful
-            
-        Raises:
-            Exception: If validation fails or update error occurs
-        """
-        # Add updated_at field to the data
-        data_copy = data.copy()
-        data_copy['updated_at'] = 'CURRENT_TIMESTAMP'
-        
-        # Use the base class update method
-        return super().update(expense_id, data_copy)
-    
     @classmethod
     @handle_service_error("Error getting car expense")
-    def get(cls, expense_id: int) -> Dict:
+    def get(cls, expense_id: int, columns: List[str] = None) -> Dict:
         """
         Get a specific car expense record by ID, including car info.
         This method needs custom implementation due to the JOIN with cars table.
         
         Args:
             expense_id: ID of the expense to retrieve
+            columns: Names of the columns to return (defaults to all listing columns)
             
         Returns:
-            Dictionary containing expense data or None if not found
+            Dictionary containing expense data (with 'car_name' when brand and model
+            are selected) or None if not found
             
         Raises:
             Exception: If query error occurs
         """
         with get_db_connection() as conn:
             with conn.cursor() as cur:
-                cur.execute("""
-                    SELECT 
-                        e.id, e.car_id, e.expense_type, e.start_date, e.end_date,
-                        e.amount, e.vat, e.description, e.created_at, e.updated_at,
-                        c.license_plate, c.brand, c.model
-                    FROM car_expenses e
-                    JOIN cars c ON e.car_id = c.id
+                cur.execute(f"""
+                    SELECT {cls._select_list(columns, cls._list_columns)}
+                    {cls._list_from}
                     WHERE e.id = %s
                 """, (expense_id,))
                 result = cur.fetchone()
                 if result:
-                    return {
-                        'id': result[0],
-                        'car_id': result[1],
-                        'expense_type': result[2],
-                        'start_date': result[3],
-                        'end_date': result[4],
-                        'amount': float(result[5]),
-                        'vat': float(result[6]) if result[6] is not None else None,
-                        'description': result[7],
-                        'created_at': result[8],
-                        'updated_at': result[9],
-                        'license_plate': result[10],
-                        'car_name': f"{result[11]} {result[12]}"  # brand + model
-                    }
+                    record = dict(zip([desc[0] for desc in cur.description], result))
+                    for col in ('amount', 'vat'):
+                        if record.get(col) is not None:
+                            record[col] = float(record[col])
+                    if 'brand' in record and 'model' in record:
+                        record['car_name'] = f"{record['brand']} {record['model']}"
+                    return record
         return None
     
     @classmethod
     @handle_service_error("Error loading car expenses")
-    def get_many(cls) -> pd.DataFrame:
+    def get_many(cls, conditions: Dict = None, order_by: str = None, columns: List[str] = None) -> pd.DataFrame:
         """
-        Load all car expense records with car details.
+        Load car expense records with car details.
         Custom implementation needed due to JOIN and calculations.
         
+        Args:
+            conditions: Filter specification for the WHERE clause (see utils.query_filters).
+                Besides expense columns, accepts license_plate, brand and model
+            order_by: Column name to order by
+            columns: Names of the columns to return (defaults to all listing columns)
+            
         Returns:
             DataFrame containing expense data
             
         Raises:
             Exception: If query error occurs
         """
-        query = """
-            SELECT 
-                e.id, e.car_id, e.expense_type, e.start_date, e.end_date,
-                e.amount, e.vat, e.description, e.created_at, e.updated_at,
-                c.license_plate, c.brand, c.model
-            FROM car_expenses e
-            JOIN cars c ON e.car_id = c.id
-            ORDER BY e.start_date DESC
+        query = f"SELECT {cls._select_list(columns, cls._list_columns)} {cls._list_from}"
+        where_clause, params = cls._build_where(conditions)
+        query += where_clause
+        query += cls._order_by_clause(order_by)
+        
+        df = cls._read_sql(query, tuple(params) if params else None)
+        return cls._add_totals(df)
+    
+    @classmethod
+    def _add_totals(cls, df: pd.DataFrame) -> pd.DataFrame:
         """
-        engine = get_db_engine()
-        df = pd.read_sql_query(query, engine)
+        Add the computed VAT and car name columns to a listing DataFrame.
         
-        # Calculate total with VAT if applicable
-        if not df.empty:
+        Args:
+            df: DataFrame returned by the listing query
+            
+        Returns:
+            DataFrame with vat_amount, total_with_vat and car_name columns
+        """
+        # Calculate total with VAT if applicable (only when the needed columns were selected)
+        if not df.empty and {'amount', 'vat', 'brand', 'model'}.issubset(df.columns):
             # Calculate the VAT amount where VAT is not null
             df['vat_amount'] = df['amount'] * df['vat'].fillna(0) / 100
             df['total_with_vat'] = (df['amount'] + df['vat_amount']).round(2)
@@ -117,6 +127,33 @@ class CarExpenseService(BaseService):
             df['car_name'] = df['brand'] + ' ' + df['model']
             
         return df
+
+    @classmethod
+    @handle_service_error("Error loading car expenses page")
+    def get_page(
+        cls,
+        filters: Dict = None,
+        order_by: str = None,
+        after_key: str = None,
+        limit: int = 50,
+        with_total: bool = False
+    ) -> Dict:
+        """
+        Load one page of car expense records with car details using keyset pagination.
+        
+        Args:
+            filters: Filter specification (see get_many)
+            order_by: Order by expression (defaults to start_date DESC)
+            after_key: Cursor returned by the previous page, None for the first page
+            limit: Maximum number of rows in the page
+            with_total: Whether to include an approximate total row count
+            
+        Returns:
+            Dictionary with 'data', 'next_cursor' and 'approx_total'
+        """
+        page = cls._fetch_page(f"SELECT {cls._list_columns} {cls._list_from}", filters, order_by, after_key, limit, with_total)
+        page['data'] = cls._add_totals(page['data'])
+        return page
     
     @classmethod
     @handle_service_error("Error getting expense summary by car")
@@ -157,8 +194,7 @@ class CarExpenseService(BaseService):
             
         query += " GROUP BY c.license_plate, c.brand, c.model ORDER BY total_amount DESC"
         
-        engine = get_db_engine()
-        df = pd.read_sql_query(query, engine, params=params)
+        df = cls._read_sql(query, params)
         
         # Convert to a more usable format
         result = {
@@ -193,7 +229,7 @@ class CarExpenseService(BaseService):
         Raises:
             Exception: If query error occurs
         """
-        from datetime import datetime
+        from datetime import date, datetime
         
         # Default to current year if not specified
         if year is None:
@@ -205,13 +241,13 @@ class CarExpenseService(BaseService):
                 expense_type,
                 SUM(amount) as total_amount
             FROM car_expenses
-            WHERE EXTRACT(YEAR FROM start_date) = %s
+            WHERE start_date >= %s AND start_date < %s
             GROUP BY month, expense_type
             ORDER BY month, expense_type
         """
         
-        engine = get_db_engine()
-        df = pd.read_sql_query(query, engine, params=(year,))
+        # A plain date range (instead of EXTRACT(YEAR ...)) can use the start_date index
+        df = cls._read_sql(query, (date(year, 1, 1), date(year + 1, 1, 1)))
         
         # Initialize result with all months
         months = list(range(1, 13))
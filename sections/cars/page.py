@@ -3,6 +3,7 @@ import pandas as pd
 from sections.cars.service import CarService
 from utils.error_handlers import handle_streamlit_error
 from utils.navigation import switch_page
+from utils.export import export_controls
 from sections.cars.delete import delete_car, bulk_delete_cars
 
 
@@ -114,17 +115,29 @@ def show_cars_view():
         )
     
     if submit_button or "cars_data_loaded" in st.session_state:
+        # Build the filters so that the database only returns matching rows
+        conditions = {}
+
+        if brand_filter:
+            conditions["brand"] = {"contains": brand_filter}
+
+        if category_filter != "Todas":
+            conditions["category"] = category_filter
+
+        if is_active_filter:
+            conditions["is_active"] = True
+
         with st.spinner("A carregar dados...", show_time=True):
             try:
-                df = CarService.get_many()
+                filtered_df = CarService.get_many(conditions=conditions)
                 # Store the loaded data in session state to persist between reruns
                 st.session_state.cars_data_loaded = True
 
                 # Add 'is_active' column if it doesn't exist in the returned DataFrame
-                if "is_active" not in df.columns:
-                    df["is_active"] = True
+                if "is_active" not in filtered_df.columns:
+                    filtered_df["is_active"] = True
 
-                if df.empty:
+                if filtered_df.empty and not conditions:
                     st.info("Não existem veículos registados no sistema.")
                     return
 
@@ -132,21 +145,6 @@ def show_cars_view():
                 st.error(f"Erro ao carregar veículos: {str(e)}")
                 return
 
-        # Apply filters
-        filtered_df = df.copy()
-
-        if brand_filter:
-            brand_filter = brand_filter.lower()
-            filtered_df = filtered_df[
-                filtered_df["brand"].str.lower().str.contains(brand_filter)
-            ]
-
-        if category_filter != "Todas":
-            filtered_df = filtered_df[filtered_df["category"] == category_filter]
-
-        if is_active_filter and "is_active" in filtered_df.columns:
-            filtered_df = filtered_df[filtered_df["is_active"]]
-
         # Store filtered IDs for bulk delete
         filtered_ids = filtered_df["id"].tolist() if not filtered_df.empty else []
             
@@ -170,6 +168,8 @@ def show_cars_view():
         for i, (_, car) in enumerate(filtered_df.iterrows()):
             car_card(car)
 
+        export_controls("cars", lambda: filtered_df, "veiculos", filters=conditions)
+
 
 # Execute the function
 show_cars_view()
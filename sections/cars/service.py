@@ -1,6 +1,5 @@
 import pandas as pd
 from typing import Dict, List, Tuple
-from database.connection import get_db_engine
 from utils.base_service import BaseService
 from utils.error_handlers import handle_service_error
 
@@ -12,9 +11,16 @@ class CarService(BaseService):
     table_name = 'cars'
     primary_key = 'id'
     default_order_by = 'license_plate'
+    columns = (
+        'license_plate', 'brand', 'model', 'category', 'acquisition_date',
+        'acquisition_cost', 'is_active', 'created_at', 'updated_at',
+    )
+    natural_keys = (('license_plate',),)
+    updated_at_column = 'updated_at'
     
     # Standard methods inherited from BaseService:
     # insert(data)
+    # upsert_many(records) - keyed on license_plate
     # update(record_id, data)
     # delete(record_id)
     # get(record_id)
@@ -31,7 +37,6 @@ class CarService(BaseService):
         Returns:
             List of tuples containing (id, license_plate, brand, model) for each car
         """
-        engine = get_db_engine()
         query = """
             SELECT id, license_plate, brand, model 
             FROM cars 
@@ -39,7 +44,7 @@ class CarService(BaseService):
             ORDER BY license_plate
         """
         
-        df = pd.read_sql_query(query, engine)
+        df = cls._read_sql(query)
         return list(df.itertuples(index=False, name=None))
     
     @classmethod
@@ -62,17 +67,16 @@ class CarService(BaseService):
         Returns:
             Dictionary with statistics
         """
-        engine = get_db_engine()
         stats = {}
         
         # Total cars
         query = "SELECT COUNT(*) FROM cars"
-        df = pd.read_sql_query(query, engine)
+        df = cls._read_sql(query)
         stats['total_cars'] = df.iloc[0, 0]
         
         # Cars by category
         query = "SELECT category, COUNT(*) FROM cars GROUP BY category"
-        df = pd.read_sql_query(query, engine)
+        df = cls._read_sql(query)
         stats['cars_by_category'] = df.set_index('category').to_dict()['count']
         
         return stats
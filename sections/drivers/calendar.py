@@ -9,6 +9,7 @@ from sections.revenues.service import RevenueService
 from utils.navigation import check_query_params
 from utils.error_handlers import handle_streamlit_error
 from utils.type_helpers import date_to_iso8601
+from utils.reference_data import get_driver_options
 
 @handle_streamlit_error()
 def get_selected_driver():
@@ -35,14 +36,11 @@ def get_selected_driver():
     
     # Get all active drivers
     try:
-        drivers_df = DriverService.get_many(conditions={'is_active': True})
+        driver_options = get_driver_options()
         
-        if drivers_df.empty:
+        if not driver_options:
             st.warning("Não existem motoristas ativos no sistema.")
             return None, None
-            
-        # Create selection list
-        driver_options = {row['id']: row['display_name'] for _, row in drivers_df.iterrows()}
         
         # Selection widget
         selected_id = st.selectbox(
@@ -136,7 +134,10 @@ def show_driver_calendar():
     conditions = {
         'driver_id': driver_id,
     }
-    revenues_df = RevenueService.get_many(conditions=conditions)
+    revenues_df = RevenueService.get_many(
+        conditions=conditions,
+        columns=['start_date', 'end_date', 'license_plate', 'gross_revenue', 'num_kilometers', 'num_travels'],
+    )
     revenues_df = revenues_df.groupby(['start_date', 'end_date', 'license_plate'], as_index=False)[['gross_revenue', 'num_kilometers', 'num_travels']].sum()
     
     if revenues_df.empty:
@@ -3,6 +3,7 @@ import pandas as pd
 from sections.drivers.service import DriverService
 from utils.error_handlers import handle_streamlit_error
 from utils.navigation import switch_page
+from utils.export import export_controls
 from sections.drivers.delete import delete_driver, bulk_delete_drivers
 
 
@@ -120,13 +121,22 @@ def show_drivers_view():
         )
     
     if submit_button or "drivers_data_loaded" in st.session_state:
+        # Build the filters so that the database only returns matching rows
+        conditions = {}
+
+        if display_name_filter:
+            conditions["display_name"] = {"contains": display_name_filter}
+
+        if is_active_filter:
+            conditions["is_active"] = True
+
         with st.spinner("A carregar dados...", show_time=True):
             try:
-                df = DriverService.get_many()
+                filtered_df = DriverService.get_many(conditions=conditions)
                 # Store the loaded data in session state to persist between reruns
                 st.session_state.drivers_data_loaded = True
 
-                if df.empty:
+                if filtered_df.empty and not conditions:
                     st.info("Não existem motoristas registados no sistema.")
                     return
 
@@ -134,20 +144,6 @@ def show_drivers_view():
                 st.error(f"Erro ao carregar motoristas: {str(e)}")
                 return
 
-        # Apply filters
-        filtered_df = df.copy()
-
-        if display_name_filter:
-            display_name_filter = display_name_filter.lower()
-            filtered_df = filtered_df[
-                filtered_df["display_name"]
-                .str.lower()
-                .str.contains(display_name_filter)
-            ]
-
-        if is_active_filter:
-            filtered_df = filtered_df[filtered_df["is_active"]]
-
         # Store filtered IDs for bulk delete
         filtered_ids = filtered_df["id"].tolist() if not filtered_df.empty else []
             
@@ -171,6 +167,8 @@ def show_drivers_view():
         for i, (_, driver) in enumerate(filtered_df.iterrows()):
             driver_card(driver)
 
+        export_controls("drivers", lambda: filtered_df, "motoristas", filters=conditions)
+
 
 # Execute the function
 show_drivers_view()
@@ -1,4 +1,5 @@
 import pandas as pd
+import psycopg2
 from typing import Dict
 from database.connection import get_db_connection
 from utils.base_service import BaseService
@@ -12,13 +13,20 @@ class DriverService(BaseService):
     table_name = 'drivers'
     primary_key = 'id'
     default_order_by = 'display_name'
+    columns = (
+        'display_name', 'first_name', 'last_name', 'nif', 'niss',
+        'address_line1', 'address_line2', 'postal_code', 'location',
+        'is_active', 'created_at', 'updated_at',
+    )
+    natural_keys = (('nif',), ('display_name',))
+    updated_at_column = 'updated_at'
     
     @classmethod
     @handle_service_error("Erro ao inserir motorista")
     def insert(cls, data: Dict) -> bool:
         """
         Insert a new driver with enhanced information.
-        Validates uniqueness constraints before insertion.
+        Uniqueness of the name and NIF is enforced by the database constraints.
         
         Args:
             data: Dictionary containing driver data
@@ -29,18 +37,10 @@ class DriverService(BaseService):
         Raises:
             Exception: If validation fails or insertion error occurs
         """
-        # Check if display_name or nif already exists
-        with get_db_connection() as conn:
-            with conn.cursor() as cur:
-                cur.execute(
-                    "SELECT id FROM drivers WHERE display_name = %s OR nif = %s",
-                    (data['display_name'], data['nif'])
-                )
-                result = cur.fetchone()
-                if result:
-                    raise ValueError("Já existe um motorista com o mesmo Nome ou NIF")
-        # If validation passes, use the base class insert method
-        return super().insert(data)
+        try:
+            return super().insert(data)
+        except psycopg2.errors.UniqueViolation:
+            raise ValueError("Já existe um motorista com o mesmo Nome ou NIF")
 
     @classmethod
     @handle_service_error("Erro ao atualizar motorista")
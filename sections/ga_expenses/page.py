@@ -3,6 +3,8 @@ import pandas as pd
 from sections.ga_expenses.service import GAExpenseService
 from utils.error_handlers import handle_streamlit_error
 from utils.navigation import switch_page
+from utils.pagination import paginate, pagination_controls
+from utils.export import export_controls
 from sections.ga_expenses.delete import delete_ga_expense, bulk_delete_ga_expenses
 from sections.ga_expenses.form import expense_type_options
 
@@ -130,49 +132,36 @@ def show_ga_expenses_view():
         )
 
     if submit_button or "ga_expenses_data_loaded" in st.session_state:
+        # Construir os filtros para que a base de dados devolva apenas os registos pretendidos
+        conditions = {}
+
+        if expense_type_filter != "Todos":
+            conditions["expense_type"] = expense_type_filter
+
+        if description_filter:
+            conditions["description"] = {"contains": description_filter}
+
+        if len(date_range) == 2:
+            if date_filter_type == "Datas de Início/Fim":
+                conditions["start_date"] = {"gte": date_range[0]}
+                conditions["end_date"] = {"lte": date_range[1], "or_null": True}
+            else:  # Data de Pagamento
+                conditions["payment_date"] = {"between": (date_range[0], date_range[1])}
+
         with st.spinner("A carregar dados...", show_time=True):
             try:
-                df = GAExpenseService.get_many()
+                page = paginate("ga_expenses", GAExpenseService, filters=conditions)
+                filtered_df = page["data"]
                 # Store the loaded data in session state to persist between reruns
                 st.session_state.ga_expenses_data_loaded = True
 
-                if df.empty:
+                if filtered_df.empty and not conditions:
                     st.info("Não existem despesas G&A registadas no sistema.")
                     return
 
             except Exception as e:
                 st.error(f"Erro ao carregar despesas G&A: {str(e)}")
                 return
-
-        # Apply filters
-        filtered_df = df.copy()
-
-        if expense_type_filter != "Todos":
-            filt = filtered_df["expense_type"] == expense_type_filter
-            filtered_df = filtered_df[filt]
-
-        if description_filter:
-            description_filter = description_filter.lower()
-            filtered_df = filtered_df[
-                filtered_df["description"]
-                .str.lower()
-                .str.contains(description_filter, na=False)
-            ]
-
-        if len(date_range) == 2:
-            if date_filter_type == "Datas de Início/Fim":
-                filtered_df = filtered_df[
-                    (filtered_df["start_date"] >= pd.to_datetime(date_range[0]))
-                    & (
-                        (filtered_df["end_date"].isna())
-                        | (filtered_df["end_date"] <= pd.to_datetime(date_range[1]))
-                    )
-                ]
-            else:  # Data de Pagamento
-                filtered_df = filtered_df[
-                    (filtered_df["payment_date"] >= pd.to_datetime(date_range[0]))
-                    & (filtered_df["payment_date"] <= pd.to_datetime(date_range[1]))
-                ]
         
         # Armazenar os IDs filtrados
         filtered_ids = filtered_df["id"].tolist() if not filtered_df.empty else []
@@ -187,12 +176,14 @@ def show_ga_expenses_view():
                     on_click=bulk_delete_ga_expenses,
                     type="tertiary",
                     args=(filtered_ids,),
-                    help=f"Eliminar todas as {len(filtered_ids)} despesas G&A filtradas",
+                    help=f"Eliminar todas as {len(filtered_ids)} despesas G&A filtradas nesta página",
                     use_container_width=True,
                 )
 
         # Display results summary
-        st.subheader(f"Resultados: {len(filtered_df)} despesas G&A encontradas")
+        st.subheader(f"Resultados: {len(filtered_df)} despesas G&A encontradas (página {page['page_number']})")
+        if page["approx_total"] is not None:
+            st.caption(f"Aproximadamente {page['approx_total']} registos no total")
 
         # Table header
         header_cols = st.columns([2.5, 1.5, 1.5, 1.5, 1.5, 1.5, 1, 1])
@@ -210,6 +201,16 @@ def show_ga_expenses_view():
         for i, (_, expense) in enumerate(filtered_df.iterrows()):
             ga_expense_row(expense)
 
+        pagination_controls("ga_expenses", page)
+
+        # Export every record matching the filters, not only this page
+        export_controls(
+            "ga_expenses",
+            lambda: GAExpenseService.get_many(conditions=conditions),
+            "despesas_gerais",
+            filters=conditions,
+        )
+
 
 # Execute the function if this file is run directly
 show_ga_expenses_view()
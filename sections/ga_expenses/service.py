@@ -1,6 +1,4 @@
-import pandas as pd
 from typing import Dict
-from database.connection import get_db_engine
 from utils.base_service import BaseService
 from utils.error_handlers import handle_service_error
 
@@ -13,6 +11,18 @@ class GAExpenseService(BaseService):
     table_name = 'ga_expenses'
     primary_key = 'id'
     default_order_by = 'start_date DESC'
+    columns = (
+        'expense_type', 'start_date', 'end_date', 'payment_date', 'amount',
+        'vat', 'description', 'created_at', 'updated_at', 'import_batch_id',
+        'fingerprint',
+    )
+    updated_at_column = 'updated_at'
+    import_batch_column = 'import_batch_id'
+    fingerprint_column = 'fingerprint'
+    fingerprint_fields = (
+        'expense_type', 'start_date', 'end_date', 'payment_date', 'amount',
+        'vat', 'description',
+    )
 
     @classmethod
     @handle_service_error("Error getting expense summary")
@@ -51,8 +61,7 @@ class GAExpenseService(BaseService):
             
         query += " GROUP BY expense_type ORDER BY total_amount DESC"
         
-        engine = get_db_engine()
-        df = pd.read_sql_query(query, engine, params=params)
+        df = cls._read_sql(query, params)
         
         # Convert to a more usable format
         result = {
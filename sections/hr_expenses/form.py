@@ -2,7 +2,7 @@ import streamlit as st
 from utils.error_handlers import handle_streamlit_error
 from utils.form_builder import FormBuilder
 from sections.hr_expenses.service import HRExpenseService
-from sections.drivers.service import DriverService
+from utils.reference_data import get_driver_options
 
 
 @handle_streamlit_error()
@@ -16,13 +16,10 @@ def hr_expense_form(existing_data=None):
 
     # Driver selection
     try:
-        drivers = DriverService.get_many(conditions={'is_active': True})
-        if drivers.empty:
-            driver_options = {}
+        # Shared map of active drivers (id -> display name)
+        driver_options = get_driver_options()
+        if not driver_options:
             st.warning("Não existem motoristas registados no sistema")
-        else:
-            # Create a dictionary for driver selection
-            driver_options = {driver['id']: driver['display_name'] for _, driver in drivers.iterrows()}
 
         form.create_field(
             key="driver_id",
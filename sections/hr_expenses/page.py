@@ -3,6 +3,8 @@ import pandas as pd
 from sections.hr_expenses.service import HRExpenseService
 from utils.error_handlers import handle_streamlit_error
 from utils.navigation import switch_page
+from utils.pagination import paginate, pagination_controls
+from utils.export import export_controls
 from sections.hr_expenses.delete import delete_hr_expense, bulk_delete_hr_expenses
 
 
@@ -99,13 +101,23 @@ def show_hr_expenses_view():
         )
 
     if submit_button or "hr_expenses_data_loaded" in st.session_state:
+        # Build the filters so that the database only returns matching rows
+        conditions = {}
+
+        if driver_filter:
+            conditions["driver_name"] = {"contains": driver_filter}
+
+        if len(date_range) == 2:
+            conditions["payment_date"] = {"between": (date_range[0], date_range[1])}
+
         with st.spinner("A carregar dados...", show_time=True):
             try:
-                df = HRExpenseService.get_many()
+                page = paginate("hr_expenses", HRExpenseService, filters=conditions)
+                filtered_df = page["data"]
                 # Store the loaded data in session state to persist between reruns
                 st.session_state.hr_expenses_data_loaded = True
 
-                if df.empty:
+                if filtered_df.empty and not conditions:
                     st.info("Não existem despesas RH registadas no sistema.")
                     return
 
@@ -113,21 +125,6 @@ def show_hr_expenses_view():
                 st.error(f"Erro ao carregar despesas RH: {str(e)}")
                 return
 
-        # Apply filters
-        filtered_df = df.copy()
-
-        if driver_filter:
-            driver_filter = driver_filter.lower()
-            filtered_df = filtered_df[
-                filtered_df["driver_name"].str.lower().str.contains(driver_filter)
-            ]
-
-        if len(date_range) == 2:
-            filtered_df = filtered_df[
-                (filtered_df["payment_date"] >= pd.to_datetime(date_range[0]))
-                & (filtered_df["payment_date"] <= pd.to_datetime(date_range[1]))
-            ]
-
         # Store filtered IDs for bulk delete
         filtered_ids = filtered_df["id"].tolist() if not filtered_df.empty else []
             
@@ -140,12 +137,14 @@ def show_hr_expenses_view():
                     on_click=bulk_delete_hr_expenses,
                     type="tertiary",
                     args=(filtered_ids,),
-                    help=f"Eliminar todas as {len(filtered_ids)} despesas RH filtradas",
+                    help=f"Eliminar todas as {len(filtered_ids)} despesas RH filtradas nesta página",
                     use_container_width=True,
                 )
 
         # Display results summary
-        st.subheader(f"Resultados: {len(filtered_df)} despesas encontradas")
+        st.subheader(f"Resultados: {len(filtered_df)} despesas encontradas (página {page['page_number']})")
+        if page["approx_total"] is not None:
+            st.caption(f"Aproximadamente {page['approx_total']} registos no total")
 
         # Table header
         header_cols = st.columns([3, 1.5, 1.5, 1.5, 1.5, 1.5, 1, 1])
@@ -166,6 +165,16 @@ def show_hr_expenses_view():
             # if i < len(filtered_df) - 1:
             #     st.divider()
 
+        pagination_controls("hr_expenses", page)
+
+        # Export every record matching the filters, not only this page
+        export_controls(
+            "hr_expenses",
+            lambda: HRExpenseService.get_many(conditions=conditions),
+            "despesas_rh",
+            filters=conditions,
+        )
+
 
 # Execute the function if this file is run directly
 show_hr_expenses_view()
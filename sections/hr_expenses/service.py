@@ -1,6 +1,6 @@
 import pandas as pd
-from typing import Dict, Tuple
-from database.connection import get_db_connection, get_db_engine
+from typing import Dict, Tuple, List
+from database.connection import get_db_connection
 from datetime import date
 import calendar
 from dateutil.relativedelta import relativedelta
@@ -15,39 +15,48 @@ class HRExpenseService(BaseService):
     table_name = 'hr_expenses'
     primary_key = 'id'
     default_order_by = 'payment_date DESC'
-    
-    @classmethod
-    @handle_service_error("Erro ao atualizar despesa")
-    def update(cls, expense_id: int, data: Dict) -> bool:
-        """
-        Update an existing HR expense record with validation.
-        
-        Args:
-            expense_id: ID of the expense to update
-            data: Dictionary containing HR expense data
-            
-        Returns:
-            True if successful
-            
-        Raises:
-            Exception: If validation fails or update error occurs
-        """
-        # Add updated_at field to the data
-        data_copy = data.copy()
-        data_copy['updated_at'] = 'CURRENT_TIMESTAMP'
-        
-        # Use the base class update method
-        return super().update(expense_id, data_copy)
+    columns = (
+        'driver_id', 'start_date', 'end_date', 'payment_date', 'base_salary',
+        'working_days', 'meal_allowance_per_day', 'other_benefits', 'notes',
+        'created_at', 'updated_at', 'import_batch_id',
+        'fingerprint',
+    )
+    joined_tables = ('drivers',)
+    table_alias = 'e'
+    updated_at_column = 'updated_at'
+    import_batch_column = 'import_batch_id'
+    period_columns = ('start_date', 'end_date')
+    period_keys = ('driver_id',)
+    fingerprint_column = 'fingerprint'
+    fingerprint_fields = (
+        'driver_id', 'start_date', 'end_date', 'payment_date', 'base_salary',
+        'working_days', 'meal_allowance_per_day', 'other_benefits', 'notes',
+    )
+    column_expressions = {
+        'driver_name': 'd.display_name',
+    }
+    # Listing query shared by get_many and get_page: default SELECT list and FROM clause
+    _list_columns = """
+        e.id, e.driver_id, e.start_date, e.end_date, e.payment_date,
+        e.base_salary, e.working_days, e.meal_allowance_per_day,
+        e.other_benefits, e.notes,
+        d.display_name as driver_name
+    """
+    _list_from = """
+        FROM hr_expenses e
+        JOIN drivers d ON e.driver_id = d.id
+    """
     
     @classmethod
     @handle_service_error("Erro ao obter despesa")
-    def get(cls, expense_id: int) -> Dict:
+    def get(cls, expense_id: int, columns: List[str] = None) -> Dict:
         """
         Get a specific HR expense record by ID, including driver name.
         This method needs custom implementation due to the JOIN with drivers table.
         
         Args:
             expense_id: ID of the expense to retrieve
+            columns: Names of the columns to return (defaults to all listing columns)
             
         Returns:
             Dictionary containing expense data or None if not found
@@ -57,65 +66,92 @@ class HRExpenseService(BaseService):
         """
         with get_db_connection() as conn:
             with conn.cursor() as cur:
-                cur.execute("""
-                    SELECT 
-                        e.id, e.driver_id, e.start_date, e.end_date, e.payment_date,
-                        e.base_salary, e.working_days, e.meal_allowance_per_day, 
-                        e.other_benefits, e.notes,
-                        d.display_name as driver_name
-                    FROM hr_expenses e
-                    JOIN drivers d ON e.driver_id = d.id
+                cur.execute(f"""
+                    SELECT {cls._select_list(columns, cls._list_columns)}
+                    {cls._list_from}
                     WHERE e.id = %s
                 """, (expense_id,))
                 result = cur.fetchone()
                 if result:
-                    return {
-                        'id': result[0],
-                        'driver_id': result[1],
-                        'start_date': result[2],
-                        'end_date': result[3],
-                        'payment_date': result[4],
-                        'base_salary': float(result[5]),
-                        'working_days': result[6],
-                        'meal_allowance_per_day': float(result[7]),
-                        'other_benefits': float(result[8]),
-                        'notes': result[9],
-                        'driver_name': result[10]
-                    }
+                    record = dict(zip([desc[0] for desc in cur.description], result))
+                    for col in ('base_salary', 'meal_allowance_per_day', 'other_benefits'):
+                        if record.get(col) is not None:
+                            record[col] = float(record[col])
+                    return record
         return None
     
     @classmethod
     @handle_service_error("Erro ao carregar despesas")
-    def get_many(cls) -> pd.DataFrame:
+    def get_many(cls, conditions: Dict = None, order_by: str = None, columns: List[str] = None) -> pd.DataFrame:
         """
-        Load all HR expense records with driver names.
+        Load HR expense records with driver names.
         Custom implementation needed due to JOIN and calculations.
         
+        Args:
+            conditions: Filter specification for the WHERE clause (see utils.query_filters).
+                Besides expense columns, accepts driver_name
+            order_by: Column name to order by
+            columns: Names of the columns to return (defaults to all listing columns)
+            
         Returns:
             DataFrame containing expense data
             
         Raises:
             Exception: If query error occurs
         """
-        query = """
-            SELECT 
-                e.id, e.driver_id, e.start_date, e.end_date, e.payment_date,
-                e.base_salary, e.working_days, e.meal_allowance_per_day, 
-                e.other_benefits, e.notes,
-                d.display_name as driver_name
-            FROM hr_expenses e
-            JOIN drivers d ON e.driver_id = d.id
-            ORDER BY e.payment_date DESC
+        query = f"SELECT {cls._select_list(columns, cls._list_columns)} {cls._list_from}"
+        where_clause, params = cls._build_where(conditions)
+        query += where_clause
+        query += cls._order_by_clause(order_by)
+        
+        df = cls._read_sql(query, tuple(params) if params else None)
+        return cls._add_totals(df)
+    
+    @classmethod
+    def _add_totals(cls, df: pd.DataFrame) -> pd.DataFrame:
         """
-        engine = get_db_engine()
-        df = pd.read_sql_query(query, engine)
+        Add the computed meal allowance and total expense columns to a listing DataFrame.
         
-        # Calculate meal allowance total and total expense
-        if not df.empty:
+        Args:
+            df: DataFrame returned by the listing query
+            
+        Returns:
+            DataFrame with meal_allowance_total and total_expense columns
+        """
+        # Calculate meal allowance total and total expense (only when the needed columns were selected)
+        needed = {'working_days', 'meal_allowance_per_day', 'base_salary', 'other_benefits'}
+        if not df.empty and needed.issubset(df.columns):
             df['meal_allowance_total'] = (df['working_days'] * df['meal_allowance_per_day']).round(2)
             df['total_expense'] = (df['base_salary'] + df['meal_allowance_total'] + df['other_benefits']).round(2)
             
         return df
+
+    @classmethod
+    @handle_service_error("Erro ao carregar página de despesas")
+    def get_page(
+        cls,
+        filters: Dict = None,
+        order_by: str = None,
+        after_key: str = None,
+        limit: int = 50,
+        with_total: bool = False
+    ) -> Dict:
+        """
+        Load one page of HR expense records with driver names using keyset pagination.
+        
+        Args:
+            filters: Filter specification (see get_many)
+            order_by: Order by expression (defaults to payment_date DESC)
+            after_key: Cursor returned by the previous page, None for the first page
+            limit: Maximum number of rows in the page
+            with_total: Whether to include an approximate total row count
+            
+        Returns:
+            Dictionary with 'data', 'next_cursor' and 'approx_total'
+        """
+        page = cls._fetch_page(f"SELECT {cls._list_columns} {cls._list_from}", filters, order_by, after_key, limit, with_total)
+        page['data'] = cls._add_totals(page['data'])
+        return page
     
     @classmethod
     def get_working_days(cls, year: int, month: int) -> int:
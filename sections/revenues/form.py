@@ -3,7 +3,7 @@ from utils.error_handlers import handle_streamlit_error
 from utils.form_builder import FormBuilder
 from datetime import date
 from sections.drivers.service import DriverService
-from sections.cars.service import CarService
+from utils.reference_data import get_driver_options, get_car_options
 
 @handle_streamlit_error()
 def revenue_form(existing_data=None):
@@ -60,12 +60,10 @@ def revenue_form(existing_data=None):
                 start_date_str.strftime("%Y-%m-%d"),
                 end_date_str.strftime("%Y-%m-%d"),
             )
+        driver_options = {driver[0]: driver[1] for driver in active_drivers} if active_drivers else {}
     else:
-        # Otherwise, get all active drivers
-        drivers_df = DriverService.get_many(conditions={'is_active': True})
-        active_drivers = [(driver['id'], driver['display_name']) for _, driver in drivers_df.iterrows()]
-        
-    driver_options = {driver[0]: driver[1] for driver in active_drivers} if active_drivers else {}
+        # Otherwise, use the shared map of all active drivers
+        driver_options = get_driver_options()
     
     form.create_columns(2)
     form.create_field(
@@ -79,8 +77,7 @@ def revenue_form(existing_data=None):
     )
     
     # Load cars
-    cars = CarService.get_all_license_plates()
-    car_options = {car[0]: car[1] for car in cars} if cars else {}
+    car_options = get_car_options()
 
     form.create_field(
         key="car_id",
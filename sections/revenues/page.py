@@ -3,6 +3,8 @@ import pandas as pd
 from sections.revenues.service import RevenueService
 from utils.error_handlers import handle_streamlit_error
 from utils.navigation import switch_page
+from utils.pagination import paginate, pagination_controls
+from utils.export import export_controls
 from sections.revenues.delete import delete_revenue, bulk_delete_revenues
 
 
@@ -113,49 +115,42 @@ def show_revenues_view():
     
 
     if submit_button or "revenues_data_loaded" in st.session_state:
+        # Build the filters so that the database only returns matching rows
+        conditions = {}
+
+        if driver_filter:
+            conditions["driver_name"] = {"contains": driver_filter}
+
+        if plate_filter:
+            conditions["license_plate"] = {"contains": plate_filter}
+
+        if platform_filter != "Todas":
+            conditions["platform"] = platform_filter
+
+        if len(date_range) == 2:
+            conditions["start_date"] = {"gte": date_range[0]}
+            conditions["end_date"] = {"lte": date_range[1]}
+
         # Load data
         with st.spinner("A carregar dados...", show_time=True):
             try:
-                df = RevenueService.get_many()
+                page = paginate("revenues", RevenueService, filters=conditions)
+                filtered_df = page["data"]
                 # Store the loaded data in session state to persist between reruns
                 st.session_state.revenues_data_loaded = True
 
-                if df.empty:
+                if filtered_df.empty and not conditions:
                     st.info("Não foram encontrados registos de receitas no sistema.")
                     return
 
                 # Convert date columns to pandas datetime
                 for col in ["start_date", "end_date"]:
-                    if col in df.columns:
-                        df[col] = pd.to_datetime(df[col])
+                    if col in filtered_df.columns:
+                        filtered_df[col] = pd.to_datetime(filtered_df[col])
             except Exception as e:
                 st.error(f"Erro ao carregar dados de receitas: {str(e)}")
                 return
 
-        # Apply filters
-        filtered_df = df.copy()
-
-        if driver_filter:
-            driver_filter = driver_filter.lower()
-            filtered_df = filtered_df[
-                filtered_df["driver_name"].str.lower().str.contains(driver_filter)
-            ]
-
-        if plate_filter:
-            plate_filter = plate_filter.lower()
-            filtered_df = filtered_df[
-                filtered_df["license_plate"].str.lower().str.contains(plate_filter)
-            ]
-
-        if platform_filter != "Todas":
-            filtered_df = filtered_df[filtered_df["platform"] == platform_filter]
-
-        if len(date_range) == 2:
-            filtered_df = filtered_df[
-                (filtered_df["start_date"] >= pd.to_datetime(date_range[0]))
-                & (filtered_df["end_date"] <= pd.to_datetime(date_range[1]))
-            ]
-
         # Store filtered IDs for bulk delete
         filtered_ids = filtered_df["id"].tolist() if not filtered_df.empty else []
 
@@ -168,12 +163,14 @@ def show_revenues_view():
                     on_click=bulk_delete_revenues,
                     type="tertiary",
                     args=(filtered_ids,),
-                    help=f"Eliminar todas as {len(filtered_ids)} Receitas filtradas",
+                    help=f"Eliminar todas as {len(filtered_ids)} Receitas filtradas nesta página",
                     use_container_width=True,
                 )
 
         # Display results summary
-        st.subheader(f"Resultados: {len(filtered_df)} registos encontrados")
+        st.subheader(f"Resultados: {len(filtered_df)} registos encontrados (página {page['page_number']})")
+        if page["approx_total"] is not None:
+            st.caption(f"Aproximadamente {page['approx_total']} registos no total")
 
         # Table header
         header_cols = st.columns([2.5, 1.5, 1.5, 1.5, 1.5, 1.5, 1, 1])
@@ -192,6 +189,16 @@ def show_revenues_view():
         for i, (_, revenue) in enumerate(filtered_df.iterrows()):
             revenue_row(revenue)
 
+        pagination_controls("revenues", page)
+
+        # Export every record matching the filters, not only this page
+        export_controls(
+            "revenues",
+            lambda: RevenueService.get_many(conditions=conditions),
+            "receitas",
+            filters=conditions,
+        )
+
 
 # Execute the function if this file is run directly
 show_revenues_view()
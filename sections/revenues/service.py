@@ -1,6 +1,6 @@
 import pandas as pd
-from typing import Dict, Optional
-from database.connection import get_db_connection, get_db_engine
+from typing import Dict, Optional, List
+from database.connection import get_db_connection
 from utils.base_service import BaseService
 from utils.error_handlers import handle_service_error
 
@@ -12,31 +12,62 @@ class RevenueService(BaseService):
     table_name = 'revenue'
     primary_key = 'id'
     default_order_by = 'created_at DESC'
+    columns = (
+        'driver_id', 'car_id', 'platform', 'start_date', 'end_date',
+        'gross_revenue', 'commission_percentage', 'tip', 'num_travels',
+        'num_kilometers', 'created_at', 'updated_at', 'import_batch_id',
+        'fingerprint',
+    )
+    joined_tables = ('drivers', 'cars')
+    table_alias = 'r'
+    updated_at_column = 'updated_at'
+    import_batch_column = 'import_batch_id'
+    period_columns = ('start_date', 'end_date')
+    period_keys = ('driver_id', 'platform')
+    fingerprint_column = 'fingerprint'
+    fingerprint_fields = (
+        'driver_id', 'car_id', 'platform', 'start_date', 'end_date',
+        'gross_revenue', 'commission_percentage', 'tip', 'num_travels',
+        'num_kilometers',
+    )
+    column_expressions = {
+        'driver_name': 'd.display_name',
+        'license_plate': 'c.license_plate',
+        'car_brand': 'c.brand',
+        'car_model': 'c.model',
+    }
+    # Listing query shared by get_many and get_page: default SELECT list and FROM clause
+    _list_columns = """
+        r.*,
+        d.display_name AS driver_name,
+        c.license_plate,
+        c.brand AS car_brand,
+        c.model AS car_model
+    """
+    _list_from = """
+        FROM revenue r
+        LEFT JOIN drivers d ON r.driver_id = d.id
+        LEFT JOIN cars c ON r.car_id = c.id
+    """
 
     @classmethod
     @handle_service_error("Erro ao obter registo de receita")
-    def get(cls, record_id: int) -> Optional[Dict]:
+    def get(cls, record_id: int, columns: List[str] = None) -> Optional[Dict]:
         """
         Get a single revenue record by ID with additional information about driver and car.
         
         Args:
             record_id: ID of the revenue record
+            columns: Names of the columns to return (defaults to all listing columns)
             
         Returns:
             Dictionary with revenue data including driver and car details, or None if not found
         """
         with get_db_connection() as conn:
             with conn.cursor() as cur:
-                query = """
-                    SELECT 
-                        r.*, 
-                        d.display_name AS driver_name,
-                        c.license_plate,
-                        c.brand AS car_brand,
-                        c.model AS car_model
-                    FROM revenue r
-                    LEFT JOIN drivers d ON r.driver_id = d.id
-                    LEFT JOIN cars c ON r.car_id = c.id
+                query = f"""
+                    SELECT {cls._select_list(columns, cls._list_columns)}
+                    {cls._list_from}
                     WHERE r.id = %s
                 """
                 cur.execute(query, (record_id,))
@@ -53,58 +84,52 @@ class RevenueService(BaseService):
 
     @classmethod
     @handle_service_error("Erro ao carregar dados de receitas")
-    def get_many(cls, conditions: Dict = None, order_by: str = None) -> pd.DataFrame:
+    def get_many(cls, conditions: Dict = None, order_by: str = None, columns: List[str] = None) -> pd.DataFrame:
         """
         Load all revenue records with additional information about drivers and cars.
         
         Args:
-            conditions: Dictionary of column-value pairs for WHERE clause
+            conditions: Filter specification for the WHERE clause (see utils.query_filters).
+                Besides revenue columns, accepts driver_name, license_plate, car_brand and car_model
             order_by: Column name to order by
+            columns: Names of the columns to return (defaults to all listing columns)
             
         Returns:
             DataFrame with revenue data including driver and car details
         """
         # Base query with JOINs
-        query = """
-            SELECT 
-                r.*, 
-                d.display_name AS driver_name,
-                c.license_plate,
-                c.brand AS car_brand,
-                c.model AS car_model
-            FROM revenue r
-            LEFT JOIN drivers d ON r.driver_id = d.id
-            LEFT JOIN cars c ON r.car_id = c.id
-        """
-        params = []
-        
+        query = f"SELECT {cls._select_list(columns, cls._list_columns)} {cls._list_from}"
         # Add WHERE clause if conditions provided
-        if conditions:
-            where_clauses = []
-            for col, val in conditions.items():
-                # Check if column is in the revenue table or in joined tables
-                if col.startswith('driver_'):
-                    # For driver fields, modify the column reference
-                    where_clauses.append(f"d.{col[7:]} = %s")
-                elif col.startswith('car_'):
-                    # For car fields, modify the column reference
-                    where_clauses.append(f"c.{col[4:]} = %s")
-                else:
-                    # For revenue fields, use as is
-                    where_clauses.append(f"r.{col} = %s")
-                params.append(val)
-            
-            query += f" WHERE {' AND '.join(where_clauses)}"
+        where_clause, params = cls._build_where(conditions)
+        query += where_clause
         
         # Add ORDER BY clause
-        order_by = order_by or cls.default_order_by
-        if order_by:
-            # Check if order by column has a table prefix
-            if '.' not in order_by:
-                query += f" ORDER BY r.{order_by}"
-            else:
-                query += f" ORDER BY {order_by}"
+        query += cls._order_by_clause(order_by)
         
         # Execute query using pandas
-        engine = get_db_engine()
-        return pd.read_sql_query(query, engine, params=tuple(params) if params else None)
+        return cls._read_sql(query, tuple(params) if params else None)
+
+    @classmethod
+    @handle_service_error("Erro ao carregar página de receitas")
+    def get_page(
+        cls,
+        filters: Dict = None,
+        order_by: str = None,
+        after_key: str = None,
+        limit: int = 50,
+        with_total: bool = False
+    ) -> Dict:
+        """
+        Load one page of revenue records with driver and car details using keyset pagination.
+        
+        Args:
+            filters: Filter specification (see get_many)
+            order_by: Order by expression (defaults to created_at DESC)
+            after_key: Cursor returned by the previous page, None for the first page
+            limit: Maximum number of rows in the page
+            with_total: Whether to include an approximate total row count
+            
+        Returns:
+            Dictionary with 'data', 'next_cursor' and 'approx_total'
+        """
+        return cls._fetch_page(f"SELECT {cls._list_columns} {cls._list_from}", filters, order_by, after_key, limit, with_total)
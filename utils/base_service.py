@@ -1,7 +1,144 @@
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, List, Optional, Tuple, Any, Union
+import base64
+import csv
+import io
+import json
+import math
+import re
+from datetime import date, datetime
+import numpy as np
 import pandas as pd
+import psycopg2
+from psycopg2.extras import execute_values
 from database.connection import get_db_connection, get_db_engine
 from utils.error_handlers import handle_service_error, handle_database_error
+from utils.fingerprints import fingerprint_kind, row_fingerprints
+from utils.query_filters import build_where_clause
+from utils.query_cache import get_query_cache, invalidate_tables
+
+
+# Column types of each table, read from the catalog on first use
+_column_types_cache = {}
+# Columns and constraints of each table checked by dry runs, read from the catalog on first use
+_table_schema_cache = {}
+
+
+def _encode_cursor(values: List[Any]) -> str:
+    """
+    Encode the sort key values of the last row of a page as an opaque cursor token.
+
+    Args:
+        values: Values of the ordering columns
+
+    Returns:
+        URL-safe cursor token
+    """
+    def to_json(value):
+        if isinstance(value, (datetime, date)):
+            return value.isoformat()
+        if hasattr(value, 'item'):  # numpy scalars
+            return value.item()
+        return str(value)
+
+    payload = json.dumps(values, default=to_json)
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii")
+
+
+def _decode_cursor(token: str) -> List[Any]:
+    """
+    Decode a cursor token created by _encode_cursor.
+
+    Args:
+        token: Cursor token
+
+    Returns:
+        Values of the ordering columns
+
+    Raises:
+        ValueError: If the token is invalid
+    """
+    try:
+        return json.loads(base64.urlsafe_b64decode(token.encode("ascii")).decode("utf-8"))
+    except Exception:
+        raise ValueError("Cursor de paginação inválido")
+
+
+def _copy_field(value: Any) -> str:
+    """
+    Format a value as a CSV field for COPY FROM STDIN.
+    Values are always quoted so that an empty string is kept apart from NULL
+    (an unquoted empty field).
+
+    Args:
+        value: The value to format
+
+    Returns:
+        CSV field
+    """
+    if value is None or value is pd.NaT or (isinstance(value, float) and math.isnan(value)):
+        return ''
+    if isinstance(value, float) and value.is_integer():
+        # "5" instead of "5.0", which integer columns would reject
+        return f'"{int(value)}"'
+    return '"' + str(value).replace('"', '""') + '"'
+
+
+def _copy_records(
+    cur,
+    table: str,
+    columns: List[str],
+    records: Union[List[Dict], pd.DataFrame],
+    chunk_size: int = 10000
+) -> None:
+    """
+    Send records to a table with COPY FROM STDIN, chunk_size records per statement.
+    A DataFrame is written with DataFrame.to_csv instead of field by field: text is
+    quoted, so empty strings stay apart from missing values, which are sent as \\N.
+
+    Args:
+        cur: Database cursor
+        table: Name of the table
+        columns: Columns of the records to copy
+        records: List of dictionaries containing column names and values, or a DataFrame
+        chunk_size: Number of records sent per COPY statement
+    """
+    if isinstance(records, pd.DataFrame):
+        # Whole-number float columns (e.g. integers with missing values) are written
+        # as "5" instead of "5.0", which integer columns would reject, like _copy_field does
+        whole = {}
+        for col in columns:
+            if pd.api.types.is_float_dtype(records[col]):
+                values = records[col].to_numpy(dtype=float)
+                present = values[~np.isnan(values)]
+                if np.isfinite(present).all() and (present == np.trunc(present)).all():
+                    whole[col] = records[col].astype('Int64')
+        if whole:
+            records = records.assign(**whole)
+
+        column_list = ', '.join(columns)
+        copy_sql = (
+            f"COPY {table} ({column_list}) FROM STDIN "
+            f"WITH (FORMAT csv, NULL '\\N', FORCE_NULL ({column_list}))"
+        )
+        for start in range(0, len(records), chunk_size):
+            buffer = io.StringIO()
+            records.iloc[start:start + chunk_size].to_csv(
+                buffer, columns=columns, header=False, index=False,
+                quoting=csv.QUOTE_NONNUMERIC, na_rep='\\N',
+            )
+            buffer.seek(0)
+            cur.copy_expert(copy_sql, buffer)
+        return
+
+    copy_sql = f"COPY {table} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)"
+    for start in range(0, len(records), chunk_size):
+        buffer = io.StringIO()
+        for record in records[start:start + chunk_size]:
+            buffer.write(','.join(_copy_field(record.get(col)) for col in columns))
+            buffer.write('\n')
+        buffer.seek(0)
+        cur.copy_expert(copy_sql, buffer)
+
 
 class BaseService:
     """
@@ -12,13 +149,159 @@ class BaseService:
     table_name = None
     primary_key = 'id'
     default_order_by = None
+    # Columns of the table that may be used in filters and column projections
+    columns = ()
+    # Alias of the table in custom queries with JOINs (e.g. 'r' for "FROM revenue r")
+    table_alias = None
+    # Extra filterable/selectable names mapped to SQL expressions (e.g. columns of JOINed tables)
+    column_expressions = {}
+    # Unique natural keys of the table, as tuples of columns. The first one is the
+    # default conflict target of upsert_many
+    natural_keys = ()
+    # Timestamp column set to CURRENT_TIMESTAMP by every update (None to disable)
+    updated_at_column = None
+    # Other tables read by the queries of the service (JOINs); writes to them
+    # invalidate the cached reads of this service
+    joined_tables = ()
+    # Column holding the import batch that inserted each row (None if imports are not tracked)
+    import_batch_column = None
+    # (start, end) columns of a period that must not overlap the period of another
+    # record with the same period_keys; checked by dry_run (None to disable)
+    period_columns = None
+    period_keys = ()
+    # Column holding the fingerprint of the business fields of each row, backed by a
+    # unique index and kept up to date by every write: imports skip rows already in
+    # the table (None to disable)
+    fingerprint_column = None
+    fingerprint_fields = ()
     
     @classmethod
     def _validate_configuration(cls):
         """Validate that required class attributes are set."""
         if cls.table_name is None:
             raise ValueError(f"{cls.__name__} must define table_name class attribute")
-    
+
+    @classmethod
+    def _read_sql(cls, query: str, params: Any = None) -> pd.DataFrame:
+        """
+        Run a read query through the shared SQLAlchemy engine.
+        All pandas read paths of the services go through this method. Results are
+        cached per (query, params) until the TTL expires or one of the tables of
+        the service is modified through a service.
+
+        Args:
+            query: SQL query with %s placeholders
+            params: Query parameters
+
+        Returns:
+            Pandas DataFrame with results
+        """
+        # SQLAlchemy 2 only accepts positional parameters as a tuple
+        if isinstance(params, list):
+            params = tuple(params)
+
+        cache = get_query_cache()
+        if cache is None:
+            return pd.read_sql_query(query, get_db_engine(), params=params)
+
+        key = (query, repr(params))
+        df = cache.get(key)
+        if df is None:
+            df = pd.read_sql_query(query, get_db_engine(), params=params)
+            cache.set(key, df, (cls.table_name,) + tuple(cls.joined_tables))
+        # Callers may modify the DataFrame, so never hand out the cached one
+        return df.copy()
+
+    @classmethod
+    def _invalidate_cache(cls) -> None:
+        """Drop the cached reads that depend on the table of this service."""
+        invalidate_tables([cls.table_name])
+
+    @classmethod
+    def _resolve_column(cls, name: str) -> str:
+        """
+        Map a column name to its SQL expression, rejecting unknown columns.
+
+        Args:
+            name: Column name as used by callers
+
+        Returns:
+            SQL expression for the column
+
+        Raises:
+            ValueError: If the column is not whitelisted for this service
+        """
+        if name in cls.column_expressions:
+            return cls.column_expressions[name]
+        if name == cls.primary_key or name in cls.columns:
+            return f"{cls.table_alias}.{name}" if cls.table_alias else name
+        raise ValueError(f"Coluna '{name}' não permitida em {cls.table_name}")
+
+    @classmethod
+    def _select_list(cls, columns: List[str] = None, default: str = "*") -> str:
+        """
+        Build the SELECT list for a column projection.
+
+        Args:
+            columns: Names of the columns to return (see _resolve_column), None for all
+            default: SELECT list used when no columns are given
+
+        Returns:
+            SQL select list
+
+        Raises:
+            ValueError: If a column is not whitelisted for this service
+        """
+        if not columns:
+            return default
+
+        expressions = []
+        for name in columns:
+            expression = cls._resolve_column(name)
+            expressions.append(expression if expression == name else f"{expression} AS {name}")
+        return ", ".join(expressions)
+
+    @classmethod
+    def _build_where(cls, conditions: Dict = None) -> Tuple[str, List]:
+        """
+        Build the WHERE clause for a filter specification.
+        See utils.query_filters.build_where_clause for the supported syntax.
+
+        Args:
+            conditions: Filter specification
+
+        Returns:
+            Tuple of (where_clause, params); where_clause is empty without conditions
+        """
+        clause, params = build_where_clause(conditions, cls._resolve_column)
+        return (f" WHERE {clause}" if clause else ""), params
+
+    @classmethod
+    def _order_by_clause(cls, order_by: str = None) -> str:
+        """
+        Build the ORDER BY clause, qualifying bare columns with the table alias.
+
+        Args:
+            order_by: Order by expression (defaults to default_order_by)
+
+        Returns:
+            ORDER BY clause or an empty string
+        """
+        order_by = order_by or cls.default_order_by
+        if not order_by:
+            return ""
+
+        if cls.table_alias:
+            terms = []
+            for term in order_by.split(','):
+                term = term.strip()
+                if '.' not in term and term.split()[0] in cls.columns + (cls.primary_key,):
+                    term = f"{cls.table_alias}.{term}"
+                terms.append(term)
+            order_by = ", ".join(terms)
+
+        return f" ORDER BY {order_by}"
+
     @classmethod
     @handle_service_error("Erro ao inserir dados")
     def insert(cls, data: Dict) -> int:
@@ -50,7 +333,10 @@ class BaseService:
             with conn.cursor() as cur:
                 cur.execute(query, values)
                 result = cur.fetchone()
+                if result:
+                    cls._refresh_fingerprints(cur, [result[0]])
             conn.commit()
+        cls._invalidate_cache()
         
         return result[0] if result else None
     
@@ -116,10 +402,681 @@ class BaseService:
                 cur.execute(query, all_values)
                 results = cur.fetchall()
                 result_ids = [result[0] for result in results]
+                cls._refresh_fingerprints(cur, result_ids)
+            conn.commit()
+        cls._invalidate_cache()
+        
+        return result_ids
+    
+    @classmethod
+    def _record_columns(cls, records: Union[List[Dict], pd.DataFrame]) -> List[str]:
+        """
+        Get the columns present in any of the records, in order of first appearance.
+
+        Args:
+            records: List of dictionaries containing column names and values, or a DataFrame
+
+        Returns:
+            List of column names
+
+        Raises:
+            ValueError: If a column is not a column of the table
+        """
+        if isinstance(records, pd.DataFrame):
+            columns = list(records.columns)
+        else:
+            columns = list(dict.fromkeys(col for record in records for col in record))
+        for col in columns:
+            if cls.columns and col not in cls.columns:
+                raise ValueError(f"Coluna '{col}' não permitida em {cls.table_name}")
+        return columns
+
+    @classmethod
+    def _with_fingerprints(
+        cls,
+        cur,
+        records: Union[List[Dict], pd.DataFrame]
+    ) -> Union[List[Dict], pd.DataFrame]:
+        """
+        Add the fingerprint of their business fields to the records
+        (see utils.fingerprints.row_fingerprints). Fields missing from the records
+        are stored as NULL, and fingerprinted as such.
+
+        Args:
+            cur: Database cursor
+            records: List of dictionaries containing column names and values, or a DataFrame
+
+        Returns:
+            The records with the fingerprint column, or the records unchanged if the
+            table has no fingerprints or a missing field would take a column default
+        """
+        if not cls.fingerprint_column or not len(records):
+            return records
+
+        present = cls._record_columns(records)
+        if cls.fingerprint_column in present:
+            return records
+        schema = cls._table_schema(cur)
+        if any(schema['columns'][field][3] for field in cls.fingerprint_fields if field not in present):
+            return records
+
+        fingerprints = row_fingerprints(records, cls._fingerprint_kinds(cur))
+        if isinstance(records, pd.DataFrame):
+            return records.assign(**{cls.fingerprint_column: fingerprints})
+        return [
+            {**record, cls.fingerprint_column: fingerprint}
+            for record, fingerprint in zip(records, fingerprints)
+        ]
+
+    @classmethod
+    def _fingerprint_kinds(cls, cur) -> Dict[str, str]:
+        """
+        Get the fingerprint fields mapped to how they are normalized (see utils.fingerprints.fingerprint_kind).
+
+        Args:
+            cur: Database cursor
+
+        Returns:
+            Dictionary mapping the fingerprint fields, in order, to their kind
+        """
+        schema = cls._table_schema(cur)
+        return {field: fingerprint_kind(schema['columns'][field][0]) for field in cls.fingerprint_fields}
+
+    @classmethod
+    def _refresh_fingerprints(cls, cur, record_ids: List[int]) -> None:
+        """
+        Recompute the fingerprints of records written outside the imports (forms,
+        edits), from their values as stored, so that importing the same row later
+        skips it. A record that ends up identical to another record keeps a NULL
+        fingerprint instead of violating the unique index: both are kept, like the
+        duplicates found by migration 0005. Conflicts never fail the caller's write.
+        Runs inside the caller's transaction.
+
+        Args:
+            cur: Database cursor
+            record_ids: IDs of the inserted or changed records
+        """
+        if not cls.fingerprint_column or not record_ids:
+            return
+
+        fingerprint = cls.fingerprint_column
+        fields = list(cls.fingerprint_fields)
+        cur.execute(
+            f"SELECT {cls.primary_key}, {', '.join(fields)} FROM {cls.table_name} "
+            f"WHERE {cls.primary_key} = ANY(%s) ORDER BY {cls.primary_key}",
+            (list(record_ids),)
+        )
+        rows = cur.fetchall()
+        if not rows:
+            return
+        fingerprints = row_fingerprints([dict(zip(fields, row[1:])) for row in rows], cls._fingerprint_kinds(cur))
+
+        # Records of the same statement that became identical: only the first one keeps the fingerprint
+        seen = set()
+        values = []
+        for row, value in zip(rows, fingerprints):
+            values.append((row[0], value if value not in seen else None))
+            seen.add(value)
+
+        key_type = cls._column_types(cur)[cls.primary_key]
+        template = f"(%s::{key_type}, %s::char(32))"
+        update = f"""
+            UPDATE {cls.table_name} AS t
+            SET {fingerprint} = CASE
+                WHEN EXISTS (
+                    SELECT 1 FROM {cls.table_name} o
+                    WHERE o.{fingerprint} = v.{fingerprint} AND o.{cls.primary_key} <> t.{cls.primary_key}
+                ) THEN NULL
+                ELSE v.{fingerprint}
+            END
+            FROM (VALUES %s) AS v ({cls.primary_key}, {fingerprint})
+            WHERE t.{cls.primary_key} = v.{cls.primary_key}
+        """
+
+        # EXISTS only sees committed rows: a concurrent import of the same row makes the
+        # update fail on the unique index. The savepoints keep the caller's write, and
+        # the conflicting records are retried one by one with a NULL fingerprint
+        cur.execute("SAVEPOINT refresh_fingerprints")
+        try:
+            execute_values(cur, update, values, template=template, page_size=1000)
+        except psycopg2.errors.UniqueViolation:
+            cur.execute("ROLLBACK TO SAVEPOINT refresh_fingerprints")
+            for record_id, value in values:
+                cur.execute("SAVEPOINT refresh_fingerprint")
+                try:
+                    execute_values(cur, update, [(record_id, value)], template=template)
+                except psycopg2.errors.UniqueViolation:
+                    cur.execute("ROLLBACK TO SAVEPOINT refresh_fingerprint")
+                    execute_values(cur, update, [(record_id, None)], template=template)
+                cur.execute("RELEASE SAVEPOINT refresh_fingerprint")
+        cur.execute("RELEASE SAVEPOINT refresh_fingerprints")
+
+    @classmethod
+    def _copy_insert(cls, cur, records: Union[List[Dict], pd.DataFrame], chunk_size: int = 10000) -> List[int]:
+        """
+        Insert records using COPY into a temporary staging table followed by a
+        single INSERT ... SELECT. Runs inside the caller's transaction.
+        On tables with fingerprints (see fingerprint_column), records already in
+        the table or repeated in the records are skipped by the same INSERT.
+
+        Args:
+            cur: Database cursor
+            records: List of dictionaries containing column names and values, or a
+                DataFrame (faster to send, see _copy_records)
+            chunk_size: Number of records sent per COPY statement
+
+        Returns:
+            List of IDs of the newly inserted records, sorted by ID. RETURNING does
+            not follow the order of the records, and skipped records have no ID, so
+            the IDs cannot be matched to the records by position
+        """
+        records = cls._with_fingerprints(cur, records)
+        columns = cls._record_columns(records)
+        column_list = ', '.join(columns)
+        staging_table = f"{cls.table_name}_staging"
+
+        # The staging table copies the column types of the target table and is dropped on commit
+        cur.execute(f"""
+            CREATE TEMP TABLE {staging_table} ON COMMIT DROP AS
+            SELECT {column_list} FROM {cls.table_name} WITH NO DATA
+        """)
+        cur.execute(f"ALTER TABLE {staging_table} ADD COLUMN _row_number BIGSERIAL")
+
+        _copy_records(cur, staging_table, columns, records, chunk_size)
+
+        skip_duplicates = ""
+        if cls.fingerprint_column in columns:
+            fingerprint = cls.fingerprint_column
+            skip_duplicates = f"ON CONFLICT ({fingerprint}) WHERE {fingerprint} IS NOT NULL DO NOTHING"
+        cur.execute(f"""
+            INSERT INTO {cls.table_name} ({column_list})
+            SELECT {column_list} FROM {staging_table}
+            ORDER BY _row_number
+            {skip_duplicates}
+            RETURNING {cls.primary_key}
+        """)
+        result_ids = sorted(row[0] for row in cur.fetchall())
+
+        cur.execute(f"DROP TABLE {staging_table}")
+        return result_ids
+
+    @classmethod
+    @handle_service_error("Erro ao importar registos")
+    def bulk_load(cls, records: List[Dict], chunk_size: int = 10000) -> List[int]:
+        """
+        Generic method to insert a large number of records in a single transaction.
+        Rows are streamed with COPY FROM STDIN into a staging table and inserted
+        with one INSERT ... SELECT, which is much faster than one INSERT per row.
+        Either all records are inserted or none is, except records already
+        imported, which are skipped on tables with fingerprints.
+        
+        Args:
+            records: List of dictionaries containing column names and values
+            chunk_size: Number of records sent per COPY statement
+            
+        Returns:
+            List of IDs of the newly inserted records, sorted by ID (not matched to
+            the records: records already imported have no ID)
+            
+        Raises:
+            Exception: If the insert operation fails
+        """
+        cls._validate_configuration()
+        
+        if not records:
+            return []
+        
+        with get_db_connection() as conn:
+            with conn.cursor() as cur:
+                result_ids = cls._copy_insert(cur, records, chunk_size)
             conn.commit()
+        cls._invalidate_cache()
         
         return result_ids
     
+    @classmethod
+    @handle_service_error("Erro ao importar registos")
+    def upsert_many(
+        cls,
+        records: List[Dict],
+        conflict_columns: List[str] = None,
+        update_columns: List[str] = None,
+        chunk_size: int = 1000
+    ) -> Dict[str, int]:
+        """
+        Generic method to insert records or update the existing ones that have the
+        same key (INSERT ... ON CONFLICT), so that importing the same data twice
+        does not create duplicates. Uses one statement per chunk, all in a single
+        transaction. Rows whose values do not change are left untouched.
+        
+        Args:
+            records: List of dictionaries containing column names and values
+            conflict_columns: Columns of a unique constraint identifying existing
+                records (defaults to the first of natural_keys)
+            update_columns: Columns to overwrite on existing records (defaults to
+                every column of the records except the conflict columns).
+                An empty list keeps existing records unchanged
+            chunk_size: Number of records per statement
+            
+        Returns:
+            Dictionary with the number of 'inserted', 'updated' and 'unchanged' records
+            (records repeating the key of a later record are unchanged), adding up
+            to the number of records
+            
+        Raises:
+            Exception: If the operation fails
+        """
+        cls._validate_configuration()
+        
+        if not records:
+            return {'inserted': 0, 'updated': 0, 'unchanged': 0}
+        
+        with get_db_connection() as conn:
+            with conn.cursor() as cur:
+                counts = cls._upsert_records(cur, records, conflict_columns, update_columns, chunk_size)
+            conn.commit()
+        cls._invalidate_cache()
+        
+        return counts
+    
+    @classmethod
+    def _upsert_records(
+        cls,
+        cur,
+        records: List[Dict],
+        conflict_columns: List[str] = None,
+        update_columns: List[str] = None,
+        chunk_size: int = 1000
+    ) -> Dict[str, int]:
+        """
+        Insert or update records (see upsert_many). Runs inside the caller's transaction.
+
+        Args:
+            cur: Database cursor
+            records: List of dictionaries containing column names and values
+            conflict_columns: Columns of a unique constraint identifying existing records
+            update_columns: Columns to overwrite on existing records
+            chunk_size: Number of records per statement
+
+        Returns:
+            Dictionary with the number of 'inserted', 'updated' and 'unchanged' records
+        """
+        counts = {'inserted': 0, 'updated': 0, 'unchanged': 0}
+        if not records:
+            return counts
+        
+        if conflict_columns is None:
+            if not cls.natural_keys:
+                raise ValueError(f"{cls.__name__} não define chaves naturais para upsert")
+            conflict_columns = cls.natural_keys[0]
+        conflict_columns = list(conflict_columns)
+        
+        columns = cls._record_columns(records)
+        missing = [col for col in conflict_columns if col not in columns]
+        if missing:
+            raise ValueError(f"Os registos não incluem as colunas-chave: {', '.join(missing)}")
+        
+        if update_columns is None:
+            update_columns = [col for col in columns if col not in conflict_columns and col != cls.primary_key]
+        for col in update_columns:
+            if col not in columns:
+                raise ValueError(f"Coluna '{col}' não existe nos registos")
+        
+        query = f"INSERT INTO {cls.table_name} AS t ({', '.join(columns)}) VALUES %s"
+        query += f" ON CONFLICT ({', '.join(conflict_columns)})"
+        if update_columns:
+            assignments = [f"{col} = EXCLUDED.{col}" for col in update_columns] + cls._touch_clauses(columns)
+            current = ', '.join(f"t.{col}" for col in update_columns)
+            incoming = ', '.join(f"EXCLUDED.{col}" for col in update_columns)
+            query += f" DO UPDATE SET {', '.join(assignments)}"
+            # Skip rows that would not change
+            query += f" WHERE ROW({current}) IS DISTINCT FROM ROW({incoming})"
+        else:
+            query += " DO NOTHING"
+        # xmax is 0 only for rows created by this statement
+        query += " RETURNING (xmax = 0) AS inserted"
+        
+        for start in range(0, len(records), chunk_size):
+            # ON CONFLICT cannot affect the same row twice in one statement,
+            # so only the last record of each key in the chunk is kept
+            chunk = {}
+            for record in records[start:start + chunk_size]:
+                key = tuple(record.get(col) for col in conflict_columns)
+                chunk.pop(key, None)
+                chunk[key] = record
+            
+            values = [tuple(record.get(col) for col in columns) for record in chunk.values()]
+            results = execute_values(cur, query, values, page_size=len(values), fetch=True)
+            
+            inserted = sum(1 for row in results if row[0])
+            counts['inserted'] += inserted
+            counts['updated'] += len(results) - inserted
+            # Records replaced by a later record with the same key in the chunk are
+            # unchanged too, so the counts always add up to the number of records
+            chunk_length = min(chunk_size, len(records) - start)
+            counts['unchanged'] += chunk_length - len(results)
+        
+        return counts
+    
+    @classmethod
+    def _load_records(cls, cur, records: List[Dict], import_batch_id: int = None) -> Dict[str, int]:
+        """
+        Store imported records the way create_generic_uploader does: upserted by
+        natural key when the table has one, otherwise inserted with COPY and tagged
+        with the import batch, skipping the records already imported (counted as
+        unchanged). Runs inside the caller's transaction.
+
+        Args:
+            cur: Database cursor
+            records: List of dictionaries containing column names and values
+            import_batch_id: Import batch the records belong to
+
+        Returns:
+            Dictionary with the number of 'inserted', 'updated' and 'unchanged' records
+        """
+        if cls.natural_keys:
+            return cls._upsert_records(cur, records)
+        
+        if import_batch_id is not None and cls.import_batch_column:
+            records = [{**record, cls.import_batch_column: import_batch_id} for record in records]
+        inserted = len(cls._copy_insert(cur, records)) if records else 0
+        return {'inserted': inserted, 'updated': 0, 'unchanged': len(records) - inserted}
+    
+    @classmethod
+    def _table_schema(cls, cur) -> Dict[str, Any]:
+        """
+        Get the columns and constraints of the table checked by dry_run.
+        Read once from the catalog and cached per table.
+
+        Args:
+            cur: Database cursor
+
+        Returns:
+            Dictionary with 'columns' (name -> (type without modifiers, type with
+            modifiers, NOT NULL flag, default flag)) and 'constraints' (list of dictionaries with
+            'kind' ('unique', 'foreign_key' or 'check'), 'name', 'columns',
+            'ref_table', 'ref_columns', 'expression' and 'predicate')
+        """
+        if cls.table_name not in _table_schema_cache:
+            cur.execute("""
+                SELECT attname, format_type(atttypid, NULL), format_type(atttypid, atttypmod), attnotnull, atthasdef
+                FROM pg_attribute
+                WHERE attrelid = %s::regclass AND attnum > 0 AND NOT attisdropped
+            """, (cls.table_name,))
+            columns = {name: tuple(values) for name, *values in cur.fetchall()}
+
+            # Constraints, plus unique indexes created without a constraint (possibly partial)
+            cur.execute("""
+                SELECT
+                    CASE c.contype WHEN 'f' THEN 'foreign_key' WHEN 'c' THEN 'check' ELSE 'unique' END,
+                    c.conname,
+                    ARRAY(
+                        SELECT a.attname FROM unnest(c.conkey) WITH ORDINALITY AS k(attnum, position)
+                        JOIN pg_attribute a ON a.attrelid = c.conrelid AND a.attnum = k.attnum
+                        ORDER BY k.position
+                    ),
+                    c.confrelid::regclass::text,
+                    ARRAY(
+                        SELECT a.attname FROM unnest(c.confkey) WITH ORDINALITY AS k(attnum, position)
+                        JOIN pg_attribute a ON a.attrelid = c.confrelid AND a.attnum = k.attnum
+                        ORDER BY k.position
+                    ),
+                    pg_get_expr(c.conbin, c.conrelid),
+                    NULL
+                FROM pg_constraint c
+                WHERE c.conrelid = %s::regclass AND c.contype IN ('p', 'u', 'f', 'c')
+                UNION ALL
+                SELECT
+                    'unique',
+                    i.indexrelid::regclass::text,
+                    ARRAY(
+                        SELECT a.attname FROM unnest(i.indkey) WITH ORDINALITY AS k(attnum, position)
+                        JOIN pg_attribute a ON a.attrelid = i.indrelid AND a.attnum = k.attnum
+                        ORDER BY k.position
+                    ),
+                    NULL, NULL, NULL,
+                    pg_get_expr(i.indpred, i.indrelid)
+                FROM pg_index i
+                WHERE i.indrelid = %s::regclass AND i.indisunique AND i.indexprs IS NULL
+                  AND NOT EXISTS (SELECT 1 FROM pg_constraint c WHERE c.conindid = i.indexrelid)
+            """, (cls.table_name, cls.table_name))
+            constraints = [
+                {
+                    'kind': kind,
+                    'name': name,
+                    'columns': list(constraint_columns),
+                    'ref_table': ref_table,
+                    'ref_columns': list(ref_columns or []),
+                    'expression': expression,
+                    'predicate': predicate,
+                }
+                for kind, name, constraint_columns, ref_table, ref_columns, expression, predicate in cur.fetchall()
+            ]
+            _table_schema_cache[cls.table_name] = {'columns': columns, 'constraints': constraints}
+        return _table_schema_cache[cls.table_name]
+
+    @classmethod
+    def _dry_run_checks(cls, cur, columns: List[str], staging_table: str) -> List[Tuple[str, List[str], str, str]]:
+        """
+        Build the set-based checks of dry_run for the columns present in the records.
+        Each query returns the (row number, value) of the offending staged rows.
+
+        Args:
+            cur: Database cursor
+            columns: Columns of the staged records
+            staging_table: Name of the staging table (alias s in the queries)
+
+        Returns:
+            List of (rule, columns, query, message template with a {value} placeholder)
+        """
+        schema = cls._table_schema(cur)
+        present = set(columns)
+        checks = []
+
+        # NOT NULL columns and limits of the column types
+        for col in columns:
+            base_type, full_type, not_null, _ = schema['columns'][col]
+            if not_null:
+                checks.append((
+                    'required', [col],
+                    f"SELECT _row_number, NULL FROM {staging_table} s WHERE s.{col} IS NULL",
+                    "Este campo é obrigatório.",
+                ))
+            length = re.fullmatch(r"character(?: varying)?\((\d+)\)", full_type)
+            if length:
+                checks.append((
+                    'max_length', [col],
+                    f"SELECT _row_number, s.{col} FROM {staging_table} s WHERE length(s.{col}) > {int(length.group(1))}",
+                    f"Excede o limite de {length.group(1)} caracteres ({{value}}).",
+                ))
+            precision = re.fullmatch(r"numeric\((\d+),(\d+)\)", full_type)
+            if precision:
+                digits, scale = int(precision.group(1)), int(precision.group(2))
+                checks.append((
+                    'max_value', [col],
+                    f"SELECT _row_number, s.{col}::text FROM {staging_table} s "
+                    f"WHERE abs(round(s.{col}, {scale})) >= 10 ^ {digits - scale}",
+                    f"Excede o valor máximo da coluna, {digits - scale} dígitos inteiros ({{value}}).",
+                ))
+
+        # Conflict target of the upsert of the imported records: matching rows are updated
+        conflict_columns = list(cls.natural_keys[0]) if cls.natural_keys else None
+
+        for constraint in schema['constraints']:
+            constraint_columns = constraint['columns']
+            if not constraint_columns or not present.issuperset(constraint_columns):
+                continue
+            if constraint_columns == [cls.fingerprint_column]:
+                # Records already imported are skipped, not rejected (checked below)
+                continue
+            value = f"concat_ws(', ', {', '.join(f's.{col}' for col in constraint_columns)})"
+            not_null = ' AND '.join(f"s.{col} IS NOT NULL" for col in constraint_columns)
+
+            if constraint['kind'] == 'check':
+                checks.append((
+                    'check', constraint_columns,
+                    f"SELECT _row_number, {value} FROM {staging_table} s WHERE NOT ({constraint['expression']})",
+                    f"Viola a regra {constraint['name']} ({{value}}).",
+                ))
+
+            elif constraint['kind'] == 'foreign_key':
+                matches = ' AND '.join(
+                    f"r.{ref_col} = s.{col}" for col, ref_col in zip(constraint_columns, constraint['ref_columns'])
+                )
+                checks.append((
+                    'foreign_key', constraint_columns,
+                    f"SELECT _row_number, {value} FROM {staging_table} s "
+                    f"WHERE {not_null} AND NOT EXISTS (SELECT 1 FROM {constraint['ref_table']} r WHERE {matches})",
+                    f"Não existe em {constraint['ref_table']} ({{value}}).",
+                ))
+
+            elif constraint_columns != conflict_columns:
+                # Rows excluded by the predicate of a partial unique index are not checked
+                predicate = constraint['predicate']
+                if predicate:
+                    predicate_columns = set(re.findall(r"[a-z_][a-z0-9_]*", predicate)) & set(schema['columns'])
+                    if not present.issuperset(predicate_columns):
+                        continue
+                scope = f" AND ({predicate})" if predicate else ""
+                key_list = ', '.join(constraint_columns)
+                checks.append((
+                    'duplicate', constraint_columns,
+                    f"SELECT _row_number, value FROM ("
+                    f"SELECT _row_number, {value} AS value, "
+                    f"row_number() OVER (PARTITION BY {key_list} ORDER BY _row_number) AS occurrence "
+                    f"FROM {staging_table} s WHERE {not_null}{scope}) d WHERE occurrence > 1",
+                    "Valor repetido noutra linha do ficheiro ({value}).",
+                ))
+
+                matches = ' AND '.join(f"t.{col} = s.{col}" for col in constraint_columns)
+                if conflict_columns:
+                    # Rows updated by the upsert may keep their own values
+                    matches += (
+                        f" AND ROW({', '.join(f't.{col}' for col in conflict_columns)})"
+                        f" IS DISTINCT FROM ROW({', '.join(f's.{col}' for col in conflict_columns)})"
+                    )
+                checks.append((
+                    'duplicate', constraint_columns,
+                    f"SELECT _row_number, {value} FROM {staging_table} s WHERE {not_null}{scope} "
+                    f"AND EXISTS (SELECT 1 FROM {cls.table_name} t WHERE {matches}{scope})",
+                    "Já existe um registo com este valor ({value}).",
+                ))
+
+        # Records already imported, or repeated in the file, are skipped by the import
+        if cls.fingerprint_column in present:
+            fingerprint = cls.fingerprint_column
+            checks.append((
+                'already_imported', [fingerprint],
+                f"SELECT _row_number, NULL FROM ("
+                f"SELECT _row_number, row_number() OVER (PARTITION BY {fingerprint} ORDER BY _row_number) AS occurrence "
+                f"FROM {staging_table} s) d WHERE occurrence > 1",
+                "Registo igual ao de outra linha do ficheiro: será ignorado.",
+            ))
+            checks.append((
+                'already_imported', [fingerprint],
+                f"SELECT _row_number, NULL FROM {staging_table} s "
+                f"WHERE EXISTS (SELECT 1 FROM {cls.table_name} t WHERE t.{fingerprint} = s.{fingerprint})",
+                "Registo já importado: será ignorado.",
+            ))
+
+        # Overlapping periods of the same keys
+        if cls.period_columns and present.issuperset([*cls.period_columns, *cls.period_keys]):
+            start, end = cls.period_columns
+            keys = list(cls.period_keys)
+            not_null = ' AND '.join(f"s.{col} IS NOT NULL" for col in [start, *keys])
+            value = f"concat(s.{start}, ' a ', coalesce(s.{end}::text, '...'))"
+            partition = f"PARTITION BY {', '.join(keys)} " if keys else ""
+            # A row overlaps an earlier one (in start order) if it starts before the latest end so far
+            checks.append((
+                'overlap', [start, end],
+                f"SELECT _row_number, value FROM ("
+                f"SELECT _row_number, {value} AS value, s.{start} AS period_start, "
+                f"max(coalesce(s.{end}, 'infinity')) OVER ({partition}ORDER BY s.{start}, _row_number "
+                f"ROWS BETWEEN UNBOUNDED PRECEDING AND 1 PRECEDING) AS previous_end "
+                f"FROM {staging_table} s WHERE {not_null}) p WHERE previous_end >= period_start",
+                "Período sobreposto ao de outra linha do ficheiro ({value}).",
+            ))
+            matches = ' AND '.join(
+                [f"t.{col} = s.{col}" for col in keys]
+                + [f"t.{start} <= coalesce(s.{end}, 'infinity')", f"s.{start} <= coalesce(t.{end}, 'infinity')"]
+            )
+            if cls.fingerprint_column in present:
+                # A record already imported does not overlap its own copy
+                matches += f" AND t.{cls.fingerprint_column} IS DISTINCT FROM s.{cls.fingerprint_column}"
+            checks.append((
+                'overlap', [start, end],
+                f"SELECT _row_number, {value} FROM {staging_table} s "
+                f"WHERE {not_null} AND EXISTS (SELECT 1 FROM {cls.table_name} t WHERE {matches})",
+                "Período sobreposto ao de um registo existente ({value}).",
+            ))
+
+        return checks
+
+    @classmethod
+    @handle_service_error("Erro ao validar registos na base de dados")
+    def dry_run(cls, records: List[Dict], chunk_size: int = 10000) -> List[Dict[str, Any]]:
+        """
+        Check records against the database without storing them. The records are
+        copied into a temporary staging table and checked with one query per rule:
+        NOT NULL columns, text lengths and numeric limits, CHECK constraints,
+        foreign keys, unique keys (repeated in the file or already in the table),
+        overlapping periods (see period_columns) and records already imported
+        (see fingerprint_column). The transaction is rolled back, so nothing is
+        committed.
+
+        Args:
+            records: List of dictionaries containing column names and values
+            chunk_size: Number of records sent per COPY statement
+
+        Returns:
+            List of problems, ordered by record, as dictionaries with 'row' (1-based
+            position of the record), 'columns', 'rule' and 'message'
+        """
+        cls._validate_configuration()
+
+        if not records:
+            return []
+
+        cls._record_columns(records)
+        staging_table = f"{cls.table_name}_dry_run"
+        problems = []
+
+        with get_db_connection() as conn:
+            try:
+                with conn.cursor() as cur:
+                    records = cls._with_fingerprints(cur, records)
+                    columns = cls._record_columns(records)
+                    schema = cls._table_schema(cur)
+                    # Types without length or precision, so out-of-range values can be staged and reported
+                    # (character without a length is character(1), so it is staged as text)
+                    definitions = ', '.join(
+                        f"{col} {'text' if schema['columns'][col][0] == 'character' else schema['columns'][col][0]}"
+                        for col in columns
+                    )
+                    cur.execute(f"""
+                        CREATE TEMP TABLE {staging_table} (_row_number BIGSERIAL, {definitions})
+                        ON COMMIT DROP
+                    """)
+                    _copy_records(cur, staging_table, columns, records, chunk_size)
+                    cur.execute(f"ANALYZE {staging_table}")
+
+                    for rule, check_columns, query, message in cls._dry_run_checks(cur, columns, staging_table):
+                        cur.execute(query)
+                        problems.extend(
+                            {
+                                'row': row_number,
+                                'columns': check_columns,
+                                'rule': rule,
+                                'message': message.format(value=value),
+                            }
+                            for row_number, value in cur.fetchall()
+                        )
+            finally:
+                conn.rollback()
+
+        problems.sort(key=lambda problem: problem['row'])
+        return problems
+
     @classmethod
     @handle_service_error("Erro ao atualizar dados")
     def update(cls, record_id: int, data: Dict) -> bool:
@@ -138,7 +1095,7 @@ class BaseService:
         """
         cls._validate_configuration()
         
-        set_clauses = [f"{col} = %s" for col in data.keys()]
+        set_clauses = [f"{col} = %s" for col in data.keys()] + cls._touch_clauses(data.keys())
         values = list(data.values()) + [record_id]
         
         query = f"""
@@ -150,10 +1107,191 @@ class BaseService:
         with get_db_connection() as conn:
             with conn.cursor() as cur:
                 cur.execute(query, values)
+                if cls._changes_fingerprint(data):
+                    cls._refresh_fingerprints(cur, [record_id])
             conn.commit()
+        cls._invalidate_cache()
         
         return True
     
+    @classmethod
+    def _touch_clauses(cls, columns) -> List[str]:
+        """
+        Get the extra SET clauses that mark updated records with the current time.
+
+        Args:
+            columns: Columns already being set by the update
+
+        Returns:
+            List of SQL assignments
+        """
+        if cls.updated_at_column and cls.updated_at_column not in columns:
+            return [f"{cls.updated_at_column} = CURRENT_TIMESTAMP"]
+        return []
+
+    @classmethod
+    def _changes_fingerprint(cls, columns) -> bool:
+        """
+        Check whether an update writes any of the fingerprint fields.
+
+        Args:
+            columns: Columns being set by the update
+
+        Returns:
+            True if the fingerprints of the updated records must be recomputed
+        """
+        return bool(cls.fingerprint_column) and any(col in cls.fingerprint_fields for col in columns)
+
+    @classmethod
+    def _column_types(cls, cur) -> Dict[str, str]:
+        """
+        Get the SQL types of the columns of the table, as used in casts.
+        Types are given without modifiers: an explicit cast to varchar(n) would
+        silently truncate long values, while the assignment to the column rejects
+        them, like insert and update do. Read once from the catalog and cached per table.
+
+        Args:
+            cur: Database cursor
+
+        Returns:
+            Dictionary mapping column names to SQL types
+        """
+        if cls.table_name not in _column_types_cache:
+            # "character" alone means char(1), so blank-padded columns are cast to bpchar
+            cur.execute("""
+                SELECT attname,
+                       CASE WHEN atttypid = 'bpchar'::regtype THEN 'bpchar' ELSE format_type(atttypid, NULL) END
+                FROM pg_attribute
+                WHERE attrelid = %s::regclass AND attnum > 0 AND NOT attisdropped
+            """, (cls.table_name,))
+            _column_types_cache[cls.table_name] = dict(cur.fetchall())
+        return _column_types_cache[cls.table_name]
+
+    @classmethod
+    @handle_service_error("Erro ao atualizar múltiplos registos")
+    def update_many(cls, updates: List[Tuple[int, Dict]], chunk_size: int = 1000) -> int:
+        """
+        Generic method to apply different changes to many records in a single transaction.
+        Records changing the same columns are updated together with one
+        UPDATE ... FROM (VALUES ...) statement per chunk.
+        
+        Args:
+            updates: List of (record_id, changes) tuples, where changes is a dictionary
+                of column names and new values
+            chunk_size: Number of records per statement
+            
+        Returns:
+            Number of records updated
+            
+        Raises:
+            Exception: If the update operation fails
+        """
+        cls._validate_configuration()
+        
+        # Group the records by the set of columns they change
+        groups = {}
+        for record_id, changes in updates:
+            if not changes:
+                continue
+            if cls.primary_key in changes:
+                raise ValueError(f"Não é possível alterar a coluna '{cls.primary_key}'")
+            groups.setdefault(tuple(changes.keys()), []).append((record_id, changes))
+        
+        if not groups:
+            return 0
+        
+        updated = 0
+        with get_db_connection() as conn:
+            with conn.cursor() as cur:
+                column_types = cls._column_types(cur)
+                
+                for columns, group in groups.items():
+                    cls._record_columns([dict.fromkeys(columns)])
+                    value_columns = [cls.primary_key] + list(columns)
+                    
+                    set_clauses = [f"{col} = v.{col}" for col in columns] + cls._touch_clauses(columns)
+                    query = f"""
+                        UPDATE {cls.table_name} AS t
+                        SET {', '.join(set_clauses)}
+                        FROM (VALUES %s) AS v ({', '.join(value_columns)})
+                        WHERE t.{cls.primary_key} = v.{cls.primary_key}
+                    """
+                    # VALUES are untyped, so cast them to the types of the table columns
+                    template = "(" + ", ".join(f"%s::{column_types[col]}" for col in value_columns) + ")"
+                    
+                    for start in range(0, len(group), chunk_size):
+                        values = [
+                            (record_id,) + tuple(changes[col] for col in columns)
+                            for record_id, changes in group[start:start + chunk_size]
+                        ]
+                        execute_values(cur, query, values, template=template, page_size=len(values))
+                        updated += cur.rowcount
+                
+                cls._refresh_fingerprints(cur, [
+                    record_id
+                    for columns, group in groups.items() if cls._changes_fingerprint(columns)
+                    for record_id, _ in group
+                ])
+            conn.commit()
+        cls._invalidate_cache()
+        
+        return updated
+    
+    @classmethod
+    @handle_service_error("Erro ao atualizar múltiplos registos")
+    def update_where(cls, filters: Dict, changes: Dict) -> int:
+        """
+        Generic method to apply the same changes to every record matching a filter,
+        with a single UPDATE statement.
+        
+        Args:
+            filters: Filter specification on the table columns (see utils.query_filters).
+                Must not be empty; to update every record use e.g. {'id': {'is_null': False}}
+            changes: Dictionary containing column names and new values
+            
+        Returns:
+            Number of records updated
+            
+        Raises:
+            Exception: If the update operation fails
+        """
+        cls._validate_configuration()
+        
+        if not filters:
+            raise ValueError("É necessário indicar pelo menos um filtro para atualizar registos")
+        if not changes:
+            return 0
+        cls._record_columns([changes])
+        
+        def resolve_table_column(name: str) -> str:
+            if name != cls.primary_key and name not in cls.columns:
+                raise ValueError(f"Coluna '{name}' não permitida em {cls.table_name}")
+            return name
+        
+        where_clause, where_params = build_where_clause(filters, resolve_table_column)
+        if not where_clause:
+            # e.g. {'amount': {}}: the filter is not empty but has no conditions
+            raise ValueError("É necessário indicar pelo menos um filtro para atualizar registos")
+        set_clauses = [f"{col} = %s" for col in changes.keys()] + cls._touch_clauses(changes.keys())
+        
+        query = f"""
+            UPDATE {cls.table_name}
+            SET {', '.join(set_clauses)}
+            WHERE {where_clause}
+            RETURNING {cls.primary_key}
+        """
+        
+        with get_db_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(query, list(changes.values()) + where_params)
+                record_ids = [row[0] for row in cur.fetchall()]
+                if cls._changes_fingerprint(changes):
+                    cls._refresh_fingerprints(cur, record_ids)
+            conn.commit()
+        cls._invalidate_cache()
+        
+        return len(record_ids)
+    
     @classmethod
     @handle_service_error("Erro ao eliminar registo")
     def delete(cls, record_id: int) -> bool:
@@ -177,6 +1315,7 @@ class BaseService:
             with conn.cursor() as cur:
                 cur.execute(query, (record_id,))
             conn.commit()
+        cls._invalidate_cache()
         
         return True
     
@@ -203,24 +1342,26 @@ class BaseService:
             with conn.cursor() as cur:
                 cur.execute(query, (record_ids,))
             conn.commit()
+        cls._invalidate_cache()
         
         return True
     
     @classmethod
     @handle_service_error("Erro ao obter registo")
-    def get(cls, record_id: int) -> Optional[Dict[str, Any]]:
+    def get(cls, record_id: int, columns: List[str] = None) -> Optional[Dict[str, Any]]:
         """
         Generic method to get a single record by ID.
         
         Args:
             record_id: The ID of the record to retrieve
+            columns: Names of the columns to return (defaults to all columns)
             
         Returns:
             Dictionary with record data or None if not found
         """
         cls._validate_configuration()
         
-        query = f"SELECT * FROM {cls.table_name} WHERE {cls.primary_key} = %s"
+        query = f"SELECT {cls._select_list(columns)} FROM {cls.table_name} WHERE {cls.primary_key} = %s"
         
         with get_db_connection() as conn:
             with conn.cursor() as cur:
@@ -238,36 +1379,209 @@ class BaseService:
     
     @classmethod
     @handle_service_error("Erro ao carregar dados")
-    def get_many(cls, conditions: Dict = None, order_by: str = None) -> pd.DataFrame:
+    def get_many(cls, conditions: Dict = None, order_by: str = None, columns: List[str] = None) -> pd.DataFrame:
         """
         Generic method to load all records that match certain conditions.
+        Filtering is done by the database, so only matching rows are transferred.
         
         Args:
-            conditions: Dictionary of column-value pairs for WHERE clause
+            conditions: Filter specification for the WHERE clause. Plain values
+                mean equality; see utils.query_filters for ranges, ILIKE, IN and IS NULL
             order_by: Column name to order by
+            columns: Names of the columns to return (defaults to all columns)
             
         Returns:
             Pandas DataFrame with results
         """
         cls._validate_configuration()
         
-        query = f"SELECT * FROM {cls.table_name}"
-        params = []
-        
-        # Add WHERE clause if conditions provided
-        if conditions:
-            where_clauses = []
-            for col, val in conditions.items():
-                where_clauses.append(f"{col} = %s")
-                params.append(val)
-            
-            query += f" WHERE {' AND '.join(where_clauses)}"
+        where_clause, params = cls._build_where(conditions)
+        query = f"SELECT {cls._select_list(columns)} FROM {cls.table_name}{where_clause}"
         
         # Add ORDER BY clause
-        order_by = order_by or cls.default_order_by
-        if order_by:
-            query += f" ORDER BY {order_by}"
+        query += cls._order_by_clause(order_by)
         
         # Execute query using pandas
-        engine = get_db_engine()
-        return pd.read_sql_query(query, engine, params=tuple(params))
+        return cls._read_sql(query, tuple(params))
+
+    @classmethod
+    def _parse_order_by(cls, order_by: str = None) -> List[Tuple[str, str, bool]]:
+        """
+        Parse an order by expression into the sort keys used for keyset pagination.
+        The primary key is appended as a tie-breaker so that every key is unique.
+        Sort columns must not contain NULL values.
+
+        Args:
+            order_by: Order by expression (defaults to default_order_by)
+
+        Returns:
+            List of (sql_expression, result_column, descending) tuples
+        """
+        order_by = order_by or cls.default_order_by or cls.primary_key
+
+        keys = []
+        for term in order_by.split(','):
+            parts = term.split()
+            name = parts[0]
+            descending = len(parts) > 1 and parts[1].upper() == 'DESC'
+            expression = name if '.' in name else cls._resolve_column(name)
+            keys.append((expression, name.split('.')[-1], descending))
+
+        if cls.primary_key not in [column for _, column, _ in keys]:
+            keys.append((cls._resolve_column(cls.primary_key), cls.primary_key, keys[-1][2]))
+
+        return keys
+
+    @classmethod
+    def _seek_predicate(cls, keys: List[Tuple[str, str, bool]], values: List[Any]) -> Tuple[str, List]:
+        """
+        Build the condition selecting the rows that come after a cursor.
+
+        Args:
+            keys: Sort keys returned by _parse_order_by
+            values: Sort key values of the last row of the previous page
+
+        Returns:
+            Tuple of (sql, params)
+        """
+        if len(values) != len(keys):
+            raise ValueError("Cursor de paginação inválido")
+
+        expressions = [expression for expression, _, _ in keys]
+        directions = {descending for _, _, descending in keys}
+
+        # Same direction on every key: a row comparison can use a composite index
+        if len(directions) == 1:
+            operator = "<" if keys[0][2] else ">"
+            placeholders = ", ".join(["%s"] * len(keys))
+            return f"({', '.join(expressions)}) {operator} ({placeholders})", list(values)
+
+        # Mixed directions: (a > x) OR (a = x AND b < y) OR ...
+        clauses = []
+        params = []
+        for i, (expression, _, descending) in enumerate(keys):
+            equalities = [f"{expressions[j]} = %s" for j in range(i)]
+            operator = "<" if descending else ">"
+            clauses.append("(" + " AND ".join(equalities + [f"{expression} {operator} %s"]) + ")")
+            params.extend(values[:i] + [values[i]])
+        return "(" + " OR ".join(clauses) + ")", params
+
+    @classmethod
+    def _estimate_count(cls, query: str, params: List) -> Optional[int]:
+        """
+        Estimate the number of rows returned by a query from the planner statistics.
+        Much cheaper than COUNT(*) on large tables, but only approximate.
+
+        Args:
+            query: SQL query
+            params: Query parameters
+
+        Returns:
+            Estimated row count, or None if it cannot be estimated
+        """
+        with get_db_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(f"EXPLAIN (FORMAT JSON) {query}", params)
+                plan = cur.fetchone()[0]
+
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        try:
+            return int(plan[0]["Plan"]["Plan Rows"])
+        except (KeyError, IndexError, TypeError):
+            return None
+
+    @classmethod
+    def _fetch_page(
+        cls,
+        select_query: str,
+        filters: Dict = None,
+        order_by: str = None,
+        after_key: str = None,
+        limit: int = 50,
+        with_total: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Fetch one page of a query using keyset (seek) pagination.
+
+        Args:
+            select_query: SELECT ... FROM ... part of the query, without WHERE/ORDER BY
+            filters: Filter specification (see utils.query_filters)
+            order_by: Order by expression (defaults to default_order_by)
+            after_key: Cursor returned by the previous page, None for the first page
+            limit: Maximum number of rows in the page
+            with_total: Whether to include an approximate total row count
+
+        Returns:
+            Dictionary with 'data' (DataFrame), 'next_cursor' (None on the last page)
+            and 'approx_total' (None unless requested)
+        """
+        cls._validate_configuration()
+
+        keys = cls._parse_order_by(order_by)
+        filter_clause, params = build_where_clause(filters, cls._resolve_column)
+
+        approx_total = None
+        if with_total:
+            count_query = select_query + (f" WHERE {filter_clause}" if filter_clause else "")
+            approx_total = cls._estimate_count(count_query, params)
+
+        predicates = [filter_clause] if filter_clause else []
+        if after_key:
+            seek_clause, seek_params = cls._seek_predicate(keys, _decode_cursor(after_key))
+            predicates.append(seek_clause)
+            params = params + seek_params
+
+        query = select_query
+        if predicates:
+            query += " WHERE " + " AND ".join(predicates)
+        query += " ORDER BY " + ", ".join(
+            f"{expression} {'DESC' if descending else 'ASC'}" for expression, _, descending in keys
+        )
+        # Fetch one extra row to know whether there is a next page
+        query += " LIMIT %s"
+        params = params + [limit + 1]
+
+        df = cls._read_sql(query, tuple(params))
+
+        next_cursor = None
+        if len(df) > limit:
+            df = df.iloc[:limit]
+            last_row = df.iloc[-1]
+            next_cursor = _encode_cursor([last_row[column] for _, column, _ in keys])
+
+        return {
+            'data': df,
+            'next_cursor': next_cursor,
+            'approx_total': approx_total,
+        }
+
+    @classmethod
+    @handle_service_error("Erro ao carregar página de dados")
+    def get_page(
+        cls,
+        filters: Dict = None,
+        order_by: str = None,
+        after_key: str = None,
+        limit: int = 50,
+        with_total: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Generic method to load one page of records using keyset pagination.
+        Pages are read with an index-friendly seek on the ordering columns
+        instead of OFFSET, so later pages are as cheap as the first one.
+        
+        Args:
+            filters: Filter specification (see utils.query_filters)
+            order_by: Order by expression (defaults to default_order_by)
+            after_key: Cursor returned by the previous page, None for the first page
+            limit: Maximum number of rows in the page
+            with_total: Whether to include an approximate total row count
+            
+        Returns:
+            Dictionary with 'data' (DataFrame), 'next_cursor' (None on the last page)
+            and 'approx_total' (None unless requested)
+        """
+        return cls._fetch_page(
+            f"SELECT * FROM {cls.table_name}", filters, order_by, after_key, limit, with_total
+        )
@@ -0,0 +1,441 @@
+import streamlit as st
+import pandas as pd
+import hashlib
+import io
+import multiprocessing
+import os
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, List, Callable, Tuple, Optional, Any, Type
+from utils.base_service import BaseService
+from utils.bulk_import import (
+    column_mapping_ui, validate_mapping, process_frame, build_error_report, display_error_downloads,
+    display_unresolved_values, import_data,
+)
+from utils.entity_import import compile_validation_plan
+from utils.import_batches import ImportBatchService
+from utils.import_profiles import ImportProfileService
+from utils.import_resolution import ForeignKeyResolver
+from utils.columnar import is_columnar_file, read_columnar, COLUMNAR_EXTENSIONS
+from config.imports import IMPORT_CONFIG
+
+# Extensions of the files read by batch imports (zip archives are expanded into them)
+BATCH_FILE_TYPES = (".csv", ".xlsx", ".xls") + COLUMNAR_EXTENSIONS
+
+# Session state key of the sheet headers of the uploaded batch (see read_batch_headers)
+BATCH_HEADERS_KEY = "batch_import_headers"
+
+
+def expand_uploads(uploaded_files) -> List[Tuple[str, bytes]]:
+    """
+    Get the files of a batch upload, expanding zip archives into the CSV, Excel,
+    Parquet and Arrow files they contain (see BATCH_FILE_TYPES).
+
+    Args:
+        uploaded_files: Files uploaded through Streamlit's file_uploader
+
+    Returns:
+        List of (file name, content) tuples, in upload order
+    """
+    files = []
+    for uploaded_file in uploaded_files:
+        if uploaded_file.name.lower().endswith(".zip"):
+            with zipfile.ZipFile(io.BytesIO(uploaded_file.getbuffer())) as archive:
+                for entry in archive.infolist():
+                    base_name = os.path.basename(entry.filename)
+                    if entry.is_dir() or entry.filename.startswith("__MACOSX/") or base_name.startswith("."):
+                        continue
+                    if base_name.lower().endswith(BATCH_FILE_TYPES):
+                        files.append((f"{uploaded_file.name}/{entry.filename}", archive.read(entry)))
+        elif uploaded_file.name.lower().endswith(BATCH_FILE_TYPES):
+            files.append((uploaded_file.name, bytes(uploaded_file.getbuffer())))
+    return files
+
+
+def _read_sheet(file_name: str, content: bytes, sheet: Optional[str], rows: int = None) -> pd.DataFrame:
+    """Read a CSV, Parquet or Arrow file or an Excel sheet, or only its first rows."""
+    if is_columnar_file(file_name):
+        return read_columnar(io.BytesIO(content), file_name, rows=rows)
+    if file_name.lower().endswith(".csv"):
+        return pd.read_csv(io.BytesIO(content), nrows=rows)
+    return pd.read_excel(io.BytesIO(content), sheet_name=sheet, nrows=rows)
+
+
+def read_batch_headers(files: List[Tuple[str, bytes]]) -> Tuple[List[Dict[str, Any]], List[str]]:
+    """
+    List the sheets of a batch and the columns found in them, for the column
+    mapping. Cached in session_state for the same set of files.
+
+    Args:
+        files: Files returned by expand_uploads
+
+    Returns:
+        Tuple of (sheets, columns): the sheets as dictionaries with 'file', 'sheet'
+        (None for files without sheets) and 'columns', and every column found, in order
+    """
+    digest = hashlib.sha256()
+    for file_name, content in files:
+        digest.update(file_name.encode("utf-8"))
+        digest.update(hashlib.sha256(content).digest())
+    digest = digest.hexdigest()
+
+    cached = st.session_state.get(BATCH_HEADERS_KEY)
+    if cached is None or cached['digest'] != digest:
+        sheets = []
+        for file_name, content in files:
+            if file_name.lower().endswith(".csv") or is_columnar_file(file_name):
+                sheet_names = [None]
+            else:
+                with pd.ExcelFile(io.BytesIO(content)) as workbook:
+                    sheet_names = workbook.sheet_names
+            for sheet in sheet_names:
+                try:
+                    columns = list(_read_sheet(file_name, content, sheet, rows=0).columns)
+                except Exception as e:
+                    print(f"Error reading header of {file_name} {sheet or ''}: {str(e)}")
+                    columns = []
+                sheets.append({'file': file_name, 'sheet': sheet, 'columns': columns})
+        cached = {'digest': digest, 'sheets': sheets}
+        st.session_state[BATCH_HEADERS_KEY] = cached
+
+    columns = list(dict.fromkeys(col for sheet in cached['sheets'] for col in sheet['columns']))
+    return cached['sheets'], columns
+
+
+def _parse_sheet(file_name: str, content: bytes, sheet: Optional[str]) -> Tuple[pd.DataFrame, float]:
+    """Read a sheet on a worker process, timing it."""
+    start = time.monotonic()
+    return _read_sheet(file_name, content, sheet), time.monotonic() - start
+
+
+def validate_sheet(
+    df: pd.DataFrame,
+    column_mapping: Dict[str, str],
+    fields_config: List[Dict[str, Any]],
+    plan: List = None,
+    resolver: ForeignKeyResolver = None
+) -> Dict[str, Any]:
+    """
+    Map and validate one sheet of a batch. Columns of the mapping that the
+    sheet lacks are left unmapped, unless the field is required.
+
+    Args:
+        df: Data of the sheet
+        column_mapping: Dictionary mapping standard fields to file columns
+        fields_config: List of field configurations with key, display_name, validators, etc.
+        plan: Compiled validation plan shared by the sheets
+        resolver: Foreign key resolution stage shared by the sheets
+
+    Returns:
+        Dictionary with 'valid_records', 'errors' (see process_frame) and 'report'
+        (invalid rows, see build_error_report)
+
+    Raises:
+        ValueError: If the sheet lacks the column of a required field
+    """
+    sheet_mapping = {field: column for field, column in column_mapping.items() if column in df.columns}
+    is_valid, missing_fields = validate_mapping(sheet_mapping, fields_config)
+    if not is_valid:
+        raise ValueError(f"Colunas obrigatórias em falta: {', '.join(missing_fields)}")
+
+    valid_records, errors = process_frame(df, sheet_mapping, fields_config, plan, resolver)
+    report = build_error_report(df, errors) if not errors.empty else None
+    return {'valid_records': valid_records, 'errors': errors, 'report': report}
+
+
+def process_batch(
+    files: List[Tuple[str, bytes]],
+    sheets: List[Dict[str, Any]],
+    column_mapping: Dict[str, str],
+    fields_config: List[Dict[str, Any]],
+    resolver: ForeignKeyResolver = None,
+    max_workers: int = None
+) -> List[Dict[str, Any]]:
+    """
+    Parse, map and validate the sheets of a batch. Parsing (mostly Excel, which
+    holds the GIL) runs on a pool of worker processes, and every sheet is
+    validated as soon as it is parsed, while the others are still being read.
+    The validation plan and the driver/car lookups are built once and shared.
+
+    Args:
+        files: Files returned by expand_uploads
+        sheets: Sheets returned by read_batch_headers
+        column_mapping: Dictionary mapping standard fields to file columns
+        fields_config: List of field configurations with key, display_name, validators, etc.
+        resolver: Foreign key resolution stage shared by the sheets
+        max_workers: Number of sheets parsed at the same time (defaults to IMPORT_BATCH_WORKERS)
+
+    Returns:
+        One dictionary per sheet, in the order of the sheets, with 'file', 'sheet',
+        'rows', 'valid_records', 'errors', 'report', 'elapsed' (parsing and
+        validation time, in seconds) and 'failure' (error that prevented
+        validating the sheet)
+    """
+    contents = dict(files)
+    plan = compile_validation_plan(fields_config)
+    results = [
+        {
+            'file': sheet['file'],
+            'sheet': sheet['sheet'],
+            'rows': 0,
+            'valid_records': [],
+            'errors': None,
+            'report': None,
+            'elapsed': 0.0,
+            'failure': None,
+        }
+        for sheet in sheets
+    ]
+
+    # Workers are spawned, not forked: forking the server process, with its threads
+    # and open database connections, can deadlock the children
+    with ProcessPoolExecutor(
+        max_workers=max_workers or IMPORT_CONFIG['batch_workers'],
+        mp_context=multiprocessing.get_context("spawn"),
+    ) as executor:
+        futures = {
+            executor.submit(_parse_sheet, sheet['file'], contents[sheet['file']], sheet['sheet']): result
+            for sheet, result in zip(sheets, results)
+        }
+        for future in as_completed(futures):
+            result = futures[future]
+            start = time.monotonic()
+            try:
+                df, parse_time = future.result()
+                result['rows'] = len(df)
+                result['elapsed'] = parse_time
+                result.update(validate_sheet(df, column_mapping, fields_config, plan, resolver))
+            except Exception as e:
+                print(f"Error processing {result['file']} {result['sheet'] or ''}: {str(e)}")
+                result['failure'] = str(e)
+            result['elapsed'] += time.monotonic() - start
+
+    return results
+
+
+def batch_results_frame(results: List[Dict[str, Any]]) -> pd.DataFrame:
+    """
+    Format the per-sheet results of a batch for display.
+
+    Args:
+        results: Results returned by process_batch
+
+    Returns:
+        DataFrame with one row per sheet
+    """
+    return pd.DataFrame(
+        [
+            {
+                'Ficheiro': result['file'],
+                'Folha': result['sheet'] or "",
+                'Linhas': result['rows'],
+                'Válidas': len(result['valid_records']),
+                'Com Erros': result['errors']['row'].nunique() if result['errors'] is not None else 0,
+                'Tempo (s)': round(result['elapsed'], 2),
+                'Linhas/s': round(result['rows'] / result['elapsed']) if result['elapsed'] else 0,
+                'Erro': result['failure'] or "",
+            }
+            for result in results
+        ],
+        columns=['Ficheiro', 'Folha', 'Linhas', 'Válidas', 'Com Erros', 'Tempo (s)', 'Linhas/s', 'Erro'],
+    )
+
+
+def batch_error_report(results: List[Dict[str, Any]]) -> pd.DataFrame:
+    """
+    Combine the error reports of the sheets of a batch.
+
+    Args:
+        results: Results returned by process_batch
+
+    Returns:
+        DataFrame with the invalid rows of every sheet, preceded by the columns
+        'Ficheiro' and 'Folha'
+    """
+    reports = []
+    for result in results:
+        if result['report'] is not None:
+            report = result['report'].copy()
+            report.insert(0, 'Folha', result['sheet'] or "")
+            report.insert(0, 'Ficheiro', result['file'])
+            reports.append(report)
+    return pd.concat(reports, ignore_index=True) if reports else pd.DataFrame()
+
+
+def load_batch(
+    service_class: Type[BaseService],
+    records: List[Dict],
+    description: str,
+    batch_hash: str,
+    column_mapping: Dict[str, str]
+) -> Dict[str, int]:
+    """
+    Load the valid records of every sheet of a batch in a single transaction,
+    recorded as one import batch (so it can be rolled back as a whole).
+
+    Args:
+        service_class: Service of the table the records are imported into
+        records: Valid records of all the sheets
+        description: Description of the batch (e.g. the number of files)
+        batch_hash: SHA-256 of the files of the batch
+        column_mapping: Dictionary mapping standard fields to file columns
+
+    Returns:
+        Dictionary with the number of 'inserted', 'updated' and 'unchanged' records
+        (records already imported are unchanged)
+    """
+    batch_id = ImportBatchService.start(service_class, description, batch_hash, column_mapping, len(records))
+    try:
+        counts = ImportBatchService.load_chunk(service_class, batch_id, 1, records)
+    except Exception as e:
+        ImportBatchService.finish(batch_id, str(e))
+        raise
+    ImportBatchService.finish(batch_id)
+    return counts
+
+
+def mapping_profile_ui(service_class: Type[BaseService]) -> Tuple[str, Dict[str, str]]:
+    """
+    Create UI for choosing a saved mapping profile.
+
+    Args:
+        service_class: Service of the imported table
+
+    Returns:
+        Tuple of (profile name, column mapping), empty when no profile is chosen
+    """
+    profiles = ImportProfileService.get_profiles(service_class)
+    profile_name = st.selectbox(
+        "Perfil de mapeamento",
+        options=[""] + list(profiles),
+        format_func=lambda name: name or "-- Nenhum --",
+        key="batch_import_profile",
+    )
+    return profile_name, profiles.get(profile_name, {})
+
+
+def save_profile_ui(service_class: Type[BaseService], column_mapping: Dict[str, str], profile_name: str = "") -> None:
+    """
+    Create UI for saving the current column mapping as a profile.
+
+    Args:
+        service_class: Service of the imported table
+        column_mapping: Dictionary mapping standard fields to file columns
+        profile_name: Name of the profile in use, suggested as the name
+    """
+    with st.expander("Guardar mapeamento como perfil"):
+        name = st.text_input("Nome do perfil", value=profile_name, key="batch_import_profile_name")
+        if st.button("Guardar Perfil", key="batch_import_save_profile"):
+            try:
+                ImportProfileService.save(service_class, name, column_mapping)
+                st.success(f"Perfil '{name.strip()}' guardado.")
+            except Exception as e:
+                st.error(f"Erro ao guardar perfil: {str(e)}")
+
+
+def batch_import_component(
+    entity_name: str,
+    fields_config: List[Dict[str, Any]],
+    upload_function: Callable,
+    service_class: Type[BaseService] = None,
+):
+    """
+    Reusable component for importing many files at once: CSV files, Excel
+    workbooks (every sheet) and zip archives of them. All the sheets share one
+    column mapping, optionally a saved profile, and are parsed in parallel;
+    their valid records are then loaded together in a single transaction.
+
+    Args:
+        entity_name: Name of the entity being imported (e.g., "receitas", "motoristas")
+        fields_config: List of field configurations with key, display_name, validators, etc.
+        upload_function: Function that uploads validated data (used without service_class)
+        service_class: Service of the imported table; when given, the batch is loaded
+            as one import batch and mapping profiles can be saved
+    """
+    st.subheader(f"Importação em Lote de {entity_name.capitalize()}")
+
+    uploaded_files = st.file_uploader(
+        "Carregar ficheiros CSV, Excel, Parquet, Arrow ou ZIP",
+        type=[extension.lstrip(".") for extension in BATCH_FILE_TYPES] + ["zip"],
+        accept_multiple_files=True,
+        key="batch_import_files",
+    )
+    if not uploaded_files:
+        return
+
+    try:
+        files = expand_uploads(uploaded_files)
+        sheets, file_columns = read_batch_headers(files)
+    except Exception as e:
+        st.error(f"Erro ao processar os ficheiros: {str(e)}")
+        return
+
+    if not sheets:
+        st.warning("Não foram encontrados ficheiros CSV ou Excel para importar.")
+        return
+    st.caption(f"{len(files)} ficheiros · {len(sheets)} folhas")
+
+    # Column mapping shared by all the sheets, optionally from a saved profile
+    profile_name, profile_mapping = "", {}
+    if service_class is not None:
+        profile_name, profile_mapping = mapping_profile_ui(service_class)
+    column_mapping = column_mapping_ui(
+        ["-- Não Mapear --"] + file_columns,
+        fields_config,
+        defaults=profile_mapping,
+        key_prefix=f"batch_mapping_{profile_name}",
+    )
+    if service_class is not None:
+        save_profile_ui(service_class, column_mapping, profile_name)
+
+    if not st.button("Processar e Importar Lote", use_container_width=True):
+        return
+
+    is_valid, missing_fields = validate_mapping(column_mapping, fields_config)
+    if not is_valid:
+        st.error(f"Campos obrigatórios não mapeados: {', '.join(missing_fields)}")
+        return
+
+    resolver = ForeignKeyResolver()
+    with st.spinner(f"A validar {len(sheets)} folhas...", show_time=True):
+        results = process_batch(files, sheets, column_mapping, fields_config, resolver)
+
+    st.dataframe(batch_results_frame(results), hide_index=True, use_container_width=True)
+
+    labels = {field_def.get('key'): field_def.get('label') for field_def in fields_config}
+    unresolved = resolver.unresolved_report(labels)
+    failed = [result for result in results if result['failure']]
+    invalid_rows = sum(result['errors']['row'].nunique() for result in results if result['errors'] is not None)
+    records = [record for result in results for record in result['valid_records']]
+
+    if failed or invalid_rows:
+        st.error(f"Encontradas {invalid_rows} linhas com erros e {len(failed)} folhas que não puderam ser lidas.")
+        if unresolved:
+            display_unresolved_values(unresolved)
+        if invalid_rows:
+            display_error_downloads(batch_error_report(results), file_name=f"erros_lote_{entity_name}")
+        st.warning("Corrija os erros nos ficheiros e tente novamente. Nenhum registo foi importado.")
+        return
+
+    if not records:
+        st.warning("Não foram encontrados registos válidos para importar.")
+        return
+
+    if service_class is None:
+        import_data(records, upload_function)
+        return
+
+    batch_hash = hashlib.sha256(
+        ''.join(hashlib.sha256(content).hexdigest() for _, content in files).encode("utf-8")
+    ).hexdigest()
+    description = f"Lote de {len(files)} ficheiros ({len(sheets)} folhas)"
+    with st.spinner(f"A importar {len(records)} registos...", show_time=True):
+        try:
+            counts = load_batch(service_class, records, description, batch_hash, column_mapping)
+        except Exception as e:
+            st.error(f"Erro ao importar dados: {str(e)}")
+            return
+    st.success(f"{counts['inserted'] + counts['updated']} registos de {len(sheets)} folhas importados com sucesso!")
+    if counts['unchanged']:
+        st.info(f"{counts['unchanged']} registos já importados ou sem alterações foram ignorados.")
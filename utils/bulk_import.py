@@ -1,12 +1,83 @@
 import streamlit as st
+import numpy as np
 import pandas as pd
-import tempfile
+import hashlib
+import io
 import os
+import tempfile
+import time
 from typing import Dict, List, Callable, Tuple, Optional, Any
 from utils.error_handlers import handle_streamlit_error
 from typing import Dict, List, Callable, Any, Type, Tuple
 from utils.base_service import BaseService
-from utils.entity_import import create_generic_uploader, create_record_validator
+from utils.entity_import import create_generic_uploader, compile_validation_plan, FieldRule
+from utils.import_jobs import get_import_jobs, import_jobs_panel
+from utils.import_batches import ImportBatchService, create_batch_uploader, import_batches_panel
+from utils.import_resolution import ForeignKeyResolver, unresolved_report_frame
+from utils.columnar import is_columnar_file, read_columnar, COLUMNAR_EXTENSIONS
+from utils.export import EXPORT_FORMATS, export_dataframe
+from config.imports import IMPORT_CONFIG
+
+
+# Session state keys of the parsed upload (see read_upload) and of its content hash
+UPLOAD_CACHE_KEY = "bulk_import_upload_cache"
+UPLOAD_DIGEST_KEY = "bulk_import_upload_digest"
+
+
+def upload_digest(uploaded_file) -> str:
+    """
+    Get the SHA-256 of the content of an uploaded file, hashing its buffer
+    without copying it. The hash is computed once per upload (file_id).
+
+    Args:
+        uploaded_file: The file uploaded through Streamlit's file_uploader
+
+    Returns:
+        Hexadecimal digest of the file content
+    """
+    file_id = getattr(uploaded_file, 'file_id', None)
+    memo = st.session_state.get(UPLOAD_DIGEST_KEY)
+    if memo is None or file_id is None or memo[0] != file_id:
+        memo = (file_id, hashlib.sha256(uploaded_file.getbuffer()).hexdigest())
+        st.session_state[UPLOAD_DIGEST_KEY] = memo
+    return memo[1]
+
+
+def read_upload(uploaded_file, sheet_index: int = 0) -> Tuple[pd.DataFrame, List[str]]:
+    """
+    Parse an uploaded file straight from its in-memory buffer.
+    The parsed sheets are cached in the session by content hash and sheet index,
+    so the reruns triggered by the mapping widgets do not parse the file again.
+    Only the sheets of the latest upload are kept. The returned DataFrame is
+    shared with the cache and must not be modified.
+
+    Args:
+        uploaded_file: The file uploaded through Streamlit's file_uploader
+        sheet_index: Index of the sheet to read (ignored for CSV files)
+
+    Returns:
+        Tuple of (DataFrame with the sheet data, list of sheet names if Excel)
+    """
+    digest = upload_digest(uploaded_file)
+    cache = st.session_state.get(UPLOAD_CACHE_KEY)
+    if cache is None or cache['digest'] != digest:
+        cache = {'digest': digest, 'sheet_names': [], 'sheets': {}}
+        st.session_state[UPLOAD_CACHE_KEY] = cache
+
+    if uploaded_file.name.lower().endswith(".csv"):
+        sheet_index = 0
+
+    if sheet_index not in cache['sheets']:
+        buffer = io.BytesIO(uploaded_file.getbuffer())
+        if uploaded_file.name.lower().endswith(".csv"):
+            df = pd.read_csv(buffer)
+        else:  # Excel file
+            with pd.ExcelFile(buffer) as excel_file:
+                cache['sheet_names'] = excel_file.sheet_names
+                df = pd.read_excel(excel_file, sheet_name=sheet_index)
+        cache['sheets'][sheet_index] = df
+
+    return cache['sheets'][sheet_index], cache['sheet_names']
 
 
 def load_file(uploaded_file) -> Optional[Tuple[pd.DataFrame, List[str]]]:
@@ -19,46 +90,13 @@ def load_file(uploaded_file) -> Optional[Tuple[pd.DataFrame, List[str]]]:
     Returns:
         Tuple containing (DataFrame with file data, list of sheet names if Excel) or None if an error occurs
     """
-    tmp_filepath = None
     try:
-        # Create a temporary file to store the uploaded content
-        with tempfile.NamedTemporaryFile(
-            delete=False, suffix=os.path.splitext(uploaded_file.name)[1]
-        ) as tmp_file:
-            tmp_file.write(uploaded_file.getvalue())
-            tmp_filepath = tmp_file.name
-
-        # Read the file based on its extension
-        if uploaded_file.name.endswith(".csv"):
-            df = pd.read_csv(tmp_filepath)
-            sheet_names = []  # CSV files don't have sheets
-        else:  # Excel file
-            # First, get the available sheet names
-            excel_file = pd.ExcelFile(tmp_filepath)
-            sheet_names = excel_file.sheet_names
-            
-            # By default, read the first sheet
-            df = pd.read_excel(excel_file, sheet_name=0)
-            excel_file.close()  # Explicitly close the Excel file
-
-        return df, sheet_names
-        
+        # By default, read the first sheet
+        return read_upload(uploaded_file, 0)
     except Exception as e:
         st.error(f"Erro ao processar o ficheiro: {str(e)}")
         print("Error loading file")
         return None
-        
-    finally:
-        # Ensure the temporary file is removed with error handling
-        if tmp_filepath and os.path.exists(tmp_filepath):
-            try:
-                os.unlink(tmp_filepath)
-            except Exception as e:
-                print(f"Could not delete temporary file {tmp_filepath}: {str(e)}")
-                # On Windows, sometimes files can't be deleted immediately
-                # Schedule for deletion on program exit
-                import atexit
-                atexit.register(lambda file=tmp_filepath: os.path.exists(file) and os.remove(file))
 
 
 def display_data_preview(df: pd.DataFrame, rows: int = 10) -> None:
@@ -75,7 +113,9 @@ def display_data_preview(df: pd.DataFrame, rows: int = 10) -> None:
 
 def column_mapping_ui(
     file_columns: List[str], 
-    fields_config: List[Dict[str, Any]]
+    fields_config: List[Dict[str, Any]],
+    defaults: Dict[str, str] = None,
+    key_prefix: str = "mapping"
 ) -> Dict[str, str]:
     """
     Create UI for mapping file columns to standard fields.
@@ -83,6 +123,9 @@ def column_mapping_ui(
     Args:
         file_columns: List of column names from the uploaded file
         fields_config: List of field configurations with key, display_name, etc.
+        defaults: Initial mapping (e.g. a saved mapping profile); fields without a
+            default are matched to columns of the same name
+        key_prefix: Prefix of the widget keys
         
     Returns:
         Dictionary mapping standard fields to file columns
@@ -100,21 +143,24 @@ def column_mapping_ui(
 
         # Try to find a matching column automatically
         default_index = 0
-        for i, col in enumerate(file_columns):
-            col_formatted = str(col).lower().replace(" ", "_")
-            field_formatted = field.lower().replace(" ", "_")
-            name_formatted = display_name.lower().replace(" ", "_")
+        if defaults and defaults.get(field) in file_columns:
+            default_index = file_columns.index(defaults[field])
+        else:
+            for i, col in enumerate(file_columns):
+                col_formatted = str(col).lower().replace(" ", "_")
+                field_formatted = field.lower().replace(" ", "_")
+                name_formatted = display_name.lower().replace(" ", "_")
 
-            if col_formatted in [field_formatted, name_formatted]:
-                default_index = i
-                break
+                if col_formatted in [field_formatted, name_formatted]:
+                    default_index = i
+                    break
 
         required_marker = " *" if required else ""
         selected_column = st.selectbox(
             label=f"{display_name}{required_marker}",
             options=file_columns,
             index=default_index,
-            key=f"mapping_{field}",
+            key=f"{key_prefix}_{field}",
         )
 
         if selected_column != "-- Não Mapear --":
@@ -158,126 +204,292 @@ def validate_mapping(
     return True, []
 
 
-def process_row(
-    row: pd.Series, 
+def _convert_number(value: Any) -> Any:
+    """Convert a single value to int or float (float if its text form has a '.')."""
+    return float(value) if '.' in str(value) else int(value)
+
+
+def _convert_boolean(value: Any) -> bool:
+    """Convert a single value to a boolean ('true', 'yes', '1', 'sim' or 'verdadeiro' for text)."""
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, (int, float)):
+        return bool(value)
+    if isinstance(value, str):
+        return value.lower() in ['true', 'yes', '1', 'sim', 'verdadeiro']
+    return bool(value)
+
+
+def convert_column(series: pd.Series, field_def: Dict[str, Any]) -> Tuple[List[Any], np.ndarray, str]:
+    """
+    Convert a whole file column to the type of its field, once per column
+    instead of once per cell.
+
+    Args:
+        series: Column of the uploaded file
+        field_def: Field configuration
+
+    Returns:
+        Tuple of (converted values with None for missing cells, boolean mask of
+        the cells that could not be converted, error message for those cells)
+    """
+    field_type = field_def.get('type', 'text')
+    size = len(series)
+    missing = series.isna().to_numpy()
+    present = np.flatnonzero(~missing)
+    failed = np.zeros(size, dtype=bool)
+    error_message = ""
+    values = [None] * size
+
+    if not present.size:
+        return values, failed, error_message
+
+    column = series.iloc[present]
+
+    if field_type == 'number':
+        error_message = "Deve ser um valor numérico."
+        if pd.api.types.is_bool_dtype(column):
+            converted = column.astype(int).tolist()
+        elif pd.api.types.is_integer_dtype(column):
+            converted = column.astype('int64').tolist()
+        elif pd.api.types.is_float_dtype(column):
+            numbers = column.to_numpy(dtype=float)
+            converted = numbers.tolist()
+            # Floats whose text form has no '.' (exponent notation, inf) are converted with int()
+            magnitude = np.abs(numbers)
+            odd = ~np.isfinite(numbers) | (magnitude >= 1e16) | ((numbers != 0) & (magnitude < 1e-4))
+            for position in np.flatnonzero(odd):
+                try:
+                    converted[position] = _convert_number(numbers[position])
+                except (ValueError, TypeError, OverflowError):
+                    failed[present[position]] = True
+                    converted[position] = None
+        else:
+            converted = []
+            for position, value in enumerate(column.tolist()):
+                try:
+                    converted.append(_convert_number(value))
+                except (ValueError, TypeError, OverflowError):
+                    failed[present[position]] = True
+                    converted.append(None)
+
+    elif field_type in ['date', 'datetime']:
+        error_message = "Deve ser uma data válida no formato YYYY-MM-DD."
+        if pd.api.types.is_datetime64_dtype(column):
+            # Typed dates (Excel, Parquet, Arrow) are formatted by numpy, without parsing
+            converted = np.datetime_as_string(column.to_numpy(dtype='datetime64[D]'), unit='D').tolist()
+        elif pd.api.types.is_datetime64_any_dtype(column):
+            converted = column.dt.strftime("%Y-%m-%d").tolist()
+        else:
+            raw = column.tolist()
+            converted = [None] * len(raw)
+            is_text = np.array([isinstance(value, str) for value in raw], dtype=bool)
+
+            text_positions = np.flatnonzero(is_text)
+            if text_positions.size:
+                # format='mixed' parses every value on its own, like pd.to_datetime(value)
+                parsed = pd.to_datetime(
+                    pd.Series([raw[position] for position in text_positions], dtype=object),
+                    format='mixed',
+                    errors='coerce',
+                )
+                formatted = parsed.dt.strftime("%Y-%m-%d").tolist()
+                for position, date_str in zip(text_positions, formatted):
+                    if isinstance(date_str, str):
+                        converted[position] = date_str
+                    else:
+                        failed[present[position]] = True
+
+            for position in np.flatnonzero(~is_text):
+                try:
+                    # pandas Timestamp, datetime or date
+                    converted[position] = raw[position].strftime("%Y-%m-%d")
+                except (AttributeError, ValueError):
+                    failed[present[position]] = True
+
+    elif field_type == 'checkbox' or field_type == 'toggle':
+        if pd.api.types.is_bool_dtype(column):
+            converted = column.astype(bool).tolist()
+        elif pd.api.types.is_numeric_dtype(column):
+            converted = (column != 0).tolist()
+        else:
+            converted = [_convert_boolean(value) for value in column.tolist()]
+
+    elif field_type == 'select':
+        options = field_def.get('options', {})
+        select_options = options.get('options', []) if isinstance(options, dict) else []
+        format_func = options.get('format_func') if isinstance(options, dict) else None
+
+        if format_func:
+            # Reverse mapping (display value -> option value), built once per column
+            reverse_mapping = {}
+            for option in select_options:
+                reverse_mapping[str(format_func(option)).lower()] = option
+
+            keys = column.astype(str).str.lower().tolist()
+            converted = [reverse_mapping.get(key) for key in keys]
+            unmatched = sum(1 for key in keys if key not in reverse_mapping)
+            if unmatched:
+                # No match found - this will likely fail validation later
+                print(f"Warning: No match found for {unmatched} values in field {field_def.get('key')}")
+        else:
+            # No format_func or options - just use the value directly
+            converted = column.tolist()
+
+    else:
+        # For text, textarea, etc. - convert to string and remove trailing ".0"
+        # from numeric strings (common Excel artifact)
+        converted = column.astype(str).str.removesuffix('.0').tolist()
+
+    for position, value in zip(present, converted):
+        values[position] = value
+
+    return values, failed, error_message
+
+
+# Columns of the validation errors returned by process_frame
+ERROR_COLUMNS = ['row', 'field', 'rule', 'message']
+
+
+def _rule_name(validator_func: Callable) -> str:
+    """Name of the rule checked by a validator (e.g. 'min_value' for validate_min_value(0))."""
+    name = getattr(validator_func, '__qualname__', '') or getattr(validator_func, '__name__', '')
+    name = name.split('.<locals>')[0].split('.')[-1]
+    return name.removeprefix('validate_') or 'custom'
+
+
+def process_frame(
+    df: pd.DataFrame,
     column_mapping: Dict[str, str],
     fields_config: List[Dict[str, Any]],
-    index: int
-) -> Dict[str, any]:
+    plan: List[FieldRule] = None,
+    resolver: ForeignKeyResolver = None
+) -> Tuple[List[Dict], pd.DataFrame]:
     """
-    Process a single row of data from the DataFrame.
-    
+    Convert and validate the rows of a DataFrame (a whole file or one chunk of it).
+    Works column by column: each mapped column is converted once, then every
+    validation rule is applied to the cells of its field that have not failed
+    yet. Built-in rules (required, numeric, min/max value, length, pattern,
+    options) compute a boolean error mask of the whole column (see the
+    invalid_mask of utils.validators); only custom validators are called cell
+    by cell. Records are only built for valid rows, and values that cannot be
+    converted become row errors.
+
     Args:
-        row: Pandas Series representing a single row of data
+        df: DataFrame containing the data to process
         column_mapping: Dictionary mapping standard fields to file columns
-        fields_config: List of field configurations
-        index: Row index for error reporting
-        
+        fields_config: List of field configurations with key, display_name, validators, etc.
+        plan: Validation plan compiled from fields_config (compiled here if not given)
+        resolver: Foreign key resolution stage; driver and car columns it resolves
+            are matched by name, NIF or license plate instead of being converted
+
     Returns:
-        Dictionary containing processed field values
+        Tuple of (valid_records, errors), where errors is a DataFrame with one row
+        per invalid cell and the columns 'row' (file row number), 'field', 'rule'
+        and 'message'
     """
-    record = {}
+    size = len(df)
+    if plan is None:
+        plan = compile_validation_plan(fields_config)
 
     # Create a lookup dictionary for field definitions
     field_defs = {}
-    
     for field_def in fields_config:
         if 'key' in field_def:
-            key = field_def.get('key')
-            field_defs[key] = field_def
-    
-    # Map the columns to fields with type conversion
+            field_defs[field_def.get('key')] = field_def
+
+    # Convert each mapped column once
+    columns = {}
+    conversion_errors = {}
     for field, column in column_mapping.items():
-        # Skip if the column doesn't exist in the row
-        if column not in row:
+        # Skip if the column doesn't exist in the file
+        if column not in df.columns:
             continue
-            
-        # Skip if the value is missing
-        if pd.isna(row[column]):
-            record[field] = None
-            continue
-            
-        value = row[column]
-        field_def = field_defs.get(field, {})
-        field_type = field_def.get('type', 'text')  # Default to text if type not found
-        
-        # Convert the value based on the field type
-        if field_type == 'number':
-            # Keep as numeric
-            record[field] = float(value) if '.' in str(value) else int(value)
-        
-        elif field_type in ['date', 'datetime']:
-            # Handle date conversion
-            if isinstance(value, str):
-                date_obj = pd.to_datetime(value)
-                record[field] = date_obj.strftime("%Y-%m-%d")
-            elif pd.notna(value):
-                # Handle pandas Timestamp or datetime
-                record[field] = value.strftime("%Y-%m-%d")
-            else:
-                record[field] = None
-        
-        elif field_type == 'checkbox' or field_type == 'toggle':
-            # Convert to boolean
-            if isinstance(value, bool):
-                record[field] = value
-            elif isinstance(value, (int, float)):
-                record[field] = bool(value)
-            elif isinstance(value, str):
-                record[field] = value.lower() in ['true', 'yes', '1', 'sim', 'verdadeiro']
-            else:
-                record[field] = bool(value)
-        
-        elif field_type == 'select':
-            # Get options and format_func
-            options = field_def.get('options', {})
-            select_options = options.get('options', [])
-            format_func = options.get('format_func')
-            
-            if format_func:
-                # Create a reverse mapping: display value -> option value
-                # This is the key part - we're creating the reverse of what format_func does
-                reverse_mapping = {}
-                
-                for option in select_options:
-                    # Apply format_func to get display value
-                    display_value = format_func(option)
-                    # Store mapping with case insensitive option
-                    reverse_mapping[str(display_value).lower()] = option
-                
-                # Try to find a match for the input value
-                value_str = str(value).lower()
-                if value_str in reverse_mapping:
-                    record[field] = reverse_mapping[value_str]
-                else:
-                    # No match found - this will likely fail validation later
-                    print(f"Warning: No match found for '{value}' in field {field}")
-                    record[field] = None
-            else:
-                # No format_func or options - just use the value directly
-                record[field] = value
-        
+        if resolver is not None and resolver.resolves(field):
+            values, failed, error_message = resolver.resolve(field, df[column], df.index + 2)
         else:
-            # For text, textarea, etc. - convert to string
-            record[field] = str(value)
-            # Remove trailing ".0" from numeric strings (common Excel artifact)
-            if record[field].endswith('.0') and field_type not in ['number']:
-                record[field] = record[field][:-2]
-    
-    # Apply default values for fields not in the record
+            values, failed, error_message = convert_column(df[column], field_defs.get(field, {}))
+        columns[field] = values
+        if failed.any():
+            conversion_errors[field] = (failed, error_message)
+
+    # Apply default values for fields that are missing or empty
     for field, field_def in field_defs.items():
         default_value = field_def.get('default_value', field_def.get('default'))
-        if (field not in record or record[field] is None) and default_value is not None:
-            record[field] = default_value
+        if default_value is None:
+            continue
+        if field not in columns:
+            columns[field] = [default_value] * size
+        else:
+            columns[field] = [default_value if value is None else value for value in columns[field]]
+
+    # Validate field by field, keeping the first error of each cell
+    error_positions, error_fields, error_rules, error_messages = [], [], [], []
+    for field, display_name, _, field_validators in plan:
+        values = columns.get(field)
+        failed, error_message = conversion_errors.get(field, (np.zeros(size, dtype=bool), ""))
+        conversion_rule = 'foreign_key' if resolver is not None and resolver.resolves(field) else 'type'
+        messages = {position: (conversion_rule, error_message) for position in np.flatnonzero(failed)}
+
+        pending = np.flatnonzero(~failed)
+        column = pd.Series(values if values is not None else [None] * size, dtype=object)
+        for validator_func in field_validators:
+            if not pending.size:
+                break
+            rule = _rule_name(validator_func)
+            invalid_mask = getattr(validator_func, 'invalid_mask', None)
+            if invalid_mask is not None:
+                invalid = invalid_mask(column.iloc[pending])
+                if invalid.any():
+                    # Built-in rules give the same message to every invalid value
+                    _, error_msg = validator_func(column.iat[pending[invalid][0]])
+                    for position in pending[invalid]:
+                        messages[position] = (rule, error_msg)
+                pending = pending[~invalid]
+                continue
+
+            still_pending = []
+            for position in pending:
+                is_valid, error_msg = validator_func(column.iat[position])
+                if is_valid:
+                    still_pending.append(position)
+                else:
+                    messages[position] = (rule, error_msg)
+            pending = np.array(still_pending, dtype=int)
 
-    return record
+        for position, (rule, message) in messages.items():
+            error_positions.append(int(position))
+            error_fields.append(display_name)
+            error_rules.append(rule)
+            error_messages.append(message)
+
+    # Build the records of the valid rows only
+    invalid_positions = set(error_positions)
+    record_fields = list(columns.keys())
+    valid_records = [
+        {field: columns[field][position] for field in record_fields}
+        for position in range(size)
+        if position not in invalid_positions
+    ]
+
+    # One row per invalid cell, ordered by file row and then by field
+    errors = pd.DataFrame({
+        'row': np.asarray(df.index, dtype='int64')[np.array(error_positions, dtype=int)] + 2,  # +2 because index starts at 0 and we have header row
+        'field': error_fields,
+        'rule': error_rules,
+        'message': error_messages,
+    }, columns=ERROR_COLUMNS)
+    errors = errors.sort_values('row', kind='stable', ignore_index=True)
+
+    return valid_records, errors
 
 
 def validate_and_process_data(
     df: pd.DataFrame,
     column_mapping: Dict[str, str],
-    fields_config: List[Dict[str, Any]]
-) -> Tuple[List[Dict], List[Dict]]:
+    fields_config: List[Dict[str, Any]],
+    resolver: ForeignKeyResolver = None
+) -> Tuple[List[Dict], pd.DataFrame]:
     """
     Validate and process all data rows.
     
@@ -285,54 +497,161 @@ def validate_and_process_data(
         df: DataFrame containing the data to process
         column_mapping: Dictionary mapping standard fields to file columns
         fields_config: List of field configurations with key, display_name, validators, etc.
+        resolver: Foreign key resolution stage (see utils.import_resolution)
         
     Returns:
-        Tuple of (valid_records, error_records)
+        Tuple of (valid_records, errors) (see process_frame)
     """
-    valid_records = []
-    error_records = []
+    with st.spinner("A validar dados..."):
+        return process_frame(df, column_mapping, fields_config, resolver=resolver)
 
-    record_validator = create_record_validator(fields_config)
 
-    with st.spinner("A validar dados..."):
+def display_unresolved_values(unresolved: List[Dict[str, Any]]) -> None:
+    """
+    Display the foreign key values that could not be resolved, grouped by value.
 
-        for index, row in df.iterrows():
-            # Process the row
-            record = process_row(row, column_mapping, fields_config, index)                
-            
-            # Validate the record
-            is_valid, error_messages = record_validator(record)
-
-            if is_valid:
-                valid_records.append(record)
-            else:
-                error_info = {
-                    "row": index + 2,  # +2 because index starts at 0 and we have header row
-                    "errors": error_messages,
-                }
-                error_records.append(error_info)
-            
-    return valid_records, error_records
+    Args:
+        unresolved: Report returned by ForeignKeyResolver.unresolved_report
+    """
+    st.warning(
+        f"{len(unresolved)} valores de motoristas ou veículos não foram encontrados. "
+        f"Crie os registos em falta ou corrija os valores no ficheiro."
+    )
+    st.dataframe(unresolved_report_frame(unresolved), hide_index=True, use_container_width=True)
 
 
-def display_validation_results(valid_records: List[Dict], error_records: List[Dict]) -> bool:
+def summarize_errors(errors: pd.DataFrame) -> pd.DataFrame:
+    """
+    Aggregate validation errors by field and rule.
+
+    Args:
+        errors: Errors returned by process_frame
+
+    Returns:
+        DataFrame with one row per field and rule, with the number of rows
+        affected and an example message, most frequent first
+    """
+    summary = (
+        errors.groupby(['field', 'rule'], sort=False)
+        .agg(count=('row', 'nunique'), first_row=('row', 'min'), example=('message', 'first'))
+        .reset_index()
+        .sort_values('count', ascending=False, kind='stable')
+    )
+    return summary.rename(columns={
+        'field': 'Campo',
+        'rule': 'Regra',
+        'count': 'Linhas',
+        'first_row': 'Primeira Linha',
+        'example': 'Exemplo',
+    })
+
+
+def build_error_report(df: pd.DataFrame, errors: pd.DataFrame) -> pd.DataFrame:
+    """
+    Build the error report of a file: its invalid rows, with their original
+    values, the file row number and all their errors in one column.
+
+    Args:
+        df: DataFrame (or chunk) the errors were found in
+        errors: Errors returned by process_frame for that DataFrame
+
+    Returns:
+        DataFrame with the columns 'Linha', the file columns and 'Erros'
+    """
+    messages = (errors['field'] + ": " + errors['message']).groupby(errors['row'], sort=True).agg('; '.join)
+    report = df.loc[messages.index - 2].reset_index(drop=True)
+    report.insert(0, 'Linha', messages.index)
+    report['Erros'] = messages.to_numpy()
+    return report
+
+
+def display_error_downloads(report: pd.DataFrame, file_name: str = "erros_importacao") -> None:
+    """
+    Display the controls to download an error report as CSV or Excel.
+    Like export_controls, the report is only encoded when the user asks for the
+    file, and the file is kept while the format and the report stay the same.
+
+    Args:
+        report: Report returned by build_error_report
+        file_name: Name of the downloaded file, without extension (also keys the prepared file)
+    """
+    state_key = f"{file_name}_error_report"
+    # Identifies the report, to discard a file prepared for a previous upload
+    signature = (len(report), int(pd.util.hash_pandas_object(report, index=False).sum()))
+
+    col1, col2 = st.columns(2)
+    with col1:
+        format_name = st.selectbox(
+            "Formato do relatório de erros", options=["CSV", "Excel"], key=f"{state_key}_format"
+        )
+    with col2:
+        prepare = st.button("Preparar relatório de erros", key=f"{state_key}_prepare", use_container_width=True)
+
+    if prepare:
+        with st.spinner("A preparar relatório de erros...", show_time=True):
+            st.session_state[state_key] = {
+                'format': format_name,
+                'signature': signature,
+                'data': export_dataframe(report, format_name),
+            }
+
+    prepared = st.session_state.get(state_key)
+    if prepared and prepared['format'] == format_name and prepared['signature'] == signature:
+        extension, mime, _ = EXPORT_FORMATS[format_name]
+        st.download_button(
+            f"Descarregar relatório de erros ({format_name})",
+            data=prepared['data'],
+            file_name=f"{file_name}.{extension}",
+            mime=mime,
+            key=f"{state_key}_download",
+            use_container_width=True,
+        )
+
+
+def display_validation_results(
+    valid_records: List[Dict],
+    errors: pd.DataFrame,
+    unresolved: List[Dict[str, Any]] = None,
+    df: pd.DataFrame = None
+) -> bool:
     """
     Display validation results and return whether to proceed with import.
+    Errors are shown aggregated by field and rule, with a sample of them; the
+    full list is offered as a downloadable report when the data is given.
     
     Args:
         valid_records: List of valid data records
-        error_records: List of records with validation errors
+        errors: Validation errors returned by process_frame
+        unresolved: Unresolved foreign key values, grouped by value
+        df: Validated data, for the downloadable error report
         
     Returns:
         Boolean indicating whether to proceed with import
     """
-    if error_records:
-        st.error(f"Encontrados {len(error_records)} erros de validação:")
+    if not errors.empty:
+        invalid_rows = errors['row'].nunique()
+        st.error(f"Encontrados {len(errors)} erros de validação em {invalid_rows} linhas:")
+
+        if unresolved:
+            display_unresolved_values(unresolved)
+
+        st.dataframe(summarize_errors(errors), hide_index=True, use_container_width=True)
+
+        sample_rows = IMPORT_CONFIG['error_sample_rows']
+        title = "Ver detalhes dos erros"
+        if len(errors) > sample_rows:
+            title += f" (primeiros {sample_rows} de {len(errors)})"
+        with st.expander(title):
+            st.dataframe(
+                errors.head(sample_rows).rename(columns={
+                    'row': 'Linha', 'field': 'Campo', 'rule': 'Regra', 'message': 'Mensagem'
+                }),
+                hide_index=True,
+                use_container_width=True,
+            )
 
-        # Create an expander for errors to avoid cluttering the UI
-        with st.expander("Ver detalhes dos erros"):
-            for error in error_records:
-                st.warning(f"Linha {error['row']}: {'; '.join(error['errors'])}")
+        if df is not None:
+            display_error_downloads(build_error_report(df, errors))
 
         st.warning("Corrija os erros no ficheiro e tente novamente.")
 
@@ -341,7 +660,7 @@ def display_validation_results(valid_records: List[Dict], error_records: List[Di
         with col1:
             st.metric("Registos Válidos", len(valid_records))
         with col2:
-            st.metric("Registos com Erros", len(error_records))
+            st.metric("Registos com Erros", invalid_rows)
             
         return False
     
@@ -352,6 +671,36 @@ def display_validation_results(valid_records: List[Dict], error_records: List[Di
     return True
 
 
+def database_dry_run(
+    service_class: Type[BaseService],
+    valid_records: List[Dict],
+    row_numbers: List[int],
+    labels: Dict[str, str]
+) -> pd.DataFrame:
+    """
+    Check validated records against the database without importing them
+    (see BaseService.dry_run), reporting the problems as validation errors.
+
+    Args:
+        service_class: Service of the table the records would be imported into
+        valid_records: List of valid data records
+        row_numbers: File row number of each record
+        labels: Display names of the fields
+
+    Returns:
+        DataFrame of errors with the same columns as process_frame's
+    """
+    with st.spinner("A validar os registos na base de dados...", show_time=True):
+        problems = service_class.dry_run(valid_records)
+
+    return pd.DataFrame({
+        'row': [row_numbers[problem['row'] - 1] for problem in problems],
+        'field': [', '.join(labels.get(col) or col for col in problem['columns']) for problem in problems],
+        'rule': [problem['rule'] for problem in problems],
+        'message': [problem['message'] for problem in problems],
+    }, columns=ERROR_COLUMNS)
+
+
 def import_data(valid_records: List[Dict], upload_function: Callable) -> bool:
     """
     Import validated records using the provided upload function.
@@ -376,6 +725,348 @@ def import_data(valid_records: List[Dict], upload_function: Callable) -> bool:
             return False
 
 
+def is_streamed_upload(uploaded_file) -> bool:
+    """
+    Check whether an uploaded file is imported in streaming mode.
+    Only CSV files can be read in chunks; they are streamed from the
+    configured size on (IMPORT_STREAMING_THRESHOLD_MB).
+
+    Args:
+        uploaded_file: The file uploaded through Streamlit's file_uploader
+
+    Returns:
+        True if the file should be imported chunk by chunk
+    """
+    threshold = IMPORT_CONFIG['streaming_threshold_mb'] * 1024 * 1024
+    return uploaded_file.name.lower().endswith(".csv") and uploaded_file.size >= threshold
+
+
+def load_columnar_upload(uploaded_file, columns: List[str] = None, rows: int = None) -> Optional[pd.DataFrame]:
+    """
+    Read an uploaded Parquet or Arrow file, or only some of its columns or rows.
+    Typed columns (numbers, dates, booleans) are kept, so the importer converts
+    them without parsing text.
+
+    Args:
+        uploaded_file: The file uploaded through Streamlit's file_uploader
+        columns: Columns to read (defaults to all)
+        rows: Read only the first rows (e.g. for the preview and column mapping)
+
+    Returns:
+        DataFrame with the data or None if an error occurs
+    """
+    try:
+        return read_columnar(io.BytesIO(uploaded_file.getbuffer()), uploaded_file.name, columns, rows)
+    except Exception as e:
+        st.error(f"Erro ao processar o ficheiro: {str(e)}")
+        print("Error loading columnar file")
+        return None
+
+
+def load_csv_preview(uploaded_file, rows: int = 100) -> Optional[pd.DataFrame]:
+    """
+    Read only the header and first rows of a CSV file, for the preview and
+    the column mapping of a streamed import.
+
+    Args:
+        uploaded_file: The file uploaded through Streamlit's file_uploader
+        rows: Number of rows to read
+
+    Returns:
+        DataFrame with the first rows of the file or None if an error occurs
+    """
+    try:
+        uploaded_file.seek(0)
+        return pd.read_csv(uploaded_file, nrows=rows)
+    except Exception as e:
+        st.error(f"Erro ao processar o ficheiro: {str(e)}")
+        print("Error loading CSV preview")
+        return None
+    finally:
+        uploaded_file.seek(0)
+
+
+def stream_import(
+    uploaded_file,
+    column_mapping: Dict[str, str],
+    fields_config: List[Dict[str, Any]],
+    upload_function: Callable,
+    chunk_size: int = None,
+    max_reported_errors: int = None,
+    on_progress: Callable[[Dict[str, Any]], None] = None,
+    start_chunk: int = 0,
+    error_report_path: str = None
+) -> Dict[str, Any]:
+    """
+    Import a CSV file chunk by chunk: every chunk is mapped, converted,
+    validated and its valid rows loaded before the next one is read, so memory
+    use depends on the chunk size and not on the size of the file.
+    Invalid rows are skipped and reported: the first max_reported_errors errors
+    are kept in the summary, and every invalid row can be written to a CSV
+    error report as its chunk is processed. A failed load stops the import, and the chunks loaded
+    before it stay imported. The upload function is called for every chunk,
+    even without valid records, so it can checkpoint the chunks (see
+    utils.import_batches).
+
+    Args:
+        uploaded_file: The CSV file (an upload or any binary file object)
+        column_mapping: Dictionary mapping standard fields to file columns
+        fields_config: List of field configurations with key, display_name, validators, etc.
+        upload_function: Function that uploads the valid records of a chunk
+        chunk_size: Rows per chunk (defaults to IMPORT_CHUNK_SIZE)
+        max_reported_errors: Maximum number of errors kept in the summary (defaults to IMPORT_MAX_REPORTED_ERRORS)
+        on_progress: Optional callback receiving the running summary after every chunk
+        start_chunk: Number of chunks at the start of the file to skip, because a
+            previous run already imported them
+        error_report_path: Optional path of the CSV error report (see build_error_report)
+
+    Returns:
+        Summary dictionary with 'chunks' (number of the last chunk read), 'skipped_rows',
+        'total_rows', 'valid_rows', 'invalid_rows', 'imported_rows', 'unchanged_rows' (already
+        imported or without changes, when the upload function returns counts), 'errors' (dictionaries
+        with 'row', 'field', 'rule' and 'message'), 'error_report' (path of the report, if
+        any row was written to it), 'unresolved' (unresolved driver/car values, grouped by
+        value), 'failure', 'progress' and 'elapsed' (seconds)
+    """
+    chunk_size = chunk_size or IMPORT_CONFIG['chunk_size']
+    if max_reported_errors is None:
+        max_reported_errors = IMPORT_CONFIG['max_reported_errors']
+
+    plan = compile_validation_plan(fields_config)
+    # Lookups of drivers and cars are loaded once for the whole import
+    resolver = ForeignKeyResolver()
+    labels = {field_def.get('key'): field_def.get('label') for field_def in fields_config}
+    summary = {
+        'chunks': 0,
+        'skipped_rows': 0,
+        'total_rows': 0,
+        'valid_rows': 0,
+        'invalid_rows': 0,
+        'imported_rows': 0,
+        'unchanged_rows': 0,
+        'errors': [],
+        'error_report': None,
+        'unresolved': [],
+        'failure': None,
+        'progress': 0.0,
+        'elapsed': 0.0,
+    }
+    start = time.monotonic()
+    file_size = uploaded_file.seek(0, io.SEEK_END) or 1
+
+    uploaded_file.seek(0)
+    # The chunks keep a continuous index, so error rows refer to lines of the whole file
+    with pd.read_csv(uploaded_file, chunksize=chunk_size) as reader:
+        for number, chunk in enumerate(reader, start=1):
+            summary['chunks'] = number
+            if number <= start_chunk:
+                summary['skipped_rows'] += len(chunk)
+                continue
+
+            valid_records, errors = process_frame(chunk, column_mapping, fields_config, plan, resolver)
+
+            summary['total_rows'] += len(chunk)
+            summary['valid_rows'] += len(valid_records)
+            if not errors.empty:
+                summary['invalid_rows'] += errors['row'].nunique()
+                room = max_reported_errors - len(summary['errors'])
+                if room > 0:
+                    summary['errors'].extend(errors.head(room).to_dict('records'))
+                if error_report_path:
+                    report = build_error_report(chunk, errors)
+                    report.to_csv(
+                        error_report_path,
+                        mode='a' if summary['error_report'] else 'w',
+                        header=not summary['error_report'],
+                        index=False,
+                        encoding='utf-8' if summary['error_report'] else 'utf-8-sig',
+                    )
+                    summary['error_report'] = error_report_path
+
+            try:
+                counts = upload_function(valid_records)
+                if isinstance(counts, dict):
+                    # Uploaders returning counts (see create_batch_uploader) report the records skipped
+                    summary['imported_rows'] += counts['inserted'] + counts['updated']
+                    summary['unchanged_rows'] += counts['unchanged']
+                else:
+                    summary['imported_rows'] += len(valid_records)
+            except Exception as e:
+                summary['failure'] = str(e)
+                print(f"Error importing chunk {number}: {str(e)}")
+
+            summary['unresolved'] = resolver.unresolved_report(labels)
+            summary['progress'] = min(uploaded_file.tell() / file_size, 1.0)
+            summary['elapsed'] = time.monotonic() - start
+            if on_progress:
+                on_progress(summary)
+
+            if summary['failure']:
+                break
+
+    uploaded_file.seek(0)
+    return summary
+
+
+def submit_import_job(
+    entity_name: str,
+    uploaded_file,
+    column_mapping: Dict[str, str],
+    fields_config: List[Dict[str, Any]],
+    upload_function: Callable,
+    chunk_size: int = None,
+    batch_id: int = None,
+    start_chunk: int = 0
+) -> str:
+    """
+    Run a streamed import as a background job (see utils.import_jobs).
+    The upload is copied to a temporary file first, so the job does not depend
+    on the session that started it and the upload buffer can be released.
+    The invalid rows are written to a temporary CSV error report, kept until
+    the job is forgotten by the registry.
+
+    Args:
+        entity_name: Name of the entity being imported, used to group its jobs
+        uploaded_file: The CSV file uploaded through Streamlit's file_uploader
+        column_mapping: Dictionary mapping standard fields to file columns
+        fields_config: List of field configurations with key, display_name, validators, etc.
+        upload_function: Function that uploads the valid records of a chunk
+        chunk_size: Rows per chunk (defaults to IMPORT_CHUNK_SIZE)
+        batch_id: Import batch checkpointed by the upload function, whose outcome is recorded
+        start_chunk: Number of chunks already imported by a previous run of the batch
+
+    Returns:
+        Identifier of the job
+
+    Raises:
+        ValueError: If another job is still loading the batch
+    """
+    chunk_size = chunk_size or IMPORT_CONFIG['chunk_size']
+    with tempfile.NamedTemporaryFile(delete=False, suffix=".csv") as tmp_file:
+        tmp_file.write(uploaded_file.getbuffer())
+        tmp_filepath = tmp_file.name
+    error_report_path = tmp_filepath.removesuffix(".csv") + "_erros.csv"
+
+    def task(report: Callable[[Dict[str, Any]], None]) -> Dict[str, Any]:
+        try:
+            with open(tmp_filepath, "rb") as source:
+                summary = stream_import(
+                    source, column_mapping, fields_config, upload_function,
+                    chunk_size=chunk_size, on_progress=report, start_chunk=start_chunk,
+                    error_report_path=error_report_path,
+                )
+        except Exception as e:
+            if batch_id is not None:
+                ImportBatchService.finish(batch_id, str(e))
+            raise
+
+        if batch_id is not None:
+            ImportBatchService.finish(batch_id, summary['failure'])
+        return summary
+
+    def cleanup() -> None:
+        if os.path.exists(tmp_filepath):
+            os.unlink(tmp_filepath)
+
+    try:
+        return get_import_jobs().submit(
+            group=entity_name,
+            description=uploaded_file.name,
+            task=task,
+            cleanup=cleanup,
+            batch_id=batch_id,
+        )
+    except ValueError:
+        # The batch is already being loaded by another job
+        cleanup()
+        raise
+
+
+def streamed_import_ui(
+    entity_name: str,
+    uploaded_file,
+    fields_config: List[Dict[str, Any]],
+    upload_function: Callable,
+    service_class: Type[BaseService] = None
+) -> None:
+    """
+    Import UI for large CSV files: previews the first rows, maps the columns
+    and imports the file in chunks as a background job. With a service class
+    the import is an import batch: every chunk is checkpointed, and a new
+    upload of a partially imported file can resume from the next chunk.
+
+    Args:
+        entity_name: Name of the entity being imported
+        uploaded_file: The CSV file uploaded through Streamlit's file_uploader
+        fields_config: List of field configurations with key, display_name, validators, etc.
+        upload_function: Function that uploads the valid records of a chunk (without a service class)
+        service_class: Service of the table the file is imported into
+    """
+    df = load_csv_preview(uploaded_file)
+    if df is None:
+        return
+
+    st.info(
+        f"Ficheiro grande ({uploaded_file.size / (1024 * 1024):.0f} MB): será importado em blocos de "
+        f"{IMPORT_CONFIG['chunk_size']} linhas, em segundo plano. As linhas com erros são ignoradas e "
+        f"listadas no fim."
+    )
+    display_data_preview(df)
+
+    file_columns = ["-- Não Mapear --"] + list(df.columns)
+    column_mapping = column_mapping_ui(file_columns, fields_config)
+    chunk_size = IMPORT_CONFIG['chunk_size']
+
+    resume_batch = None
+    if service_class is not None:
+        file_hash = upload_digest(uploaded_file)
+        resume_batch = ImportBatchService.find_resumable(service_class, file_hash, column_mapping, chunk_size)
+
+    resume = False
+    if resume_batch:
+        st.warning(
+            f"Este ficheiro já foi parcialmente importado (importação #{resume_batch['id']}: "
+            f"{resume_batch['imported_rows']} registos em {resume_batch['committed_chunks']} blocos)."
+        )
+        resume = st.checkbox(
+            f"Retomar a partir do bloco {resume_batch['committed_chunks'] + 1}",
+            value=True,
+            help="Os blocos já importados são ignorados. Desmarque para importar o ficheiro de novo.",
+        )
+
+    if st.button("Processar e Importar Dados", use_container_width=True):
+        is_valid, missing_fields = validate_mapping(column_mapping, fields_config)
+        if not is_valid:
+            st.error(f"Campos obrigatórios não mapeados: {', '.join(missing_fields)}")
+            return
+
+        batch_id = None
+        start_chunk = 0
+        try:
+            if service_class is not None:
+                if resume:
+                    batch_id = resume_batch['id']
+                    start_chunk = ImportBatchService.resume(batch_id)
+                else:
+                    batch_id = ImportBatchService.start(
+                        service_class, uploaded_file.name, file_hash, column_mapping, chunk_size
+                    )
+                upload_function = create_batch_uploader(service_class, batch_id, start_chunk)
+
+            submit_import_job(
+                entity_name, uploaded_file, column_mapping, fields_config, upload_function,
+                chunk_size=chunk_size, batch_id=batch_id, start_chunk=start_chunk,
+            )
+        except ValueError as e:
+            # e.g. the batch was resumed by another session in the meantime
+            st.error(str(e))
+            return
+        st.success(
+            "Importação iniciada em segundo plano. Pode continuar a usar a aplicação e "
+            "acompanhar o progresso abaixo, mesmo depois de atualizar a página."
+        )
+
+
 def select_sheet_ui(sheet_names: List[str]) -> int:
     """
     Create UI for selecting a sheet from an Excel file with multiple sheets.
@@ -414,36 +1105,13 @@ def load_excel_sheet(uploaded_file, sheet_index: int = 0) -> pd.DataFrame:
     Returns:
         DataFrame containing the sheet data or None if an error occurs
     """
-    tmp_filepath = None
     try:
-        # Create a temporary file to store the uploaded content
-        with tempfile.NamedTemporaryFile(
-            delete=False, suffix=os.path.splitext(uploaded_file.name)[1]
-        ) as tmp_file:
-            tmp_file.write(uploaded_file.getvalue())
-            tmp_filepath = tmp_file.name
-
-        # Read the specified sheet using ExcelFile to ensure proper closing
-        with pd.ExcelFile(tmp_filepath) as excel_file:
-            df = pd.read_excel(excel_file, sheet_name=sheet_index)
-        
+        df, _ = read_upload(uploaded_file, sheet_index)
         return df
-        
     except Exception as e:
         st.error(f"Erro ao carregar a folha selecionada: {str(e)}")
         print("Error loading Excel sheet")
         return None
-        
-    finally:
-        # Ensure the temporary file is removed with error handling
-        if tmp_filepath and os.path.exists(tmp_filepath):
-            try:
-                os.unlink(tmp_filepath)
-            except Exception as e:
-                print(f"Could not delete temporary file {tmp_filepath}: {str(e)}")
-                # Schedule for deletion on program exit
-                import atexit
-                atexit.register(lambda file=tmp_filepath: os.path.exists(file) and os.remove(file))
 
 
 @handle_streamlit_error()
@@ -451,6 +1119,7 @@ def bulk_import_component(
     entity_name: str,
     fields_config: List[Dict[str, Any]],
     upload_function: Callable,
+    service_class: Type[BaseService] = None,
 ):
     """
     Reusable component for bulk import across different entities.
@@ -459,6 +1128,8 @@ def bulk_import_component(
         entity_name: Name of the entity being imported (e.g., "receitas", "motoristas")
         fields_config: List of field configurations with key, display_name, validators, etc.
         upload_function: Function that uploads validated data
+        service_class: Service of the imported table; when given, streamed imports
+            are checkpointed import batches that can be resumed and rolled back
     """
     # Extract standard fields from fields_config
     st.subheader(f"Importação em Massa de {entity_name.capitalize()}")
@@ -474,18 +1145,31 @@ def bulk_import_component(
 
     # File upload
     uploaded_file = st.file_uploader(
-        f"Carregue um ficheiro CSV ou Excel com os dados de {entity_name}",
-        type=["csv", "xlsx", "xls"],
+        f"Carregue um ficheiro CSV, Excel, Parquet ou Arrow com os dados de {entity_name}",
+        type=["csv", "xlsx", "xls"] + [extension.lstrip(".") for extension in COLUMNAR_EXTENSIONS],
         help=f"O ficheiro deve conter colunas correspondentes aos campos necessários para {entity_name}.",
     )
 
+    if uploaded_file is not None and is_streamed_upload(uploaded_file):
+        # Large CSV files are never loaded whole
+        streamed_import_ui(entity_name, uploaded_file, fields_config, upload_function, service_class)
+        return
+
     if uploaded_file is not None:
-        # Load the file initially to get sheet names if it's an Excel file
-        result = load_file(uploaded_file)
-        if result is None:
-            return
-            
-        df, sheet_names = result
+        columnar = is_columnar_file(uploaded_file.name)
+        if columnar:
+            # Parquet and Arrow files: the first rows for the mapping now, the mapped columns on import
+            df = load_columnar_upload(uploaded_file, rows=100)
+            if df is None:
+                return
+            sheet_names = []
+        else:
+            # Load the file initially to get sheet names if it's an Excel file
+            result = load_file(uploaded_file)
+            if result is None:
+                return
+
+            df, sheet_names = result
         
         # For Excel files with multiple sheets, show sheet selection
         if uploaded_file.name.endswith(('.xlsx', '.xls')) and len(sheet_names) > 1:
@@ -506,24 +1190,52 @@ def bulk_import_component(
         file_columns = ["-- Não Mapear --"] + list(df.columns)
         column_mapping = column_mapping_ui(file_columns, fields_config)
         
-        # Process button
-        if st.button("Processar e Importar Dados", use_container_width=True):
+        # Process buttons: the simulation checks the data against the database without importing it
+        col1, col2 = st.columns(2)
+        with col1:
+            simulate = st.button(
+                "Simular Importação",
+                use_container_width=True,
+                disabled=service_class is None,
+                help="Valida os dados na base de dados (duplicados, referências e períodos sobrepostos) sem gravar nada.",
+            )
+        with col2:
+            process = st.button("Processar e Importar Dados", use_container_width=True)
+
+        if simulate or process:
             # Validate mapping
             is_valid, missing_fields = validate_mapping(column_mapping, fields_config)
             if not is_valid:
                 st.error(f"Campos obrigatórios não mapeados: {', '.join(missing_fields)}")
                 return
+
+            if columnar:
+                df = load_columnar_upload(uploaded_file, columns=list(dict.fromkeys(column_mapping.values())))
+                if df is None:
+                    return
                 
             # Process and validate data
-            valid_records, error_records = validate_and_process_data(
-                df, column_mapping, fields_config
+            resolver = ForeignKeyResolver()
+            valid_records, errors = validate_and_process_data(
+                df, column_mapping, fields_config, resolver
             )
             
             # Display validation results
-            proceed = display_validation_results(valid_records, error_records)
+            labels = {field_def.get('key'): field_def.get('label') for field_def in fields_config}
+            proceed = display_validation_results(
+                valid_records, errors, resolver.unresolved_report(labels), df
+            )
             
-            # Import data if validation passed
-            if proceed:
+            # Check the data in the database, or import it, if validation passed
+            if proceed and simulate:
+                try:
+                    problems = database_dry_run(service_class, valid_records, (df.index + 2).tolist(), labels)
+                except Exception as e:
+                    st.error(f"Erro ao simular importação: {str(e)}")
+                    return
+                if display_validation_results(valid_records, problems, None, df):
+                    st.success(f"Simulação concluída sem erros: {len(valid_records)} registos podem ser importados.")
+            elif proceed:
                 import_data(valid_records, upload_function)
 
 
@@ -568,13 +1280,34 @@ def entity_bulk_import_tab(
     # Create validator and uploader functions
     uploader = create_generic_uploader(service_class)
 
-    # Use the bulk import component
+    # Use the bulk import component, or the batch component for many files at once
     with st.container(border=1):
-        bulk_import_component(
-            entity_name=entity_name,
-            fields_config=fields_config,
-            upload_function=uploader,
+        mode = st.radio(
+            "Modo de importação",
+            options=["Ficheiro único", "Vários ficheiros (lote)"],
+            horizontal=True,
+            key="bulk_import_mode",
         )
+        if mode == "Ficheiro único":
+            bulk_import_component(
+                entity_name=entity_name,
+                fields_config=fields_config,
+                upload_function=uploader,
+                service_class=service_class,
+            )
+        else:
+            # Imported here because the batch component is built on this module
+            from utils.batch_import import batch_import_component
+            batch_import_component(
+                entity_name=entity_name,
+                fields_config=fields_config,
+                upload_function=uploader,
+                service_class=service_class,
+            )
+
+        # Background imports of this entity, started in this or any other session
+        import_jobs_panel(entity_name)
+        import_batches_panel(service_class)
 
     # Display help content if provided
     if help_content:
@@ -0,0 +1,116 @@
+import io
+from typing import List
+import pandas as pd
+import pyarrow as pa
+import pyarrow.ipc as ipc
+import pyarrow.parquet as pq
+
+# Extensions of the columnar files (Parquet and Arrow IPC / Feather v2)
+PARQUET_EXTENSIONS = (".parquet", ".pq")
+ARROW_EXTENSIONS = (".arrow", ".feather", ".ipc")
+COLUMNAR_EXTENSIONS = PARQUET_EXTENSIONS + ARROW_EXTENSIONS
+
+
+def is_columnar_file(file_name: str) -> bool:
+    """
+    Check whether a file is a Parquet or Arrow file, by its extension.
+
+    Args:
+        file_name: Name of the file
+
+    Returns:
+        True if the file is read with read_columnar
+    """
+    return file_name.lower().endswith(COLUMNAR_EXTENSIONS)
+
+
+def _read_arrow(source) -> pa.Table:
+    """Read an Arrow IPC file, or an Arrow IPC stream if it is not a file."""
+    try:
+        return ipc.open_file(source).read_all()
+    except pa.ArrowInvalid:
+        source.seek(0)
+        return ipc.open_stream(source).read_all()
+
+
+def _to_pandas(table: pa.Table) -> pd.DataFrame:
+    """
+    Convert an Arrow table to pandas, keeping typed columns the importer converts
+    without parsing: decimals become floats and dates become datetime64 columns.
+    """
+    schema = pa.schema([
+        pa.field(field.name, pa.float64()) if pa.types.is_decimal(field.type) else field
+        for field in table.schema
+    ])
+    return table.cast(schema).to_pandas(date_as_object=False)
+
+
+def read_columnar(source, file_name: str, columns: List[str] = None, rows: int = None) -> pd.DataFrame:
+    """
+    Read a Parquet or Arrow file into a DataFrame with typed columns.
+    Only the requested columns are read: Parquet files skip the others on disk,
+    Arrow files are mapped without copying and the others are dropped.
+
+    Args:
+        source: Binary file object (e.g. the upload buffer)
+        file_name: Name of the file, to tell the format
+        columns: Columns to read (defaults to all)
+        rows: Read only the first rows (e.g. for a preview)
+
+    Returns:
+        DataFrame with the data
+    """
+    if file_name.lower().endswith(PARQUET_EXTENSIONS):
+        parquet_file = pq.ParquetFile(source)
+        if rows is None:
+            table = parquet_file.read(columns=columns)
+        else:
+            batch = None
+            if rows > 0:
+                batch = next(parquet_file.iter_batches(batch_size=rows, columns=columns), None)
+            if batch is not None:
+                table = pa.Table.from_batches([batch])
+            else:
+                table = parquet_file.schema_arrow.empty_table()
+                if columns is not None:
+                    table = table.select(columns)
+    else:
+        table = _read_arrow(source)
+        if columns is not None:
+            table = table.select(columns)
+        if rows is not None:
+            table = table.slice(0, rows)
+
+    return _to_pandas(table)
+
+
+def to_parquet_bytes(df: pd.DataFrame) -> bytes:
+    """
+    Encode a DataFrame as a Parquet file.
+
+    Args:
+        df: Data to encode
+
+    Returns:
+        Content of the file
+    """
+    buffer = io.BytesIO()
+    df.to_parquet(buffer, index=False)
+    return buffer.getvalue()
+
+
+def to_arrow_bytes(df: pd.DataFrame) -> bytes:
+    """
+    Encode a DataFrame as an Arrow IPC file (readable as Feather v2).
+
+    Args:
+        df: Data to encode
+
+    Returns:
+        Content of the file
+    """
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    sink = pa.BufferOutputStream()
+    with ipc.new_file(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
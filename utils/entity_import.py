@@ -1,5 +1,6 @@
 import streamlit as st
 import time
+from streamlit.runtime.scriptrunner import get_script_run_ctx
 from typing import Dict, List, Callable, Any, Type, Tuple
 from utils.base_service import BaseService
 from utils.validators import (
@@ -16,11 +17,93 @@ from utils.validators import (
 )
 
 
+# A compiled validation rule: (field, display_name, required, validators)
+FieldRule = Tuple[str, str, bool, Tuple[Callable, ...]]
+
+
+def compile_validation_plan(fields_config: List[Dict[str, Any]] = None) -> List[FieldRule]:
+    """
+    Compiles the validation rules of the field configurations into a reusable plan.
+    The validators of each field (with their regexes and option sets) are built
+    once here instead of once per record.
+
+    Args:
+        fields_config: List of field configurations with constraints and validation rules
+
+    Returns:
+        List of (field, display_name, required, validators) rules, in field order
+    """
+    plan = []
+
+    for field_def in fields_config or []:
+        field = field_def.get("key")
+        display_name = field_def.get("label")
+        required = field_def.get("required", False)
+        field_type = field_def.get("type", "text")
+        custom_validator = field_def.get("validator")
+        field_validators = []
+
+        # Required fields only run the required validator
+        if required:
+            plan.append((field, display_name, True, (validate_required,)))
+            continue
+
+        # Type-specific validations
+        if field_type == "number":
+            field_validators.append(validate_numeric)
+
+            if "min_value" in field_def:
+                field_validators.append(validate_min_value(field_def["min_value"]))
+
+            if "max_value" in field_def:
+                field_validators.append(validate_max_value(field_def["max_value"]))
+
+        elif field_type == "date":
+            field_validators.append(validate_date_format)
+
+        elif field_type == "text":
+            if "min_length" in field_def:
+                field_validators.append(
+                    validate_min_length(field_def["min_length"])
+                )
+
+            if "max_length" in field_def:
+                field_validators.append(
+                    validate_max_length(field_def["max_length"])
+                )
+
+            if "pattern" in field_def:
+                pattern = field_def["pattern"]
+                pattern_msg = field_def.get(
+                    "pattern_message", "Must match the required format."
+                )
+                field_validators.append(validate_regex(pattern, pattern_msg))
+
+        elif field_type == "select":
+            options = field_def.get("options", [])
+            default_value = field_def.get("default", None)
+            field_validators.append(
+                validate_options(options, default_value=default_value)
+            )
+
+        elif field_type in ["checkbox", "toggle"]:
+            field_validators.append(validate_boolean)
+
+        if custom_validator:
+            field_validators.append(custom_validator)
+
+        plan.append((field, display_name, False, tuple(field_validators)))
+
+    return plan
+
+
 def create_record_validator(
     fields_config: List[Dict[str, Any]] = None,
 ) -> Callable:
     """
     Creates a record validator function.
+    The validation plan is compiled once, so the returned function can be
+    called for every record of a large import cheaply.
 
     Args:
         fields_config: List of field configurations with constraints and validation rules
@@ -28,8 +111,7 @@ def create_record_validator(
     Returns:
         A validator function that takes a record and returns (is_valid, error_messages)
     """
-    if not fields_config:
-        fields_config = []
+    plan = compile_validation_plan(fields_config)
 
     def validator(record: Dict) -> Tuple[bool, List[str]]:
         """
@@ -43,69 +125,10 @@ def create_record_validator(
         """
         errors = []
 
-        for field_def in fields_config:
-            field = field_def.get("key")
-            display_name = field_def.get("label")
-            required = field_def.get("required", False)
-            field_type = field_def.get("type", "text")
-            custom_validator = field_def.get("validator")
+        for field, display_name, _, field_validators in plan:
             value = record.get(field)
-            field_validators = []
-
-            # Required validator first
-            # Skip other validations if value is None (for non-required fields)
-            if required:
-                # Run only required validator (if present)
-                is_valid, error_msg = validate_required(value)
-                if not is_valid:
-                    errors.append(f"{display_name}: {error_msg}")
-                continue
-
-            # Type-specific validations
-            if field_type == "number":
-                field_validators.append(validate_numeric)
-
-                if "min_value" in field_def:
-                    field_validators.append(validate_min_value(field_def["min_value"]))
-
-                if "max_value" in field_def:
-                    field_validators.append(validate_max_value(field_def["max_value"]))
-
-            elif field_type == "date":
-                field_validators.append(validate_date_format)
-
-            elif field_type == "text":
-                if "min_length" in field_def:
-                    field_validators.append(
-                        validate_min_length(field_def["min_length"])
-                    )
-
-                if "max_length" in field_def:
-                    field_validators.append(
-                        validate_max_length(field_def["max_length"])
-                    )
-
-                if "pattern" in field_def:
-                    pattern = field_def["pattern"]
-                    pattern_msg = field_def.get(
-                        "pattern_message", "Must match the required format."
-                    )
-                    field_validators.append(validate_regex(pattern, pattern_msg))
-
-            elif field_type == "select":
-                options = field_def.get("options", [])
-                default_value = field_def.get("default", None)
-                field_validators.append(
-                    validate_options(options, default_value=default_value)
-                )
-
-            elif field_type in ["checkbox", "toggle"]:
-                field_validators.append(validate_boolean)
-            
-            if custom_validator:
-                field_validators.append(custom_validator)
 
-            # Execute all validators for this field
+            # Execute the validators for this field
             for validator_func in field_validators:
                 is_valid, error_msg = validator_func(value)
                 if not is_valid:
@@ -114,7 +137,6 @@ def create_record_validator(
                     # Break on first error for this field
                     break
 
-        # Use the service class's validate method
         return len(errors) == 0, errors
 
     return validator
@@ -122,44 +144,38 @@ def create_record_validator(
 
 def create_generic_uploader(service_class: Type[BaseService]) -> Callable:
     """
-    Creates a generic uploader function for entity records based on the service class's insert method.
+    Creates a generic uploader function for entity records based on the service class's upsert_many
+    (for entities with natural keys) or bulk_load method. Records already imported are skipped
+    on tables with fingerprints (see BaseService.fingerprint_column).
 
     Args:
-        service_class: The service class that has an insert method
+        service_class: The service class used to store the records
 
     Returns:
         An uploader function that takes a list of records and returns True on success
     """
 
     def uploader(records: List[Dict]) -> bool:
-
-        # Process each record individually
-        success_count = 0
-        errors = []
-        progress_bar = st.progress(0)
-        total_rows = len(records)
-
-        for index, record in enumerate(records):
-            
-            try:
-                service_class.insert(record)
-                success_count += 1
-            except Exception as e:
-                errors.append(str(e))
-            
-            # Update progress
-            progress_bar.progress((index + 1) / total_rows)
-
-        if errors:
-            if len(errors) == len(records):
-                raise Exception(
-                    f"Failed to import all records. First error: {errors[0]}"
-                )
-            else:
-                raise Exception(
-                    f"Imported {success_count} out of {len(records)} records. Error: {errors[0]}"
-                )
-
+        if not records:
+            return True
+
+        if service_class.natural_keys:
+            # Entities with a natural key are upserted, so re-importing a file updates them
+            counts = service_class.upsert_many(records)
+            message = (
+                f"{counts['inserted']} registos novos, {counts['updated']} atualizados "
+                f"e {counts['unchanged']} sem alterações."
+            )
+        else:
+            # Load all records in one COPY-based transaction: either every new record is imported or none is
+            inserted = len(service_class.bulk_load(records))
+            message = f"{inserted} registos novos e {len(records) - inserted} já importados (ignorados)."
+
+        if get_script_run_ctx() is None:
+            # Background import job: there is no page to show the counts on
+            print(f"{service_class.table_name}: {message}")
+        else:
+            st.info(message)
         return True
 
     return uploader
@@ -0,0 +1,94 @@
+import io
+from typing import Callable, Dict
+import pandas as pd
+import streamlit as st
+from utils.columnar import to_parquet_bytes, to_arrow_bytes
+
+
+def _to_csv_bytes(df: pd.DataFrame) -> bytes:
+    """Encode a DataFrame as CSV (UTF-8 with BOM, so Excel shows accents correctly)."""
+    return df.to_csv(index=False).encode('utf-8-sig')
+
+
+def _to_xlsx_bytes(df: pd.DataFrame) -> bytes:
+    """Encode a DataFrame as an Excel workbook."""
+    buffer = io.BytesIO()
+    df.to_excel(buffer, index=False)
+    return buffer.getvalue()
+
+
+# Export formats: name -> (file extension, MIME type, encoder)
+EXPORT_FORMATS = {
+    "CSV": ("csv", "text/csv", _to_csv_bytes),
+    "Excel": ("xlsx", "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet", _to_xlsx_bytes),
+    "Parquet": ("parquet", "application/vnd.apache.parquet", to_parquet_bytes),
+    "Arrow": ("arrow", "application/vnd.apache.arrow.file", to_arrow_bytes),
+}
+
+
+def export_dataframe(df: pd.DataFrame, format_name: str) -> bytes:
+    """
+    Encode a DataFrame in one of the export formats.
+
+    Args:
+        df: Data to export
+        format_name: Name of the format (see EXPORT_FORMATS)
+
+    Returns:
+        Content of the exported file
+    """
+    _, _, encode = EXPORT_FORMATS[format_name]
+    return encode(df)
+
+
+def export_controls(
+    key: str,
+    load_data: Callable[[], pd.DataFrame],
+    file_name: str,
+    filters: Dict = None
+) -> None:
+    """
+    Display the controls to export a listing as CSV, Excel, Parquet or Arrow.
+    The data is only loaded and encoded when the user asks for the file, and
+    the file is kept while the format and filters stay the same.
+
+    Args:
+        key: Unique key of the listing
+        load_data: Function returning all the records to export (e.g. every page of the listing)
+        file_name: Name of the exported file, without extension
+        filters: Filters of the listing, to discard a file prepared with other filters
+    """
+    state_key = f"{key}_export"
+
+    with st.expander("Exportar resultados"):
+        col1, col2 = st.columns(2)
+        with col1:
+            format_name = st.selectbox("Formato", options=list(EXPORT_FORMATS), key=f"{key}_export_format")
+        with col2:
+            prepare = st.button("Preparar Exportação", key=f"{key}_export_prepare", use_container_width=True)
+
+        if prepare:
+            with st.spinner("A preparar exportação...", show_time=True):
+                try:
+                    df = load_data()
+                    st.session_state[state_key] = {
+                        'format': format_name,
+                        'filters': filters,
+                        'rows': len(df),
+                        'data': export_dataframe(df, format_name),
+                    }
+                except Exception as e:
+                    st.error(f"Erro ao exportar dados: {str(e)}")
+                    return
+
+        export = st.session_state.get(state_key)
+        if export and export['format'] == format_name and export['filters'] == filters:
+            extension, mime, _ = EXPORT_FORMATS[format_name]
+            st.download_button(
+                f"Descarregar {export['rows']} registos ({format_name})",
+                data=export['data'],
+                file_name=f"{file_name}.{extension}",
+                mime=mime,
+                key=f"{key}_export_download",
+                use_container_width=True,
+            )
@@ -0,0 +1,69 @@
+import hashlib
+from typing import Dict, List, Union
+import numpy as np
+import pandas as pd
+
+# Separator of the fields hashed into a fingerprint (chr(31), the unit separator)
+FIELD_SEPARATOR = "\x1f"
+
+# Whitespace collapsed in text fields, the same class as the regex of migration 0005
+WHITESPACE = r"[ \t\r\n\f\v]+"
+
+NUMERIC_TYPES = ('smallint', 'integer', 'bigint', 'numeric', 'real', 'double precision')
+
+
+def fingerprint_kind(column_type: str) -> str:
+    """
+    Get how a column is normalized for fingerprints from its database type.
+
+    Args:
+        column_type: Type of the column without modifiers (e.g. 'numeric', 'date')
+
+    Returns:
+        'number', 'date' or 'text'
+    """
+    if column_type in NUMERIC_TYPES:
+        return 'number'
+    if column_type == 'date':
+        return 'date'
+    return 'text'
+
+
+def _normalize(series: pd.Series, kind: str) -> pd.Series:
+    """Format a column the way migration 0005 does in SQL, with '' for missing values."""
+    if kind == 'number':
+        values = pd.to_numeric(series, errors='coerce').to_numpy(dtype='float64')
+        # Adding 0.0 turns -0.0 into 0.0, which PostgreSQL prints without the sign
+        formatted = np.char.mod('%.2f', np.round(values, 2) + 0.0)
+        return pd.Series(np.where(np.isnan(values), '', formatted), index=series.index)
+    if kind == 'date':
+        return pd.to_datetime(series, errors='coerce').dt.strftime('%Y-%m-%d').fillna('')
+    text = series.astype('string').str.replace(WHITESPACE, ' ', regex=True).str.strip(' ')
+    return text.fillna('').astype(object)
+
+
+def row_fingerprints(records: Union[List[Dict], pd.DataFrame], kinds: Dict[str, str]) -> List[str]:
+    """
+    Compute the fingerprint of each record: the MD5 of its normalized business
+    fields. Fields are normalized column by column with vectorized pandas
+    operations, so the same values always give the same fingerprint whatever
+    their type in the file (e.g. 10, 10.0 and "10.00"); only the hashing is done
+    per row. Must match the fingerprints computed in SQL by migration 0005.
+
+    Args:
+        records: List of dictionaries containing column names and values, or a DataFrame
+        kinds: Fields of the fingerprint, in order, mapped to their kind (see fingerprint_kind)
+
+    Returns:
+        List of 32-character hexadecimal fingerprints, in the order of the records
+    """
+    if not len(records):
+        return []
+
+    if isinstance(records, pd.DataFrame):
+        frame = records.reindex(columns=list(kinds))
+    else:
+        frame = pd.DataFrame.from_records(records, columns=list(kinds))
+    normalized = [_normalize(frame[field], kind) for field, kind in kinds.items()]
+    joined = normalized[0].str.cat(normalized[1:], sep=FIELD_SEPARATOR) if len(normalized) > 1 else normalized[0]
+    return [hashlib.md5(value.encode('utf-8')).hexdigest() for value in joined.tolist()]
@@ -0,0 +1,396 @@
+import json
+import streamlit as st
+from typing import Dict, List, Optional, Any, Type
+import pandas as pd
+from database.connection import get_db_connection
+from utils.base_service import BaseService
+from utils.error_handlers import handle_service_error
+from utils.import_jobs import get_import_jobs
+
+# Labels of the batch statuses shown in the batches panel
+BATCH_STATUS_LABELS = {
+    'running': "🔄 Em curso",
+    'completed': "✅ Concluído",
+    'failed': "❌ Falhou",
+    'rolled_back': "↩️ Anulado",
+}
+
+# Batches that can be resumed from their last committed chunk. A running batch
+# is only resumable when no job is loading it any more (e.g. after a restart)
+RESUMABLE_STATUSES = ('running', 'failed')
+
+
+class ImportBatchService(BaseService):
+    """
+    Service for the import batches: one row per streamed import of a file,
+    holding the checkpoint of the last chunk committed. Every chunk is loaded
+    in the same transaction as its checkpoint, so a failed import can be
+    resumed from the next chunk or rolled back as a whole.
+    """
+    table_name = 'import_batches'
+    primary_key = 'id'
+    default_order_by = 'created_at DESC'
+    columns = (
+        'table_name', 'file_name', 'file_hash', 'column_mapping', 'chunk_size',
+        'status', 'committed_chunks', 'imported_rows', 'last_error',
+        'created_at', 'updated_at',
+    )
+    updated_at_column = 'updated_at'
+
+    @classmethod
+    def start(
+        cls,
+        service_class: Type[BaseService],
+        file_name: str,
+        file_hash: str,
+        column_mapping: Dict[str, str],
+        chunk_size: int
+    ) -> int:
+        """
+        Create a batch for a new import of a file.
+
+        Args:
+            service_class: Service of the table the file is imported into
+            file_name: Name of the uploaded file
+            file_hash: SHA-256 of the file content
+            column_mapping: Dictionary mapping standard fields to file columns
+            chunk_size: Rows per chunk
+
+        Returns:
+            ID of the new batch
+        """
+        return cls.insert({
+            'table_name': service_class.table_name,
+            'file_name': file_name,
+            'file_hash': file_hash,
+            'column_mapping': json.dumps(column_mapping, sort_keys=True),
+            'chunk_size': chunk_size,
+        })
+
+    @classmethod
+    @handle_service_error("Erro ao obter lotes de importação")
+    def find_resumable(
+        cls,
+        service_class: Type[BaseService],
+        file_hash: str,
+        column_mapping: Dict[str, str],
+        chunk_size: int
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Find the latest unfinished batch of the same file, imported with the same
+        column mapping and chunk size, that has committed at least one chunk and
+        is not being loaded by a job.
+
+        Args:
+            service_class: Service of the table the file is imported into
+            file_hash: SHA-256 of the file content
+            column_mapping: Dictionary mapping standard fields to file columns
+            chunk_size: Rows per chunk
+
+        Returns:
+            Dictionary with the batch data, or None if there is nothing to resume
+        """
+        query = """
+            SELECT * FROM import_batches
+            WHERE table_name = %s AND file_hash = %s AND column_mapping = %s::jsonb
+              AND chunk_size = %s AND status = ANY(%s) AND committed_chunks > 0
+              AND NOT (id = ANY(%s))
+            ORDER BY created_at DESC
+            LIMIT 1
+        """
+        params = (
+            service_class.table_name,
+            file_hash,
+            json.dumps(column_mapping, sort_keys=True),
+            chunk_size,
+            list(RESUMABLE_STATUSES),
+            sorted(get_import_jobs().active_batch_ids()),
+        )
+
+        with get_db_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(query, params)
+                result = cur.fetchone()
+                if not result:
+                    return None
+                columns = [desc[0] for desc in cur.description]
+                return dict(zip(columns, result))
+
+    @classmethod
+    @handle_service_error("Erro ao retomar lote de importação")
+    def resume(cls, batch_id: int) -> int:
+        """
+        Mark an unfinished batch as running again.
+
+        Args:
+            batch_id: ID of the batch
+
+        Returns:
+            Number of chunks already committed, to be skipped by the import
+
+        Raises:
+            ValueError: If the batch cannot be resumed or a job is still loading it
+        """
+        if batch_id in get_import_jobs().active_batch_ids():
+            raise ValueError(f"O lote de importação {batch_id} já está a ser importado.")
+
+        query = """
+            UPDATE import_batches
+            SET status = 'running', last_error = NULL, updated_at = CURRENT_TIMESTAMP
+            WHERE id = %s AND status = ANY(%s)
+            RETURNING committed_chunks
+        """
+
+        with get_db_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(query, (batch_id, list(RESUMABLE_STATUSES)))
+                result = cur.fetchone()
+            conn.commit()
+        cls._invalidate_cache()
+
+        if result is None:
+            raise ValueError(f"O lote de importação {batch_id} não pode ser retomado.")
+        return result[0]
+
+    @classmethod
+    @handle_service_error("Erro ao importar registos")
+    def load_chunk(
+        cls,
+        service_class: Type[BaseService],
+        batch_id: int,
+        chunk_number: int,
+        records: List[Dict]
+    ) -> Dict[str, int]:
+        """
+        Load the valid records of a chunk and advance the checkpoint of the batch,
+        in a single transaction: either both happen or neither does.
+
+        Args:
+            service_class: Service of the table the records are imported into
+            batch_id: ID of the batch
+            chunk_number: Number of the chunk in the file (1-based)
+            records: Valid records of the chunk (may be empty)
+
+        Returns:
+            Dictionary with the number of 'inserted', 'updated' and 'unchanged' records
+            (records already imported are unchanged)
+
+        Raises:
+            ValueError: If the batch is not running or the chunk does not follow its checkpoint
+        """
+        with get_db_connection() as conn:
+            with conn.cursor() as cur:
+                # Lock the batch, so concurrent imports of the same batch cannot interleave
+                cur.execute(
+                    "SELECT status, committed_chunks FROM import_batches WHERE id = %s FOR UPDATE",
+                    (batch_id,)
+                )
+                result = cur.fetchone()
+                if result is None:
+                    raise ValueError(f"Lote de importação {batch_id} não encontrado.")
+
+                status, committed_chunks = result
+                if status != 'running':
+                    raise ValueError(f"O lote de importação {batch_id} não está em curso.")
+                if committed_chunks != chunk_number - 1:
+                    raise ValueError(
+                        f"O lote de importação {batch_id} tem {committed_chunks} blocos confirmados "
+                        f"e não pode receber o bloco {chunk_number}."
+                    )
+
+                counts = service_class._load_records(cur, records, batch_id)
+                cur.execute("""
+                    UPDATE import_batches
+                    SET committed_chunks = %s, imported_rows = imported_rows + %s,
+                        updated_at = CURRENT_TIMESTAMP
+                    WHERE id = %s
+                """, (chunk_number, counts['inserted'] + counts['updated'], batch_id))
+            conn.commit()
+        service_class._invalidate_cache()
+        cls._invalidate_cache()
+
+        return counts
+
+    @classmethod
+    @handle_service_error("Erro ao atualizar lote de importação")
+    def finish(cls, batch_id: int, failure: str = None) -> None:
+        """
+        Record the outcome of an import run.
+
+        Args:
+            batch_id: ID of the batch
+            failure: Error that stopped the import (None if it completed)
+        """
+        query = """
+            UPDATE import_batches
+            SET status = %s, last_error = %s, updated_at = CURRENT_TIMESTAMP
+            WHERE id = %s AND status = 'running'
+        """
+
+        with get_db_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(query, ('failed' if failure else 'completed', failure, batch_id))
+            conn.commit()
+        cls._invalidate_cache()
+
+    @classmethod
+    @handle_service_error("Erro ao anular lote de importação")
+    def rollback(cls, service_class: Type[BaseService], batch_id: int) -> int:
+        """
+        Delete every row inserted by a batch, with a single DELETE.
+
+        Args:
+            service_class: Service of the table the batch was imported into
+            batch_id: ID of the batch
+
+        Returns:
+            Number of rows deleted
+
+        Raises:
+            ValueError: If the table does not track import batches or the batch cannot be rolled back
+        """
+        if not service_class.import_batch_column:
+            raise ValueError(
+                f"As importações de {service_class.table_name} não podem ser anuladas: "
+                f"os registos são atualizados pela chave natural."
+            )
+
+        with get_db_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(
+                    "SELECT table_name, status FROM import_batches WHERE id = %s FOR UPDATE",
+                    (batch_id,)
+                )
+                result = cur.fetchone()
+                if result is None or result[0] != service_class.table_name:
+                    raise ValueError(f"Lote de importação {batch_id} não encontrado.")
+                if result[1] == 'rolled_back':
+                    raise ValueError(f"O lote de importação {batch_id} já foi anulado.")
+
+                cur.execute(
+                    f"DELETE FROM {service_class.table_name} WHERE {service_class.import_batch_column} = %s",
+                    (batch_id,)
+                )
+                deleted = cur.rowcount
+                cur.execute("""
+                    UPDATE import_batches
+                    SET status = 'rolled_back', updated_at = CURRENT_TIMESTAMP
+                    WHERE id = %s
+                """, (batch_id,))
+            conn.commit()
+        service_class._invalidate_cache()
+        cls._invalidate_cache()
+
+        return deleted
+
+    @classmethod
+    @handle_service_error("Erro ao obter lotes de importação")
+    def get_recent(cls, service_class: Type[BaseService], limit: int = 10) -> pd.DataFrame:
+        """
+        Get the latest batches imported into a table.
+
+        Args:
+            service_class: Service of the table
+            limit: Maximum number of batches
+
+        Returns:
+            Pandas DataFrame with the batches, newest first
+        """
+        query = """
+            SELECT id, file_name, status, committed_chunks, imported_rows, last_error, created_at
+            FROM import_batches
+            WHERE table_name = %s
+            ORDER BY created_at DESC
+            LIMIT %s
+        """
+        return cls._read_sql(query, (service_class.table_name, limit))
+
+
+def create_batch_uploader(service_class: Type[BaseService], batch_id: int, start_chunk: int = 0):
+    """
+    Creates an upload function that loads each chunk of a streamed import as
+    the next checkpoint of a batch (see ImportBatchService.load_chunk).
+    It must be called for every chunk of the file, including chunks without
+    valid records, so that the chunk numbers match the file.
+
+    Args:
+        service_class: Service of the table the file is imported into
+        batch_id: ID of the batch
+        start_chunk: Number of chunks already committed
+
+    Returns:
+        An uploader function that takes the records of a chunk and returns the
+        counts of ImportBatchService.load_chunk
+    """
+    state = {'chunk': start_chunk}
+
+    def uploader(records: List[Dict]) -> Dict[str, int]:
+        counts = ImportBatchService.load_chunk(service_class, batch_id, state['chunk'] + 1, records)
+        state['chunk'] += 1
+        return counts
+
+    return uploader
+
+
+@st.dialog("Anular Importação")
+def rollback_batch_dialog(service_class: Type[BaseService], batch_id: int, file_name: str) -> None:
+    """
+    Dialog to confirm the rollback of an import batch.
+
+    Args:
+        service_class: Service of the table the batch was imported into
+        batch_id: ID of the batch
+        file_name: Name of the imported file
+    """
+    st.write(f"Tem a certeza que deseja anular a importação #{batch_id} ({file_name})?")
+    st.warning("Todos os registos inseridos por esta importação serão eliminados.")
+
+    col1, col2 = st.columns([1, 1])
+    with col1:
+        if st.button("Cancelar", use_container_width=True):
+            st.rerun()
+    with col2:
+        confirm_button = st.button("Confirmar", type="primary", use_container_width=True)
+
+    if confirm_button:
+        with st.spinner("A anular importação...", show_time=True):
+            deleted = ImportBatchService.rollback(service_class, batch_id)
+        st.success(f"Importação anulada: {deleted} registos eliminados.")
+        st.rerun()
+
+
+def import_batches_panel(service_class: Type[BaseService], limit: int = 10) -> None:
+    """
+    Display the latest import batches of a table, with the option to roll them back.
+
+    Args:
+        service_class: Service of the table
+        limit: Maximum number of batches shown
+    """
+    batches = ImportBatchService.get_recent(service_class, limit)
+    if batches.empty:
+        return
+
+    with st.expander("Histórico de Importações"):
+        for batch in batches.to_dict('records'):
+            col1, col2 = st.columns([4, 1])
+            with col1:
+                st.markdown(
+                    f"**#{batch['id']} {batch['file_name']}** · "
+                    f"{BATCH_STATUS_LABELS.get(batch['status'], batch['status'])}"
+                )
+                st.caption(
+                    f"{batch['imported_rows']} registos importados em {batch['committed_chunks']} blocos · "
+                    f"{batch['created_at']:%Y-%m-%d %H:%M}"
+                )
+                if batch['last_error']:
+                    st.caption(f"Erro: {batch['last_error']}")
+            with col2:
+                if service_class.import_batch_column and batch['status'] != 'rolled_back':
+                    st.button(
+                        "Anular",
+                        key=f"rollback_batch_{batch['id']}",
+                        on_click=rollback_batch_dialog,
+                        args=(service_class, batch['id'], batch['file_name']),
+                        use_container_width=True,
+                    )
@@ -0,0 +1,325 @@
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+import pandas as pd
+import streamlit as st
+from utils.import_resolution import unresolved_report_frame
+from config.imports import IMPORT_CONFIG
+
+_registry = None
+_registry_lock = threading.Lock()
+
+# Labels of the job statuses shown in the status panel
+JOB_STATUS_LABELS = {
+    'queued': "⏳ Em fila",
+    'running': "🔄 Em curso",
+    'completed': "✅ Concluída",
+    'failed': "❌ Falhou",
+}
+
+ACTIVE_STATUSES = ('queued', 'running')
+
+
+class ImportJob:
+    """
+    State of a background import job.
+    The worker thread reports its progress with update, the status panel
+    reads consistent copies of the state with snapshot.
+    """
+
+    def __init__(self, group: str, description: str, batch_id: int = None):
+        """
+        Create a queued job.
+
+        Args:
+            group: Group the job belongs to (e.g. the imported entity)
+            description: Short description of the job (e.g. the file name)
+            batch_id: Import batch loaded by the job (see utils.import_batches)
+        """
+        self._lock = threading.Lock()
+        self._state = {
+            'id': uuid.uuid4().hex[:12],
+            'group': group,
+            'description': description,
+            'batch_id': batch_id,
+            'status': 'queued',
+            'created_at': datetime.now(),
+            'started_at': None,
+            'finished_at': None,
+            'total_rows': 0,
+            'valid_rows': 0,
+            'invalid_rows': 0,
+            'imported_rows': 0,
+            'unchanged_rows': 0,
+            'progress': 0.0,
+            'elapsed': 0.0,
+            'errors': [],
+            'error_report': None,
+            'unresolved': [],
+            'failure': None,
+        }
+
+    @property
+    def id(self) -> str:
+        return self._state['id']
+
+    def update(self, values: Dict[str, Any]) -> None:
+        """
+        Update the job state with the values reported by the worker.
+
+        Args:
+            values: Running counts (see utils.bulk_import.stream_import)
+        """
+        values = {key: value for key, value in values.items() if key in self._state}
+        for key in ('errors', 'unresolved'):
+            if key in values:
+                values[key] = list(values[key])
+        with self._lock:
+            self._state.update(values)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Get a copy of the job state, including its throughput in rows per second.
+
+        Returns:
+            Dictionary with the job state
+        """
+        with self._lock:
+            state = dict(self._state)
+        state['errors'] = list(state['errors'])
+        state['unresolved'] = list(state['unresolved'])
+        state['throughput'] = state['total_rows'] / state['elapsed'] if state['elapsed'] else 0.0
+        return state
+
+
+class ImportJobRegistry:
+    """
+    Process-wide registry of background import jobs run on a pool of worker
+    threads. Jobs keep running when the session that started them reruns or
+    closes, and their state can be read from any session.
+    """
+
+    def __init__(self, max_workers: int, max_finished_jobs: int):
+        """
+        Create the registry and its worker pool.
+
+        Args:
+            max_workers: Number of jobs run at the same time
+            max_finished_jobs: Number of finished jobs kept for the status panel
+        """
+        self.max_finished_jobs = max_finished_jobs
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="import-job")
+        self._jobs = {}
+        self._lock = threading.Lock()
+
+    def submit(
+        self,
+        group: str,
+        description: str,
+        task: Callable[[Callable[[Dict[str, Any]], None]], Dict[str, Any]],
+        cleanup: Optional[Callable[[], None]] = None,
+        batch_id: int = None
+    ) -> str:
+        """
+        Queue a job.
+
+        Args:
+            group: Group the job belongs to (e.g. the imported entity)
+            description: Short description of the job (e.g. the file name)
+            task: Function running the job. It receives a callback to report its
+                running counts and returns the final counts; a 'failure' entry
+                in them marks the job as failed.
+            cleanup: Optional function called when the job ends, successfully or not
+            batch_id: Import batch loaded by the job; a batch is loaded by one job at a time
+
+        Returns:
+            Identifier of the job
+
+        Raises:
+            ValueError: If another job of this process is still loading the batch
+        """
+        job = ImportJob(group, description, batch_id)
+        with self._lock:
+            # Checked under the lock, so two sessions resuming the same batch cannot both start a job
+            if batch_id is not None and batch_id in self._active_batch_ids():
+                raise ValueError(f"O lote de importação {batch_id} já está a ser importado.")
+            self._jobs[job.id] = job
+            self._prune()
+        self._executor.submit(self._run, job, task, cleanup)
+        return job.id
+
+    def _run(self, job: ImportJob, task: Callable, cleanup: Optional[Callable]) -> None:
+        """Run a job on a worker thread, recording its outcome."""
+        job.update({'status': 'running', 'started_at': datetime.now()})
+        start = time.monotonic()
+        try:
+            result = task(job.update) or {}
+            job.update(result)
+            job.update({'status': 'failed' if result.get('failure') else 'completed'})
+        except Exception as e:
+            print(f"Import job {job.id} failed: {str(e)}")
+            job.update({'status': 'failed', 'failure': str(e)})
+        finally:
+            job.update({'finished_at': datetime.now(), 'elapsed': time.monotonic() - start})
+            if cleanup:
+                try:
+                    cleanup()
+                except Exception as e:
+                    print(f"Could not clean up import job {job.id}: {str(e)}")
+
+    def _prune(self) -> None:
+        """
+        Forget the oldest finished jobs over the limit, deleting their error reports.
+        Must be called with the lock held.
+        """
+        finished = [job.snapshot() for job in self._jobs.values()]
+        finished = [job for job in finished if job['status'] not in ACTIVE_STATUSES]
+        for job in finished[:max(0, len(finished) - self.max_finished_jobs)]:
+            del self._jobs[job['id']]
+            if job['error_report'] and os.path.exists(job['error_report']):
+                try:
+                    os.unlink(job['error_report'])
+                except OSError as e:
+                    print(f"Could not delete error report of import job {job['id']}: {str(e)}")
+
+    def _active_batch_ids(self) -> set:
+        """Get the import batches of the queued and running jobs. Must be called with the lock held."""
+        snapshots = [job.snapshot() for job in self._jobs.values()]
+        return {
+            job['batch_id'] for job in snapshots
+            if job['batch_id'] is not None and job['status'] in ACTIVE_STATUSES
+        }
+
+    def active_batch_ids(self) -> set:
+        """
+        Get the import batches being loaded by a queued or running job of this process.
+
+        Returns:
+            Set of batch IDs
+        """
+        with self._lock:
+            return self._active_batch_ids()
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the state of a job.
+
+        Args:
+            job_id: Identifier returned by submit
+
+        Returns:
+            Snapshot of the job state, or None if the job is unknown
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+        return job.snapshot() if job else None
+
+    def list_jobs(self, group: str = None) -> List[Dict[str, Any]]:
+        """
+        Get the state of the known jobs, newest first.
+
+        Args:
+            group: Only return the jobs of this group
+
+        Returns:
+            List of job snapshots
+        """
+        with self._lock:
+            jobs = list(self._jobs.values())
+        snapshots = [job.snapshot() for job in reversed(jobs)]
+        if group is not None:
+            snapshots = [job for job in snapshots if job['group'] == group]
+        return snapshots
+
+
+def get_import_jobs() -> ImportJobRegistry:
+    """
+    Get the process-wide import job registry, creating it on first use.
+
+    Returns:
+        ImportJobRegistry shared by all sessions of this process
+    """
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = ImportJobRegistry(
+                    max_workers=IMPORT_CONFIG['job_workers'],
+                    max_finished_jobs=IMPORT_CONFIG['job_history'],
+                )
+    return _registry
+
+
+def _render_job(job: Dict[str, Any]) -> None:
+    """Display the state of a single job."""
+    with st.container(border=True):
+        st.markdown(f"**{job['description']}** · {JOB_STATUS_LABELS.get(job['status'], job['status'])}")
+
+        if job['status'] in ACTIVE_STATUSES:
+            st.progress(job['progress'])
+
+        st.caption(
+            f"{job['total_rows']} linhas lidas · {job['imported_rows']} importadas · "
+            f"{job['unchanged_rows']} já importadas · "
+            f"{job['invalid_rows']} com erros · {job['throughput']:.0f} linhas/s · "
+            f"iniciada às {job['created_at'].strftime('%H:%M:%S')}"
+        )
+
+        if job['failure']:
+            st.error(f"Erro na importação: {job['failure']}")
+
+        if job['unresolved'] and job['status'] not in ACTIVE_STATUSES:
+            st.caption("Motoristas ou veículos não encontrados")
+            st.dataframe(unresolved_report_frame(job['unresolved']), hide_index=True, use_container_width=True)
+
+        if job['errors'] and job['status'] not in ACTIVE_STATUSES:
+            sample = pd.DataFrame(job['errors']).head(IMPORT_CONFIG['error_sample_rows'])
+            st.caption(f"Erros de validação (primeiros {len(sample)}) · {job['invalid_rows']} linhas com erros")
+            st.dataframe(
+                sample.rename(columns={'row': 'Linha', 'field': 'Campo', 'rule': 'Regra', 'message': 'Mensagem'}),
+                hide_index=True,
+                use_container_width=True,
+            )
+
+        if job['error_report'] and job['status'] not in ACTIVE_STATUSES and os.path.exists(job['error_report']):
+            with open(job['error_report'], 'rb') as report:
+                st.download_button(
+                    "Descarregar relatório de erros (CSV)",
+                    data=report.read(),
+                    file_name=f"erros_{os.path.splitext(job['description'])[0]}.csv",
+                    mime="text/csv",
+                    key=f"import_job_errors_{job['id']}",
+                )
+
+
+def _render_jobs(group: str, polling: bool) -> None:
+    """Display the jobs of a group, rerunning the page once the polled jobs finish."""
+    jobs = get_import_jobs().list_jobs(group)[:IMPORT_CONFIG['jobs_shown']]
+    if not jobs:
+        return
+
+    if polling and not any(job['status'] in ACTIVE_STATUSES for job in jobs):
+        # Rerun the whole page so the listings show the imported data and polling stops
+        st.rerun()
+
+    st.subheader("Importações em Segundo Plano")
+    for job in jobs:
+        _render_job(job)
+
+
+def import_jobs_panel(group: str) -> None:
+    """
+    Display the background import jobs of a group.
+    While any of them is queued or running the panel refreshes itself every
+    IMPORT_JOB_POLL_SECONDS without rerunning the rest of the page.
+
+    Args:
+        group: Group of the jobs to show (e.g. the imported entity)
+    """
+    polling = any(job['status'] in ACTIVE_STATUSES for job in get_import_jobs().list_jobs(group))
+    run_every = IMPORT_CONFIG['job_poll_seconds'] if polling else None
+    st.fragment(_render_jobs, run_every=run_every)(group, polling)
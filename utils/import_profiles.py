@@ -0,0 +1,55 @@
+import json
+from typing import Dict, Type
+from utils.base_service import BaseService
+from utils.error_handlers import handle_service_error
+
+
+class ImportProfileService(BaseService):
+    """
+    Service for the import mapping profiles: named column mappings of the
+    imports of a table, reused for every file with the same layout.
+    """
+    table_name = 'import_mapping_profiles'
+    primary_key = 'id'
+    default_order_by = 'name'
+    columns = ('table_name', 'name', 'column_mapping', 'created_at', 'updated_at')
+    natural_keys = (('table_name', 'name'),)
+    updated_at_column = 'updated_at'
+
+    @classmethod
+    def save(cls, service_class: Type[BaseService], name: str, column_mapping: Dict[str, str]) -> None:
+        """
+        Save a mapping profile, replacing the profile with the same name.
+
+        Args:
+            service_class: Service of the table the profile imports into
+            name: Name of the profile
+            column_mapping: Dictionary mapping standard fields to file columns
+
+        Raises:
+            ValueError: If the name is empty
+        """
+        name = name.strip()
+        if not name:
+            raise ValueError("Indique o nome do perfil de mapeamento.")
+
+        cls.upsert_many([{
+            'table_name': service_class.table_name,
+            'name': name,
+            'column_mapping': json.dumps(column_mapping, sort_keys=True),
+        }])
+
+    @classmethod
+    @handle_service_error("Erro ao obter perfis de mapeamento")
+    def get_profiles(cls, service_class: Type[BaseService]) -> Dict[str, Dict[str, str]]:
+        """
+        Get the mapping profiles of a table.
+
+        Args:
+            service_class: Service of the table
+
+        Returns:
+            Dictionary mapping profile names to column mappings, ordered by name
+        """
+        profiles = cls.get_many({'table_name': service_class.table_name}, columns=['name', 'column_mapping'])
+        return dict(zip(profiles['name'], profiles['column_mapping']))
@@ -0,0 +1,243 @@
+from typing import Any, Dict, List, Optional, Tuple
+import numpy as np
+import pandas as pd
+from database.connection import get_db_connection
+
+
+def normalize_name(keys: pd.Series) -> pd.Series:
+    """
+    Normalize names and NIFs for matching: case-insensitive, without leading,
+    trailing or repeated spaces.
+
+    Args:
+        keys: Series of strings
+
+    Returns:
+        Series of normalized strings
+    """
+    return keys.str.strip().str.replace(r"\s+", " ", regex=True).str.casefold()
+
+
+def normalize_plate(keys: pd.Series) -> pd.Series:
+    """
+    Normalize license plates for matching: upper case, without spaces, dashes or dots
+    (so "aa-00-bb", "AA 00 BB" and "AA00BB" match).
+
+    Args:
+        keys: Series of strings
+
+    Returns:
+        Series of normalized strings
+    """
+    return keys.str.replace(r"[\s\-.]", "", regex=True).str.upper()
+
+
+# Foreign key fields resolved from natural keys in the imported files:
+# field -> (table, query returning (id, key, ...) rows, normalizer, error message)
+RESOLUTION_SOURCES = {
+    'driver_id': (
+        'drivers',
+        "SELECT id, display_name, nif FROM drivers",
+        normalize_name,
+        "Não encontrado (indique o nome ou o NIF do motorista).",
+    ),
+    'car_id': (
+        'cars',
+        "SELECT id, license_plate FROM cars",
+        normalize_plate,
+        "Não encontrado (indique a matrícula do veículo).",
+    ),
+}
+
+
+class ForeignKeyResolver:
+    """
+    Import stage that resolves foreign key columns (drivers and cars) from the
+    names, NIFs and license plates found in the files. Each lookup table is read
+    once per resolver, i.e. once per import, and whole columns are resolved with
+    one hash map lookup. Values that cannot be resolved are counted by value
+    across all the chunks of the import.
+    """
+
+    def __init__(self, max_tracked_values: int = 1000, rows_per_value: int = 5):
+        """
+        Create a resolver with no lookup loaded yet.
+
+        Args:
+            max_tracked_values: Maximum number of distinct unresolved values reported per field
+            rows_per_value: Number of file rows kept per unresolved value
+        """
+        self.max_tracked_values = max_tracked_values
+        self.rows_per_value = rows_per_value
+        # field -> (normalized key -> id, ambiguous keys, known ids)
+        self._lookups = {}
+        # field -> {value: [count, reason, first rows]}
+        self._unresolved = {}
+        # field -> number of unresolved cells whose value was not tracked
+        self._untracked = {}
+
+    def resolves(self, field: str) -> bool:
+        """
+        Check whether a field is resolved by this stage.
+
+        Args:
+            field: Field key
+
+        Returns:
+            True if the field is a foreign key with a resolution source
+        """
+        return field in RESOLUTION_SOURCES
+
+    def _lookup(self, field: str) -> Tuple[Dict[str, int], set, set]:
+        """Load the lookup of a field on first use."""
+        if field not in self._lookups:
+            _, query, normalize, _ = RESOLUTION_SOURCES[field]
+            with get_db_connection() as conn:
+                with conn.cursor() as cur:
+                    cur.execute(query)
+                    rows = cur.fetchall()
+
+            lookup = {}
+            ambiguous = set()
+            ids = set()
+            if rows:
+                frame = pd.DataFrame(rows)
+                ids = set(frame[0].tolist())
+                # Every key column (e.g. name and NIF) maps to the id of its row
+                for position in range(1, frame.shape[1]):
+                    keys = frame[position].dropna()
+                    normalized = normalize(keys.astype(str)).tolist()
+                    for key, record_id in zip(normalized, frame[0][keys.index].tolist()):
+                        if lookup.get(key, record_id) != record_id:
+                            ambiguous.add(key)
+                        lookup[key] = record_id
+
+            for key in ambiguous:
+                del lookup[key]
+            self._lookups[field] = (lookup, ambiguous, ids)
+        return self._lookups[field]
+
+    def resolve(
+        self,
+        field: str,
+        series: pd.Series,
+        row_numbers: pd.Index
+    ) -> Tuple[List[Any], np.ndarray, str]:
+        """
+        Resolve a whole file column to ids. Values are matched against the natural
+        keys of the table after normalization; numeric ids of existing records are
+        accepted as well.
+
+        Args:
+            field: Field key (see RESOLUTION_SOURCES)
+            series: Column of the uploaded file
+            row_numbers: File row number of each cell, for the unresolved report
+
+        Returns:
+            Tuple of (ids with None for missing or unresolved cells, boolean mask of
+            the unresolved cells, error message for those cells)
+        """
+        _, _, normalize, error_message = RESOLUTION_SOURCES[field]
+        lookup, ambiguous, ids = self._lookup(field)
+
+        size = len(series)
+        values = [None] * size
+        failed = np.zeros(size, dtype=bool)
+
+        missing = series.isna().to_numpy()
+        present = np.flatnonzero(~missing)
+        if not present.size:
+            return values, failed, error_message
+
+        # Remove trailing ".0" from numbers read as floats (common Excel artifact)
+        raw = series.iloc[present].astype(str).str.removesuffix('.0')
+        keys = normalize(raw)
+        resolved = keys.map(lookup)
+
+        # Files exported from the application may already contain the ids
+        pending = resolved.isna().to_numpy()
+        if pending.any():
+            as_ids = pd.to_numeric(raw[pending], errors='coerce')
+            resolved[pending] = as_ids.where(as_ids.isin(ids))
+
+        unresolved = resolved.isna().to_numpy()
+        for position, record_id in zip(present[~unresolved], resolved[~unresolved].astype('int64').tolist()):
+            values[position] = record_id
+
+        if unresolved.any():
+            failed[present[unresolved]] = True
+            self._track(
+                field,
+                raw[unresolved].tolist(),
+                keys[unresolved].isin(ambiguous).tolist(),
+                row_numbers[present[unresolved]].tolist(),
+            )
+
+        return values, failed, error_message
+
+    def _track(self, field: str, raw_values: List[str], is_ambiguous: List[bool], rows: List[int]) -> None:
+        """Count the unresolved values of a column, grouped by value."""
+        tracked = self._unresolved.setdefault(field, {})
+        for value, ambiguous, row in zip(raw_values, is_ambiguous, rows):
+            entry = tracked.get(value)
+            if entry is None:
+                if len(tracked) >= self.max_tracked_values:
+                    self._untracked[field] = self._untracked.get(field, 0) + 1
+                    continue
+                entry = tracked[value] = [0, "Ambíguo" if ambiguous else "Não encontrado", []]
+            entry[0] += 1
+            if len(entry[2]) < self.rows_per_value:
+                entry[2].append(int(row))
+
+    def unresolved_report(self, labels: Optional[Dict[str, str]] = None) -> List[Dict[str, Any]]:
+        """
+        Get the unresolved values of the import, grouped by value, most frequent first.
+
+        Args:
+            labels: Display names of the fields (defaults to the field keys)
+
+        Returns:
+            List of dictionaries with 'field', 'value', 'reason', 'count' and 'rows'
+            (first file rows where the value appears)
+        """
+        labels = labels or {}
+        report = []
+        for field, tracked in self._unresolved.items():
+            label = labels.get(field, field)
+            for value, (count, reason, rows) in tracked.items():
+                report.append({'field': label, 'value': value, 'reason': reason, 'count': count, 'rows': rows})
+            if self._untracked.get(field):
+                report.append({
+                    'field': label,
+                    'value': "(outros valores)",
+                    'reason': "Não encontrado",
+                    'count': self._untracked[field],
+                    'rows': [],
+                })
+        report.sort(key=lambda item: item['count'], reverse=True)
+        return report
+
+
+def unresolved_report_frame(report: List[Dict[str, Any]]) -> pd.DataFrame:
+    """
+    Format an unresolved values report for display.
+
+    Args:
+        report: Report returned by ForeignKeyResolver.unresolved_report
+
+    Returns:
+        DataFrame with one row per unresolved value
+    """
+    return pd.DataFrame(
+        [
+            {
+                'Campo': item['field'],
+                'Valor': item['value'],
+                'Motivo': item['reason'],
+                'Ocorrências': item['count'],
+                'Linhas': ', '.join(str(row) for row in item['rows']),
+            }
+            for item in report
+        ],
+        columns=['Campo', 'Valor', 'Motivo', 'Ocorrências', 'Linhas'],
+    )
@@ -0,0 +1,100 @@
+import streamlit as st
+from typing import Dict, Any, Type
+
+
+def _next_page(state_key: str, next_cursor: str) -> None:
+    """Move to the next page, remembering the cursor that starts it."""
+    state = st.session_state[state_key]
+    state['cursors'] = state['cursors'][:state['page'] + 1] + [next_cursor]
+    state['page'] += 1
+
+
+def _previous_page(state_key: str) -> None:
+    """Move back to the previous page."""
+    state = st.session_state[state_key]
+    state['page'] = max(0, state['page'] - 1)
+
+
+def paginate(
+    key: str,
+    service_class: Type,
+    filters: Dict = None,
+    order_by: str = None,
+    page_size: int = 50,
+    with_total: bool = True
+) -> Dict[str, Any]:
+    """
+    Load the current page of a listing using the keyset pagination of the service.
+    The cursors of the visited pages are kept in session state, so only the
+    current page is read from the database on every rerun. Changing the filters
+    or the ordering goes back to the first page.
+
+    Args:
+        key: Unique key for the listing in session state
+        service_class: Service class providing get_page
+        filters: Filter specification (see utils.query_filters)
+        order_by: Order by expression (defaults to the service ordering)
+        page_size: Number of rows per page
+        with_total: Whether to include an approximate total row count
+
+    Returns:
+        Dictionary with 'data', 'next_cursor', 'approx_total' and 'page_number' (1-based)
+    """
+    state_key = f"{key}_pagination"
+    signature = repr((sorted((filters or {}).items()), order_by, page_size))
+
+    state = st.session_state.get(state_key)
+    if state is None or state['signature'] != signature:
+        state = {'signature': signature, 'cursors': [None], 'page': 0}
+        st.session_state[state_key] = state
+
+    page = service_class.get_page(
+        filters=filters,
+        order_by=order_by,
+        after_key=state['cursors'][state['page']],
+        limit=page_size,
+        with_total=with_total,
+    )
+
+    # The current page may have become empty (e.g. after deleting its rows)
+    if page['data'].empty and state['page'] > 0:
+        _previous_page(state_key)
+        return paginate(key, service_class, filters, order_by, page_size, with_total)
+
+    page['page_number'] = state['page'] + 1
+    return page
+
+
+def pagination_controls(key: str, page: Dict[str, Any]) -> None:
+    """
+    Display the previous/next page buttons for a listing loaded with paginate.
+
+    Args:
+        key: Key used when calling paginate
+        page: Page returned by paginate
+    """
+    state_key = f"{key}_pagination"
+    col1, col2, col3 = st.columns([1, 2, 1])
+
+    with col1:
+        st.button(
+            "⬅️ Anterior",
+            key=f"{key}_previous_page",
+            on_click=_previous_page,
+            args=(state_key,),
+            disabled=page['page_number'] <= 1,
+            use_container_width=True,
+        )
+
+    with col2:
+        st.caption(f"Página {page['page_number']}")
+
+    with col3:
+        st.button(
+            "Seguinte ➡️",
+            key=f"{key}_next_page",
+            on_click=_next_page,
+            args=(state_key, page['next_cursor']),
+            disabled=page['next_cursor'] is None,
+            use_container_width=True,
+        )
@@ -0,0 +1,201 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional
+import pandas as pd
+from config.database import QUERY_CACHE_CONFIG
+
+_cache = None
+_cache_lock = threading.Lock()
+
+# Functions called with the names of the modified tables on every invalidation
+_invalidation_listeners = []
+
+
+def _estimate_size(value: Any) -> int:
+    """Estimate the memory used by a cached value, in bytes."""
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(index=True, deep=True).sum())
+    return 1024
+
+
+class QueryCache:
+    """
+    Thread-safe LRU cache of query results with a time-to-live and a memory cap.
+    Each entry is tagged with the tables it reads, so that a write to a table
+    invalidates every cached result that depends on it.
+    """
+
+    def __init__(self, ttl: float, max_bytes: int):
+        """
+        Create an empty cache.
+
+        Args:
+            ttl: Seconds an entry stays valid
+            max_bytes: Maximum estimated memory used by the entries
+        """
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        # key -> (value, size, expires_at, tags), least recently used first
+        self._entries = OrderedDict()
+        self._keys_by_tag = {}
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+        # Statistics
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    def _remove(self, key: Hashable) -> None:
+        """Remove an entry. Must be called with the lock held."""
+        value, size, expires_at, tags = self._entries.pop(key)
+        self._bytes -= size
+        for tag in tags:
+            keys = self._keys_by_tag.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._keys_by_tag[tag]
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Get a cached value.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            The cached value, or None if missing or expired
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[2] < time.monotonic():
+                if entry is not None:
+                    self._remove(key)
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[0]
+
+    def set(self, key: Hashable, value: Any, tags: Iterable[str]) -> None:
+        """
+        Store a value, evicting the least recently used entries if over the memory cap.
+
+        Args:
+            key: Cache key
+            value: Value to store
+            tags: Tables the value depends on
+        """
+        size = _estimate_size(value)
+        if size > self.max_bytes:
+            return
+
+        tags = frozenset(tags)
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (value, size, time.monotonic() + self.ttl, tags)
+            self._bytes += size
+            for tag in tags:
+                self._keys_by_tag.setdefault(tag, set()).add(key)
+
+            while self._bytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self._evictions += 1
+
+    def invalidate(self, tags: Iterable[str]) -> int:
+        """
+        Remove every entry tagged with any of the given tags.
+
+        Args:
+            tags: Tables that were modified
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            keys = set()
+            for tag in tags:
+                keys.update(self._keys_by_tag.get(tag, ()))
+            for key in keys:
+                self._remove(key)
+            self._invalidations += len(keys)
+            return len(keys)
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock:
+            self._entries.clear()
+            self._keys_by_tag.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get a snapshot of the cache usage statistics.
+
+        Returns:
+            Dictionary with entry counts, memory usage and hit/miss counters
+        """
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self._hits,
+                'misses': self._misses,
+                'hit_rate': round(self._hits / lookups, 4) if lookups else 0.0,
+                'evictions': self._evictions,
+                'invalidations': self._invalidations,
+            }
+
+
+def get_query_cache() -> Optional[QueryCache]:
+    """
+    Get the process-wide query cache, creating it on first use.
+
+    Returns:
+        QueryCache shared by all sessions of this process, or None if caching is disabled
+    """
+    global _cache
+    if not QUERY_CACHE_CONFIG['enabled']:
+        return None
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = QueryCache(
+                    ttl=QUERY_CACHE_CONFIG['ttl'],
+                    max_bytes=int(QUERY_CACHE_CONFIG['max_memory_mb'] * 1024 * 1024),
+                )
+    return _cache
+
+
+def add_invalidation_listener(listener: Callable[[List[str]], None]) -> None:
+    """
+    Register a function to be called whenever tables are modified through the services,
+    so that other caches built from those tables can be dropped.
+
+    Args:
+        listener: Function receiving the list of modified tables
+    """
+    if listener not in _invalidation_listeners:
+        _invalidation_listeners.append(listener)
+
+
+def invalidate_tables(tables: Iterable[str]) -> None:
+    """
+    Drop the cached results that read any of the given tables.
+
+    Args:
+        tables: Names of the modified tables
+    """
+    tables = list(tables)
+    cache = get_query_cache()
+    if cache is not None:
+        cache.invalidate(tables)
+    for listener in _invalidation_listeners:
+        listener(tables)
@@ -0,0 +1,127 @@
+from typing import Any, Callable, Dict, List, Tuple
+
+# Supported filter operators and their SQL templates ({col} is the resolved column)
+COMPARISON_OPERATORS = {
+    'eq': "{col} = %s",
+    'ne': "{col} <> %s",
+    'gt': "{col} > %s",
+    'gte': "{col} >= %s",
+    'lt': "{col} < %s",
+    'lte': "{col} <= %s",
+}
+
+
+def escape_like(value: Any) -> str:
+    """
+    Escape the LIKE wildcards of a value so it is matched literally.
+
+    Args:
+        value: The value to escape
+
+    Returns:
+        Escaped string
+    """
+    return str(value).replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _compile_operator(col: str, operator: str, value: Any) -> Tuple[str, List[Any]]:
+    """
+    Compile a single operator applied to a column.
+
+    Args:
+        col: Resolved SQL column expression
+        operator: Operator name
+        value: Operator argument
+
+    Returns:
+        Tuple of (sql, params)
+    """
+    if operator in COMPARISON_OPERATORS:
+        if value is None:
+            raise ValueError(f"O operador '{operator}' não aceita valores nulos. Use 'is_null'.")
+        return COMPARISON_OPERATORS[operator].format(col=col), [value]
+
+    if operator == 'between':
+        low, high = value
+        return f"{col} BETWEEN %s AND %s", [low, high]
+
+    if operator in ('in', 'not_in'):
+        values = list(value)
+        if not values:
+            # An empty IN list matches nothing (and NOT IN matches everything)
+            return ("FALSE" if operator == 'in' else "TRUE"), []
+        sql = f"{col} = ANY(%s)" if operator == 'in' else f"NOT ({col} = ANY(%s))"
+        return sql, [values]
+
+    if operator == 'contains':
+        return f"{col} ILIKE %s", [f"%{escape_like(value)}%"]
+
+    if operator == 'startswith':
+        return f"{col} ILIKE %s", [f"{escape_like(value)}%"]
+
+    if operator == 'is_null':
+        return (f"{col} IS NULL" if value else f"{col} IS NOT NULL"), []
+
+    raise ValueError(f"Operador de filtro desconhecido: {operator}")
+
+
+def build_where_clause(
+    conditions: Dict[str, Any],
+    resolve_column: Callable[[str], str]
+) -> Tuple[str, List[Any]]:
+    """
+    Compile a filter specification into a parameterized SQL condition.
+
+    Each key is a column name and each value is either a plain value (equality,
+    or IS NULL for None) or a dictionary of operators combined with AND:
+
+        {
+            'is_active': True,
+            'display_name': {'contains': 'silva'},
+            'start_date': {'between': ('2024-01-01', '2024-12-31')},
+            'platform': {'in': ['Uber', 'Bolt']},
+            'end_date': {'lte': '2024-12-31', 'or_null': True},
+            'notes': {'is_null': False},
+        }
+
+    Supported operators: eq, ne, gt, gte, lt, lte, between, in, not_in,
+    contains, startswith (both case-insensitive) and is_null. The or_null
+    modifier also accepts rows where the column is NULL.
+
+    Args:
+        conditions: Filter specification
+        resolve_column: Function mapping a column name to its SQL expression.
+            Must raise ValueError for columns that are not allowed.
+
+    Returns:
+        Tuple of (sql, params); sql is empty when there are no conditions
+    """
+    clauses = []
+    params = []
+
+    for name, spec in (conditions or {}).items():
+        col = resolve_column(name)
+
+        if not isinstance(spec, dict):
+            spec = {'is_null': True} if spec is None else {'eq': spec}
+
+        spec = dict(spec)
+        or_null = spec.pop('or_null', False)
+
+        column_clauses = []
+        for operator, value in spec.items():
+            sql, values = _compile_operator(col, operator, value)
+            column_clauses.append(sql)
+            params.extend(values)
+
+        if not column_clauses:
+            continue
+
+        clause = " AND ".join(column_clauses)
+        if or_null:
+            clause = f"({col} IS NULL OR ({clause}))"
+        elif len(column_clauses) > 1:
+            clause = f"({clause})"
+        clauses.append(clause)
+
+    return " AND ".join(clauses), params
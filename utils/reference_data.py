@@ -0,0 +1,92 @@
+import threading
+import time
+from types import MappingProxyType
+from typing import List, Mapping, Optional
+from config.database import QUERY_CACHE_CONFIG
+from database.connection import get_db_connection
+from utils.query_cache import add_invalidation_listener
+
+# Reference lists shared by all sessions: name -> (table, query returning (id, label) rows)
+REFERENCE_QUERIES = {
+    'active_drivers': ('drivers', "SELECT id, display_name FROM drivers WHERE is_active ORDER BY display_name"),
+    'active_cars': ('cars', "SELECT id, license_plate FROM cars WHERE is_active ORDER BY license_plate"),
+}
+
+# name -> (read-only id -> label map, loaded_at)
+_registry = {}
+_registry_lock = threading.Lock()
+# Incremented on every invalidation, so a load that raced with a write is not kept
+_generation = 0
+
+
+def _invalidate(tables: List[str]) -> None:
+    """Drop the reference lists built from any of the modified tables."""
+    global _generation
+    with _registry_lock:
+        _generation += 1
+        for name, (table, _) in REFERENCE_QUERIES.items():
+            if table in tables:
+                _registry.pop(name, None)
+
+
+add_invalidation_listener(_invalidate)
+
+
+def get_reference_options(name: str) -> Mapping[int, str]:
+    """
+    Get a shared id -> label map, loading it from the database only when it is
+    missing, older than the cache TTL or invalidated by a write to its table.
+
+    Args:
+        name: Name of the reference list (see REFERENCE_QUERIES)
+
+    Returns:
+        Read-only mapping of ids to labels, in display order
+    """
+    table, query = REFERENCE_QUERIES[name]
+
+    with _registry_lock:
+        entry = _registry.get(name)
+        generation = _generation
+    if entry is not None and time.monotonic() - entry[1] < QUERY_CACHE_CONFIG['ttl']:
+        return entry[0]
+
+    with get_db_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(query)
+            options = MappingProxyType(dict(cur.fetchall()))
+
+    with _registry_lock:
+        if generation == _generation:
+            _registry[name] = (options, time.monotonic())
+    return options
+
+
+def get_driver_options() -> Mapping[int, str]:
+    """
+    Get the active drivers for selection fields.
+
+    Returns:
+        Read-only mapping of driver ids to display names, ordered by name
+    """
+    return get_reference_options('active_drivers')
+
+
+def get_car_options() -> Mapping[int, str]:
+    """
+    Get the active cars for selection fields.
+
+    Returns:
+        Read-only mapping of car ids to license plates, ordered by plate
+    """
+    return get_reference_options('active_cars')
+
+
+def invalidate_reference_data(tables: Optional[List[str]] = None) -> None:
+    """
+    Drop the shared reference lists so they are reloaded on next use.
+
+    Args:
+        tables: Only drop the lists built from these tables (defaults to all)
+    """
+    _invalidate(tables if tables is not None else [table for table, _ in REFERENCE_QUERIES.values()])
@@ -1,11 +1,18 @@
 from typing import Dict, List, Tuple, Callable, Any, Optional, Union
 from datetime import date, datetime
 import re
+import numpy as np
+import pandas as pd
 
 # Type definitions for better code clarity
 ValidationResult = Tuple[bool, str]  # (is_valid, error_message)
 Validator = Callable[[Any, str], ValidationResult]  # Function that validates a value
 FieldValidator = Tuple[str, List[Validator]]  # (field_name, list_of_validators)
+# Column-wise form of a validator, attached to it as its 'invalid_mask' attribute:
+# takes a column of values and returns the boolean mask of the invalid ones, which
+# all get the message the validator returns for them. Used by bulk imports to
+# check a whole column at once (see utils.bulk_import.process_frame)
+InvalidMask = Callable[[pd.Series], np.ndarray]
 
 
 def validate_required(value: Any) -> ValidationResult:
@@ -23,6 +30,15 @@ def validate_required(value: Any) -> ValidationResult:
     return True, ""
 
 
+def _required_mask(values: pd.Series) -> np.ndarray:
+    """Column-wise validate_required: missing or blank values."""
+    blank = values.astype('string').str.strip().eq("").fillna(False)
+    return (values.isna() | blank).to_numpy(dtype=bool)
+
+
+validate_required.invalid_mask = _required_mask
+
+
 def validate_min_length(min_length: int) -> Validator:
     """
     Creates a validator that checks minimum string length.
@@ -37,6 +53,9 @@ def validate_min_length(min_length: int) -> Validator:
         if value is not None and len(str(value)) < min_length:
             return False, f"Deve ter pelo menos {min_length} caracteres."
         return True, ""
+    validator.invalid_mask = lambda values: (
+        values.astype('string').str.len().lt(min_length).fillna(False).to_numpy(dtype=bool)
+    )
     return validator
 
 
@@ -54,6 +73,9 @@ def validate_max_length(max_length: int) -> Validator:
         if value is not None and len(str(value)) > max_length:
             return False, f"Não pode ter mais de {max_length} caracteres."
         return True, ""
+    validator.invalid_mask = lambda values: (
+        values.astype('string').str.len().gt(max_length).fillna(False).to_numpy(dtype=bool)
+    )
     return validator
 
 
@@ -75,6 +97,15 @@ def validate_numeric(value: Any) -> ValidationResult:
     return True, ""
 
 
+def _numeric_mask(values: pd.Series) -> np.ndarray:
+    """Column-wise validate_numeric: present values that are not numbers."""
+    numbers = pd.to_numeric(values, errors='coerce')
+    return (values.notna() & numbers.isna()).to_numpy(dtype=bool)
+
+
+validate_numeric.invalid_mask = _numeric_mask
+
+
 def validate_min_value(min_value: Union[int, float]) -> Validator:
     """
     Creates a validator that checks minimum numeric value.
@@ -93,6 +124,9 @@ def validate_min_value(min_value: Union[int, float]) -> Validator:
             except (ValueError, TypeError):
                 pass  # Let validate_numeric handle type errors
         return True, ""
+    validator.invalid_mask = lambda values: (
+        pd.to_numeric(values, errors='coerce').lt(min_value).to_numpy(dtype=bool)
+    )
     return validator
 
 
@@ -114,6 +148,9 @@ def validate_min_value(min_value: Union[int, float]) -> Validator:
             except (ValueError, TypeError):
                 pass  # Let validate_numeric handle type errors
         return True, ""
+    validator.invalid_mask = lambda values: (
+        pd.to_numeric(values, errors='coerce').lt(min_value).to_numpy(dtype=bool)
+    )
     return validator
 
 
@@ -135,6 +172,9 @@ def validate_max_value(max_value: Union[int, float]) -> Validator:
             except (ValueError, TypeError):
                 pass  # Let validate_numeric handle type errors
         return True, ""
+    validator.invalid_mask = lambda values: (
+        pd.to_numeric(values, errors='coerce').gt(max_value).to_numpy(dtype=bool)
+    )
     return validator
 
 
@@ -170,10 +210,16 @@ def validate_regex(pattern: str, message: str) -> Validator:
     Returns:
         Validator function
     """
+    # Compiled once, not on every call
+    match = re.compile(pattern).match
+
     def validator(value: str) -> ValidationResult:
-        if value is not None and not re.match(pattern, str(value)):
+        if value is not None and not match(str(value)):
             return False, message
         return True, ""
+    validator.invalid_mask = lambda values: (
+        (values.notna() & ~values.astype('string').str.match(pattern).fillna(False)).to_numpy(dtype=bool)
+    )
     return validator
 
 
@@ -189,19 +235,38 @@ def validate_options(valid_values: List[Any], allow_default: bool = False, defau
     Returns:
         A validator function
     """
+    # Frozen once for constant-time lookups (falls back to the original
+    # container if some values are not hashable)
+    try:
+        lookup = frozenset(valid_values)
+    except TypeError:
+        lookup = valid_values
+    error_message = f"Must be one of: {', '.join(map(str, valid_values))}"
+
     def validator(value: Any, field_name: str = "") -> Tuple[bool, str]:
         # Check if value is the allowed default
         if allow_default and value == default_value:
             return True, ""
             
         # Check if value is in valid values
-        if value in valid_values:
-            return True, ""
+        try:
+            if value in lookup:
+                return True, ""
+        except TypeError:
+            # Unhashable value: compare one by one
+            if value in valid_values:
+                return True, ""
         
-        # Value is invalid - create readable error message
-        values_str = ", ".join(map(str, valid_values))
-        return False, f"Must be one of: {values_str}"
-    
+        # Value is invalid
+        return False, error_message
+
+    def invalid_mask(values: pd.Series) -> np.ndarray:
+        invalid = ~values.isin(lookup)
+        if allow_default:
+            invalid &= ~(values.isna() if default_value is None else values.eq(default_value))
+        return invalid.to_numpy(dtype=bool)
+
+    validator.invalid_mask = invalid_mask
     return validator
 
 